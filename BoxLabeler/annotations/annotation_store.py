@@ -0,0 +1,107 @@
+import queue
+import threading
+from collections.abc import MutableMapping
+
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+
+
+class AnnotationStore(MutableMapping):
+    """
+    Thread-safe mapping of image path -> ImageAnnotation.
+
+    Mapping operations hold a re-entrant lock and iteration walks a copy of the
+    keys, so other threads can read while the UI thread edits. The UI thread is
+    the only writer: background workers hand finished annotations to `post`, and
+    the UI thread applies them with `drain`, which lets it decide per image
+    whether a result may replace what the operator is working on.
+    """
+
+    def __init__(self, annotations=None):
+        self._data = dict(annotations or {})
+        self._lock = threading.RLock()
+        self._pending = queue.SimpleQueue()
+
+    # ==================== Mapping ==================== #
+    def __getitem__(self, image_path):
+        with self._lock:
+            return self._data[image_path]
+
+    def __setitem__(self, image_path, annotation):
+        with self._lock:
+            self._data[image_path] = annotation
+
+    def __delitem__(self, image_path):
+        with self._lock:
+            del self._data[image_path]
+
+    def __contains__(self, image_path):
+        with self._lock:
+            return image_path in self._data
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._data))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def get(self, image_path, default=None):
+        with self._lock:
+            return self._data.get(image_path, default)
+
+    def setdefault(self, image_path, default=None):
+        with self._lock:
+            return self._data.setdefault(image_path, default)
+
+    def pop(self, image_path, *default):
+        with self._lock:
+            return self._data.pop(image_path, *default)
+
+    def items(self):
+        with self._lock:
+            return list(self._data.items())
+
+    def values(self):
+        with self._lock:
+            return list(self._data.values())
+
+    def replace(self, annotations):
+        """Swap in a whole new set of annotations (e.g. after loading a file)."""
+        with self._lock:
+            self._data = dict(annotations)
+
+    def snapshot(self, image_paths=None):
+        """
+        Deep copy of the annotations, safe to use from another thread while editing goes on.
+
+        Args:
+            image_paths (Iterable[str], optional): Only copy these images (those without
+                annotations are left out). Defaults to all images.
+        """
+        with self._lock:
+            if image_paths is None:
+                items = list(self._data.items())
+            else:
+                items = [(path, self._data[path]) for path in image_paths if path in self._data]
+            snapshot = {}
+            for image_path, annotation in items:
+                copy = ImageAnnotation(annotation.image_path)
+                copy.add_bboxes([bbox.copy() for bbox in annotation.bboxes])
+                snapshot[image_path] = copy
+        return snapshot
+
+    # ==================== Single-writer queue ==================== #
+    def post(self, image_path, annotation):
+        """Queue an annotation produced on a worker thread; it is applied by the next `drain`."""
+        self._pending.put((image_path, annotation))
+
+    def drain(self, max_items=None):
+        """Take queued (image_path, annotation) updates without applying them. Call from the UI thread."""
+        updates = []
+        while max_items is None or len(updates) < max_items:
+            try:
+                updates.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        return updates
@@ -1,7 +1,12 @@
 class BoundingBox:
-    def __init__(self, x, y, w, h, category_id):
+    def __init__(self, x, y, w, h, category_id, confidence=None, track_id=None):
         self.x = x  # Top-left x coordinate (relative to original image)
         self.y = y  # Top-left y coordinate (relative to original image)
         self.w = w  # Width of the bounding box
         self.h = h  # Height of the bounding box
         self.category_id = category_id  # Label of the bounding box
+        self.confidence = confidence  # Model confidence; None for hand-drawn or reviewed boxes
+        self.track_id = track_id  # Identity of the object across sequential frames, if propagated
+
+    def copy(self):
+        return BoundingBox(self.x, self.y, self.w, self.h, self.category_id, self.confidence, self.track_id)
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+import time
+
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+
+CHECKPOINT_FILENAME = ".boxlabeler_autopredict.jsonl"
+
+
+class PredictionCheckpoint:
+    """
+    Append-only JSON Lines log of finished auto-predict images.
+
+    The first line is a header identifying the model; each following line holds
+    the predicted boxes of one image. Lines are buffered and flushed every
+    `flush_every` images or `flush_interval` seconds, so a cancelled or crashed
+    run can resume from the last flush. A truncated last line is ignored.
+
+    Periodic flushes are written (and fsync'd) by a background thread, so
+    `record` never blocks on the disk nor raises. If writing fails, e.g. in a
+    read-only dataset directory, checkpointing is turned off for the rest of
+    the run and the error is kept in `error`.
+    """
+
+    def __init__(self, path, model_key, flush_every=50, flush_interval=10.0):
+        self.path = path
+        self.model_key = model_key
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._writer = None  # Thread appending the last handed-over batch
+        self.error = None  # OSError that turned checkpointing off
+
+    @classmethod
+    def for_directory(cls, directory, model_key, **kwargs):
+        return cls(os.path.join(directory, CHECKPOINT_FILENAME), model_key, **kwargs)
+
+    def exists(self):
+        return os.path.isfile(self.path)
+
+    def load(self):
+        """
+        Return {image_path: ImageAnnotation} for every image recorded in the checkpoint.
+
+        Returns None if there is no checkpoint or it was written by another model.
+        """
+        done = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                header = json.loads(f.readline() or '{}')
+                if header.get('model') != self.model_key:
+                    return None
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Partially written line from an interrupted flush
+                    annotation = ImageAnnotation(record['path'])
+                    annotation.add_bboxes([BoundingBox(*box) for box in record['boxes']])
+                    done[record['path']] = annotation
+        except (OSError, json.JSONDecodeError):
+            return None
+        return done
+
+    def record(self, image_path, bboxes):
+        if self.error is not None:
+            return
+        self._pending.append(json.dumps({
+            'path': image_path,
+            'boxes': [[b.x, b.y, b.w, b.h, b.category_id, b.confidence] for b in bboxes],
+        }))
+        if len(self._pending) >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_interval:
+            if self._writer is not None and self._writer.is_alive():
+                return  # Handed over with the next record once the current write is done
+            lines, self._pending = self._pending, []
+            self._last_flush = time.monotonic()
+            self._writer = threading.Thread(target=self._append_in_background, args=(lines,), daemon=True)
+            self._writer.start()
+
+    def _append_in_background(self, lines):
+        try:
+            self._append(lines)
+        except OSError as e:
+            self.error = e
+
+    def flush(self):
+        """Write everything recorded so far and wait until it is on disk. Raises OSError."""
+        if self._writer is not None:
+            self._writer.join()
+        if self.error is not None:
+            raise self.error
+        lines, self._pending = self._pending, []
+        self._last_flush = time.monotonic()
+        try:
+            self._append(lines)
+        except OSError as e:
+            self.error = e
+            raise
+
+    def _append(self, lines):
+        if not lines and self.exists():
+            return
+        new_file = not self.exists()
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write(json.dumps({'version': 1, 'model': self.model_key}) + '\n')
+            elif not self._ends_with_newline():
+                f.write('\n')  # Terminate a line cut short by an interrupted run
+            if lines:
+                f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def remove(self):
+        if self._writer is not None:
+            self._writer.join()
+        self._pending.clear()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.error = e  # A stale checkpoint that cannot be replaced: do not append to it
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class ImageAnnotation:
     def __init__(self, image_path):
         self.image_path = image_path
@@ -6,6 +9,14 @@ class ImageAnnotation:
     def add_bbox(self, bbox):
         self.bboxes.append(bbox)
 
+    def add_bboxes(self, bboxes):
+        self.bboxes.extend(bboxes)
+
     def remove_bbox(self, index):
         if 0 <= index < len(self.bboxes):
             del self.bboxes[index]
+
+    def to_arrays(self):
+        """Return the boxes as an (N, 4) float64 [x, y, w, h] array and the list of their labels."""
+        boxes = np.array([(b.x, b.y, b.w, b.h) for b in self.bboxes], dtype=np.float64).reshape(-1, 4)
+        return boxes, [b.category_id for b in self.bboxes]
@@ -0,0 +1,51 @@
+import numpy as np
+
+from BoxLabeler.models.postprocess import box_iou
+from BoxLabeler.utils.box_ops import xywh_to_xyxy
+
+
+def unmatched_predictions(existing_boxes, predicted_boxes, predicted_scores=None, iou_threshold=0.5,
+                          min_confidence=0.0):
+    """
+    Mask of the predicted boxes that overlap none of the existing boxes.
+
+    Matching is class-agnostic: an existing box covers a prediction of any label.
+
+    Args:
+        existing_boxes (numpy.ndarray): (M, 4) [x, y, w, h] boxes already on the image.
+        predicted_boxes (numpy.ndarray): (N, 4) [x, y, w, h] predicted boxes.
+        predicted_scores (numpy.ndarray): (N,) confidences; predictions below `min_confidence` are dropped.
+
+    Returns:
+        numpy.ndarray: (N,) bool mask of the predictions to add.
+    """
+    predicted_boxes = np.asarray(predicted_boxes, dtype=np.float64).reshape(-1, 4)
+    keep = np.ones(len(predicted_boxes), dtype=bool)
+    if predicted_scores is not None:
+        keep &= np.asarray(predicted_scores, dtype=np.float64) >= min_confidence
+    existing_boxes = np.asarray(existing_boxes, dtype=np.float64).reshape(-1, 4)
+    if len(existing_boxes) and keep.any():
+        iou = box_iou(xywh_to_xyxy(predicted_boxes), xywh_to_xyxy(existing_boxes))
+        keep &= ~(iou >= iou_threshold).any(axis=1)
+    return keep
+
+
+def merge_predictions(annotation, predicted_bboxes, iou_threshold=0.5, min_confidence=0.0):
+    """
+    Add to `annotation`, in place, the predicted boxes that do not overlap its existing boxes.
+
+    Existing boxes, hand-drawn or not, are never changed. Predictions without a
+    confidence are treated as certain.
+
+    Returns:
+        int: Number of boxes added.
+    """
+    if not predicted_bboxes:
+        return 0
+    existing, _ = annotation.to_arrays()
+    predicted = np.array([(b.x, b.y, b.w, b.h) for b in predicted_bboxes], dtype=np.float64)
+    scores = np.array([1.0 if b.confidence is None else b.confidence for b in predicted_bboxes])
+    keep = unmatched_predictions(existing, predicted, scores, iou_threshold, min_confidence)
+    added = [bbox for bbox, k in zip(predicted_bboxes, keep.tolist()) if k]
+    annotation.add_bboxes(added)
+    return len(added)
@@ -0,0 +1,172 @@
+import itertools
+
+import numpy as np
+
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+from BoxLabeler.models.postprocess import box_iou
+from BoxLabeler.utils.box_ops import xywh_to_xyxy
+
+# Confidence given to a box carried forward without any detection supporting it:
+# no evidence either way, which puts it at the top of the uncertainty review queue
+UNSUPPORTED_CONFIDENCE = 0.5
+
+
+def _greedy_assignment(iou, iou_threshold):
+    """Highest-IoU-first one-to-one matching, used when SciPy is not installed."""
+    rows, cols = np.nonzero(iou >= iou_threshold)
+    order = np.argsort(-iou[rows, cols], kind='stable')
+    used_rows = np.zeros(iou.shape[0], dtype=bool)
+    used_cols = np.zeros(iou.shape[1], dtype=bool)
+    matched_rows, matched_cols = [], []
+    for r, c in zip(rows[order].tolist(), cols[order].tolist()):
+        if not used_rows[r] and not used_cols[c]:
+            used_rows[r] = used_cols[c] = True
+            matched_rows.append(r)
+            matched_cols.append(c)
+    return np.array(matched_rows, dtype=np.int64), np.array(matched_cols, dtype=np.int64)
+
+
+def match_boxes(boxes1, boxes2, iou_threshold=0.3):
+    """
+    Match two sets of [x, y, w, h] boxes one-to-one by IoU.
+
+    The assignment maximizes the total IoU (Hungarian algorithm) when SciPy is
+    available and falls back to greedy highest-IoU-first matching otherwise.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Indices into `boxes1` and
+        `boxes2` of the matched pairs and their IoU, all pairs having IoU >= `iou_threshold`.
+    """
+    boxes1 = np.asarray(boxes1, dtype=np.float64).reshape(-1, 4)
+    boxes2 = np.asarray(boxes2, dtype=np.float64).reshape(-1, 4)
+    if not len(boxes1) or not len(boxes2):
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float32)
+
+    iou = box_iou(xywh_to_xyxy(boxes1), xywh_to_xyxy(boxes2))
+    try:
+        from scipy.optimize import linear_sum_assignment
+    except ImportError:
+        rows, cols = _greedy_assignment(iou, iou_threshold)
+    else:
+        rows, cols = linear_sum_assignment(iou, maximize=True)
+    ious = iou[rows, cols]
+    keep = ious >= iou_threshold
+    return rows[keep], cols[keep], ious[keep]
+
+
+def next_track_id(annotations):
+    track_ids = [b.track_id for ann in annotations.values() for b in ann.bboxes if b.track_id is not None]
+    return max(track_ids) + 1 if track_ids else 0
+
+
+class PropagationReport:
+    def __init__(self):
+        self.images = []  # Images that received propagated boxes
+        self.review_images = []  # Those of them with boxes left for manual review
+        self.accepted = 0
+        self.review = 0
+
+    def summary(self):
+        if not self.images:
+            return "No boxes were propagated."
+        return (
+            f"Propagated to {len(self.images)} image(s): {self.accepted} box(es) accepted, "
+            f"{self.review} left for review in {len(self.review_images)} image(s)."
+        )
+
+
+def propagate_forward(annotations, image_paths, start_index, window=10, predict=None,
+                      iou_threshold=0.3, min_confidence=0.5, first_track_id=None):
+    """
+    Carry the boxes of image_paths[start_index] forward over the next `window` images.
+
+    Boxes are matched between consecutive images by IoU, keeping their label and
+    track id. With `predict` (image path -> Detections), each next image is
+    predicted and matched detections take the place of the boxes they continue:
+    those with a score of at least `min_confidence` are accepted (confidence None),
+    the others keep their score. Unmatched detections start new tracks and boxes
+    without a matching detection are carried unchanged; both are left for review
+    with a confidence, so the Uncertain filter lists them. Without `predict` every
+    carried box is left for review.
+
+    Images that already have boxes are not changed: their boxes only inherit the
+    track ids of the boxes they match, and propagation continues from them.
+
+    New track ids count up from `first_track_id`, by default the next id unused
+    in `annotations`; pass it when `annotations` only holds some of the images.
+
+    Returns:
+        PropagationReport
+    """
+    report = PropagationReport()
+    source = annotations.get(image_paths[start_index])
+    if source is None or not source.bboxes:
+        return report
+
+    if first_track_id is None:
+        first_track_id = next_track_id(annotations)
+    track_ids = itertools.count(first_track_id)
+    previous = source.bboxes
+    for bbox in previous:
+        if bbox.track_id is None:
+            bbox.track_id = next(track_ids)
+
+    for image_path in image_paths[start_index + 1:start_index + 1 + window]:
+        previous_boxes = np.array([(b.x, b.y, b.w, b.h) for b in previous], dtype=np.float64).reshape(-1, 4)
+
+        existing = annotations.get(image_path)
+        if existing is not None and existing.bboxes:
+            boxes, _ = existing.to_arrays()
+            rows, cols, _ = match_boxes(previous_boxes, boxes, iou_threshold)
+            for r, c in zip(rows.tolist(), cols.tolist()):
+                if existing.bboxes[c].track_id is None:
+                    existing.bboxes[c].track_id = previous[r].track_id
+            for bbox in existing.bboxes:
+                if bbox.track_id is None:
+                    bbox.track_id = next(track_ids)
+            previous = existing.bboxes
+            continue
+
+        bboxes = []
+        carried = np.ones(len(previous), dtype=bool)
+        if predict is not None:
+            try:
+                detections = predict(image_path)
+            except ValueError as e:
+                print(f"Warning: propagation stopped at {image_path}\n{e}")
+                break
+            rows, cols, _ = match_boxes(previous_boxes, detections.boxes, iou_threshold)
+            carried[rows] = False
+            new = np.ones(len(detections), dtype=bool)
+            new[cols] = False
+
+            boxes = detections.boxes.tolist()
+            scores = detections.scores.tolist()
+            labels = detections.labels()
+            for r, c in zip(rows.tolist(), cols.tolist()):
+                confidence = None if scores[c] >= min_confidence else scores[c]
+                bboxes.append(BoundingBox(*boxes[c], previous[r].category_id, confidence, previous[r].track_id))
+            for c in np.flatnonzero(new).tolist():
+                bboxes.append(BoundingBox(*boxes[c], labels[c], scores[c], next(track_ids)))
+
+        for r in np.flatnonzero(carried).tolist():
+            b = previous[r]
+            bboxes.append(BoundingBox(b.x, b.y, b.w, b.h, b.category_id, UNSUPPORTED_CONFIDENCE, b.track_id))
+
+        if not bboxes:
+            break
+        annotation = ImageAnnotation(image_path)
+        annotation.add_bboxes(bboxes)
+        annotations[image_path] = annotation
+
+        review = sum(b.confidence is not None for b in bboxes)
+        report.images.append(image_path)
+        report.accepted += len(bboxes) - review
+        report.review += review
+        if review:
+            report.review_images.append(image_path)
+        previous = bboxes
+
+    return report
@@ -0,0 +1,70 @@
+import numpy as np
+
+UNCERTAINTY_METHODS = ("entropy", "margin", "near_threshold")
+
+
+def flatten_confidences(annotations, image_paths):
+    """
+    Gather the confidences of all unreviewed predicted boxes of `image_paths`.
+
+    Hand-drawn and reviewed boxes (confidence None) are left out.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: (N,) float64 confidences and the (N,) index of their image.
+    """
+    counts = np.zeros(len(image_paths), dtype=np.int64)
+    confidences = []
+    for i, image_path in enumerate(image_paths):
+        annotation = annotations.get(image_path)
+        if annotation is None:
+            continue
+        scores = [b.confidence for b in annotation.bboxes if b.confidence is not None]
+        counts[i] = len(scores)
+        confidences.extend(scores)
+    return np.asarray(confidences, dtype=np.float64), np.repeat(np.arange(len(image_paths)), counts)
+
+
+def uncertainty_scores(annotations, image_paths, method="entropy", conf_threshold=0.5, band=0.15):
+    """
+    Score how unsure the model was about each image, over all predicted boxes at once.
+
+    Args:
+        method (str): "entropy" sums the binary entropy (bits) of every box confidence;
+            "margin" is 1 minus the smallest distance of a confidence to `conf_threshold`;
+            "near_threshold" counts boxes with a confidence within `band` of `conf_threshold`.
+        conf_threshold (float): Confidence threshold the predictions were made with.
+
+    Returns:
+        numpy.ndarray: (len(image_paths),) scores, higher is less certain. NaN for images
+        without unreviewed predictions.
+    """
+    if method not in UNCERTAINTY_METHODS:
+        raise ValueError(f"Unknown uncertainty method: {method}")
+
+    confidences, image_index = flatten_confidences(annotations, image_paths)
+    num_images = len(image_paths)
+    counts = np.bincount(image_index, minlength=num_images)
+
+    if method == "entropy":
+        p = np.clip(confidences, 1e-6, 1 - 1e-6)
+        per_box = -(p * np.log2(p) + (1 - p) * np.log2(1 - p))
+        scores = np.bincount(image_index, weights=per_box, minlength=num_images)
+    elif method == "margin":
+        scores = np.full(num_images, np.inf)
+        np.minimum.at(scores, image_index, np.abs(confidences - conf_threshold))
+        scores = 1.0 - scores
+    else:
+        near = np.abs(confidences - conf_threshold) <= band
+        scores = np.bincount(image_index, weights=near, minlength=num_images)
+
+    scores = scores.astype(np.float64)
+    scores[counts == 0] = np.nan
+    return scores
+
+
+def rank_by_uncertainty(annotations, image_paths, **kwargs):
+    """Images with unreviewed predictions, least certain first (ties keep their original order)."""
+    scores = uncertainty_scores(annotations, image_paths, **kwargs)
+    candidates = np.flatnonzero(~np.isnan(scores))
+    order = candidates[np.argsort(-scores[candidates], kind='stable')]
+    return [image_paths[i] for i in order.tolist()]
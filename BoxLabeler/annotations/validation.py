@@ -0,0 +1,218 @@
+import numpy as np
+
+from BoxLabeler.utils.box_ops import clip_xyxy, xywh_to_xyxy, xyxy_to_xywh
+from BoxLabeler.utils.image_size import get_image_size
+
+ISSUE_TYPES = ["non_finite", "out_of_bounds", "degenerate", "duplicate"]
+
+# Upper bound on the number of candidate duplicate pairs compared at once
+_MAX_PAIRS_PER_CHUNK = 4_000_000
+
+
+class FlatAnnotations:
+    """
+    All boxes of a dataset as flat arrays, so checks run once over every box instead of per image.
+
+    Attributes:
+        image_paths (List[str]): Annotated images, in iteration order.
+        image_sizes (numpy.ndarray): (I, 2) [width, height]; NaN when the image cannot be read.
+        offsets (numpy.ndarray): (I + 1,) boxes of image i are rows offsets[i]:offsets[i + 1].
+        image_index (numpy.ndarray): (N,) index into image_paths of every box.
+        box_index (numpy.ndarray): (N,) index of every box within its image's bbox list.
+        boxes (numpy.ndarray): (N, 4) float64 [x, y, w, h].
+        label_ids (numpy.ndarray): (N,) integer code of every box's label.
+    """
+
+    def __init__(self, annotations):
+        self.image_paths = list(annotations)
+        bbox_lists = [annotations[path].bboxes for path in self.image_paths]
+        counts = np.fromiter((len(b) for b in bbox_lists), dtype=np.int64, count=len(bbox_lists))
+        total = int(counts.sum())
+
+        self.bboxes = [bbox for bboxes in bbox_lists for bbox in bboxes]
+        self.offsets = np.r_[0, np.cumsum(counts)]
+        self.image_index = np.repeat(np.arange(len(self.image_paths)), counts)
+        self.box_index = np.arange(total) - np.repeat(self.offsets[:-1], counts)
+
+        coords = np.fromiter(
+            (v for b in self.bboxes for v in (b.x, b.y, b.w, b.h)), dtype=np.float64, count=4 * total
+        )
+        self.boxes = coords.reshape(total, 4)
+        labels = {}
+        self.label_ids = np.fromiter(
+            (labels.setdefault(b.category_id, len(labels)) for b in self.bboxes), dtype=np.int64, count=total
+        )
+
+        self.image_sizes = np.full((len(self.image_paths), 2), np.nan)
+        for i, path in enumerate(self.image_paths):
+            try:
+                self.image_sizes[i] = get_image_size(path)
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self.bboxes)
+
+
+class ValidationReport:
+    """
+    Boolean issue masks over the boxes of a FlatAnnotations.
+
+    A box can carry several issues. `unreadable_images` lists annotated images
+    whose size could not be determined; their boxes are not bounds-checked.
+    """
+
+    def __init__(self, flat, issues):
+        self.flat = flat
+        self.issues = issues
+        self.unreadable_images = [
+            flat.image_paths[i] for i in np.flatnonzero(np.isnan(flat.image_sizes[:, 0]))
+        ]
+
+    def counts(self):
+        return {name: int(mask.sum()) for name, mask in self.issues.items()}
+
+    @property
+    def ok(self):
+        return not self.unreadable_images and not any(mask.any() for mask in self.issues.values())
+
+    def problems(self, name):
+        """Return [(image_path, box_index), ...] of the boxes with the given issue."""
+        rows = np.flatnonzero(self.issues[name])
+        return [(self.flat.image_paths[self.flat.image_index[r]], int(self.flat.box_index[r])) for r in rows]
+
+    def summary(self):
+        lines = [f"{len(self.flat)} boxes in {len(self.flat.image_paths)} images checked."]
+        lines += [f"{name.replace('_', ' ').capitalize()}: {n}" for name, n in self.counts().items() if n]
+        if self.unreadable_images:
+            lines.append(f"Unreadable images: {len(self.unreadable_images)}")
+        if self.ok:
+            lines.append("No issues found.")
+        return "\n".join(lines)
+
+
+def pairwise_iou(boxes1, boxes2):
+    """Row-wise IoU between two (N, 4) arrays of [x, y, w, h] boxes."""
+    x1 = np.maximum(boxes1[:, 0], boxes2[:, 0])
+    y1 = np.maximum(boxes1[:, 1], boxes2[:, 1])
+    x2 = np.minimum(boxes1[:, 0] + boxes1[:, 2], boxes2[:, 0] + boxes2[:, 2])
+    y2 = np.minimum(boxes1[:, 1] + boxes1[:, 3], boxes2[:, 1] + boxes2[:, 3])
+    inter = (x2 - x1).clip(0) * (y2 - y1).clip(0)
+    union = boxes1[:, 2].clip(0) * boxes1[:, 3].clip(0) + boxes2[:, 2].clip(0) * boxes2[:, 3].clip(0) - inter
+    return inter / np.maximum(union, np.finfo(np.float64).eps)
+
+
+def find_duplicates(image_index, label_ids, boxes, iou_threshold, candidates=None):
+    """
+    Flag every box overlapping an earlier box of the same image and label by more than `iou_threshold`.
+
+    Boxes are grouped by (image, label) and sorted by left edge with one sort, so
+    the only possible partners of a box are the following boxes of its group
+    starting left of its right edge (sweep and prune). Those pairs are then
+    compared as flat arrays, in chunks bounding memory use.
+
+    Returns:
+        numpy.ndarray: (N,) boolean duplicate mask; the first box of each duplicate set is kept.
+    """
+    n = len(boxes)
+    duplicate = np.zeros(n, dtype=bool)
+    rows = np.arange(n) if candidates is None else np.flatnonzero(candidates)
+    if len(rows) < 2:
+        return duplicate
+
+    group = image_index[rows] * (int(label_ids.max()) + 1) + label_ids[rows]
+    order = rows[np.lexsort((boxes[rows, 0], group))]
+    # Groups are laid end to end on one axis so a single searchsorted finds every box's last partner
+    group_rank = np.unique(group, return_inverse=True)[1].astype(np.float64)
+    rank_of = np.empty(n)
+    rank_of[rows] = group_rank
+    origin = boxes[rows, 0].min()
+    span = (boxes[rows, 0] + boxes[rows, 2]).max() - origin + 1
+    key = rank_of[order] * span + (boxes[order, 0] - origin)
+    key_end = rank_of[order] * span + (boxes[order, 0] + boxes[order, 2] - origin)
+    positions = np.arange(len(order))
+    partners = np.maximum(np.searchsorted(key, key_end, side='left') - positions - 1, 0)
+
+    cumulative = np.cumsum(partners)
+    begin = 0
+    while begin < len(order):
+        done = cumulative[begin - 1] if begin else 0
+        stop = max(int(np.searchsorted(cumulative, done + _MAX_PAIRS_PER_CHUNK, side='right')), begin + 1)
+        counts = partners[begin:stop]
+        first = np.repeat(positions[begin:stop], counts)
+        second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(counts) - counts, counts)
+        if len(first):
+            a, b = order[first], order[second]
+            overlapping = pairwise_iou(boxes[a], boxes[b]) > iou_threshold
+            duplicate[np.maximum(a, b)[overlapping]] = True
+        begin = stop
+    return duplicate
+
+
+def validate_annotations(annotations, iou_threshold=0.9, min_size=1.0, flat=None):
+    """
+    Check every box of `annotations` ({image_path: ImageAnnotation}) for common errors.
+
+    Issues:
+        non_finite: NaN or infinite coordinates.
+        out_of_bounds: Box extends past the image (image sizes come from the header cache).
+        degenerate: Width or height below `min_size` pixels.
+        duplicate: Same label and IoU above `iou_threshold` with an earlier box of the image.
+
+    Returns:
+        ValidationReport: Issue masks over the flattened boxes.
+    """
+    if flat is None:
+        flat = FlatAnnotations(annotations)
+    boxes = flat.boxes
+    finite = np.isfinite(boxes).all(axis=1)
+
+    sizes = flat.image_sizes[flat.image_index]
+    with np.errstate(invalid='ignore'):
+        out_of_bounds = finite & (
+            (boxes[:, 0] < 0) | (boxes[:, 1] < 0)
+            | (boxes[:, 0] + boxes[:, 2] > sizes[:, 0]) | (boxes[:, 1] + boxes[:, 3] > sizes[:, 1])
+        )
+        degenerate = finite & ((boxes[:, 2] < min_size) | (boxes[:, 3] < min_size))
+
+    issues = {
+        "non_finite": ~finite,
+        "out_of_bounds": out_of_bounds,
+        "degenerate": degenerate,
+        "duplicate": find_duplicates(
+            flat.image_index, flat.label_ids, boxes, iou_threshold, candidates=finite & ~degenerate
+        ),
+    }
+    return ValidationReport(flat, issues)
+
+
+def fix_annotations(annotations, iou_threshold=0.9, min_size=1.0):
+    """
+    Repair `annotations` in place: drop non-finite boxes, clip boxes to the image,
+    then drop boxes that are degenerate after clipping and duplicates.
+
+    Returns:
+        ValidationReport: The issues found before fixing.
+    """
+    flat = FlatAnnotations(annotations)
+    report = validate_annotations(annotations, iou_threshold, min_size, flat=flat)
+
+    boxes = flat.boxes.copy()
+    finite = ~report.issues["non_finite"]
+    sizes = flat.image_sizes[flat.image_index]
+    known = finite & ~np.isnan(sizes[:, 0])
+
+    boxes[known] = xyxy_to_xywh(clip_xyxy(xywh_to_xyxy(boxes[known]), sizes[known, 0], sizes[known, 1]))
+
+    keep = finite & (boxes[:, 2] >= min_size) & (boxes[:, 3] >= min_size)
+    keep &= ~find_duplicates(flat.image_index, flat.label_ids, boxes, iou_threshold, candidates=keep)
+
+    for row in np.flatnonzero(report.issues["out_of_bounds"] & keep):
+        bbox = flat.bboxes[row]
+        bbox.x, bbox.y, bbox.w, bbox.h = (float(v) for v in boxes[row])
+
+    for i in np.unique(flat.image_index[~keep]):
+        annotation = annotations[flat.image_paths[i]]
+        kept = keep[flat.offsets[i]:flat.offsets[i + 1]]
+        annotation.bboxes = [bbox for bbox, k in zip(annotation.bboxes, kept) if k]
+    return report
@@ -1,10 +1,19 @@
+import importlib
+
 from .base import Exporter
-from .coco_exporter import COCOExporter
-from .yolov8_exporter import YOLOv8Exporter
-from .pascal_voc_exporter import PascalVOCExporter
-from .excel_exporter import ExcelExporter
-from .tfrecord_exporter import TFRecordExporter
-from .dataset_coco_exporter import DatasetCocoExporter
+
+# Exporters are imported on first use: some of them pull in heavy libraries
+# (tensorflow for TFRecord, pandas for Excel) that must not slow down startup.
+_EXPORTERS = {
+    "coco": ("coco_exporter", "COCOExporter"),
+    "dataset_coco": ("dataset_coco_exporter", "DatasetCocoExporter"),
+    "yolov8": ("yolov8_exporter", "YOLOv8Exporter"),
+    "pascal_voc": ("pascal_voc_exporter", "PascalVOCExporter"),
+    "excel": ("excel_exporter", "ExcelExporter"),
+    "tfrecord": ("tfrecord_exporter", "TFRecordExporter"),
+    "webdataset": ("webdataset_exporter", "WebDatasetExporter"),
+    "binary": ("binary_exporter", "BinaryExporter"),
+}
 
 __all__ = [
     'Exporter',
@@ -14,21 +23,22 @@ __all__ = [
     'ExcelExporter',
     'TFRecordExporter',
     'DatasetCocoExporter',
+    'WebDatasetExporter',
+    'BinaryExporter',
     'get_exporter'
 ]
 
+def _load_exporter_class(module_name, class_name):
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, class_name)
+
+def __getattr__(name):
+    for module_name, class_name in _EXPORTERS.values():
+        if class_name == name:
+            return _load_exporter_class(module_name, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_exporter(format_):
-    if format_ == "coco":
-        return COCOExporter()
-    elif format_ == "dataset_coco":
-        return DatasetCocoExporter()
-    elif format_ == "yolov8":
-        return YOLOv8Exporter()
-    elif format_ == "pascal_voc":
-        return PascalVOCExporter()
-    elif format_ == "excel":
-        return ExcelExporter()
-    elif format_ == "tfrecord":
-        return TFRecordExporter()
-    else:
-        raise ValueError(f"Unknown format: {format_}")
\ No newline at end of file
+    if format_ not in _EXPORTERS:
+        raise ValueError(f"Unknown format: {format_}")
+    return _load_exporter_class(*_EXPORTERS[format_])()
@@ -1,6 +1,14 @@
 from abc import ABC, abstractmethod
 
+from BoxLabeler.instrumentation import timed
+
 class Exporter(ABC):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Time every concrete export under "export.<ClassName>"
+        if 'export' in cls.__dict__:
+            cls.export = timed(f"export.{cls.__name__}")(cls.__dict__['export'])
+
     @abstractmethod
     def export(self, annotations, output_path, *args, **kwargs):
         """
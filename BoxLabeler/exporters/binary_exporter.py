@@ -0,0 +1,136 @@
+"""
+Compact binary annotation format for training-side loading.
+
+One little-endian file holding flat arrays, each section aligned to 64 bytes so
+it can be viewed straight out of a memory map:
+
+    header          magic, counts and the byte offset of every section
+    offsets         int64 (num_images + 1,)   boxes of image i are rows offsets[i]:offsets[i + 1]
+    boxes           float32 (num_boxes, 4)    [x, y, width, height] in pixels
+    classes         int32 (num_boxes,)        index into the category table
+    image_sizes     int32 (num_images, 2)     (width, height)
+    path table      int64 (num_images + 1,) offsets into a UTF-8 blob of image keys
+    category table  int64 (num_categories + 1,) offsets into a UTF-8 blob of labels
+
+`BinaryAnnotations` reads the file with `np.memmap`; opening it only parses the
+header, so loading time does not depend on the dataset size.
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.image_size import get_image_size
+
+MAGIC = b"BXLANN01"
+ALIGNMENT = 64
+SECTIONS = (
+    "offsets", "boxes", "classes", "image_sizes",
+    "path_offsets", "path_blob", "category_offsets", "category_blob",
+)
+_HEADER = struct.Struct("<8s3Q" + "Q" * len(SECTIONS))
+
+
+def _string_table(strings):
+    encoded = [s.encode('utf8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+class BinaryExporter(Exporter):
+    def export(self, annotations, output_path):
+        image_keys, sizes, box_arrays, label_lists = [], [], [], []
+        for image_path, annotation in annotations.items():
+            try:
+                img_width, img_height = get_image_size(image_path)
+            except Exception as e:
+                print(f"Error opening image file: {image_path}\n{e}")
+                continue
+            boxes, labels = annotation.to_arrays()
+            image_keys.append(image_path)
+            sizes.append((img_width, img_height))
+            box_arrays.append(boxes)
+            label_lists.append(labels)
+
+        categories = sorted({label for labels in label_lists for label in labels})
+        category_to_id = {cat: i for i, cat in enumerate(categories)}
+
+        counts = np.array([len(boxes) for boxes in box_arrays], dtype=np.int64)
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        boxes = np.concatenate(box_arrays).astype(np.float32) if box_arrays else np.empty((0, 4), np.float32)
+        classes = np.fromiter(
+            (category_to_id[label] for labels in label_lists for label in labels),
+            dtype=np.int32, count=int(offsets[-1]),
+        )
+        image_sizes = np.array(sizes, dtype=np.int32).reshape(-1, 2)
+        path_offsets, path_blob = _string_table(image_keys)
+        category_offsets, category_blob = _string_table(categories)
+
+        arrays = (offsets, boxes, classes, image_sizes, path_offsets, path_blob, category_offsets, category_blob)
+        positions = []
+        position = _HEADER.size
+        for array in arrays:
+            position = -(-position // ALIGNMENT) * ALIGNMENT
+            positions.append(position)
+            position += array.nbytes
+
+        tmp_path = output_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_HEADER.pack(MAGIC, len(image_keys), len(boxes), len(categories), *positions))
+            for array, position in zip(arrays, positions):
+                f.write(b"\0" * (position - f.tell()))
+                f.write(np.ascontiguousarray(array).tobytes())
+        os.replace(tmp_path, output_path)
+
+
+class BinaryAnnotations:
+    """
+    Memory-mapped reader for files written by BinaryExporter.
+
+    `annotations[i]` returns the (boxes, classes) of image i as zero-copy views
+    into the map; nothing is read from disk until the arrays are used.
+    """
+
+    def __init__(self, path):
+        self._map = np.memmap(path, dtype=np.uint8, mode='r')
+        magic, num_images, num_boxes, num_categories, *positions = _HEADER.unpack(
+            self._map[:_HEADER.size].tobytes()
+        )
+        if magic != MAGIC:
+            raise ValueError(f"Not a BoxLabeler binary annotation file: {path}")
+        sections = dict(zip(SECTIONS, positions))
+
+        self.offsets = self._view(sections["offsets"], np.int64, num_images + 1)
+        self.boxes = self._view(sections["boxes"], np.float32, num_boxes * 4).reshape(num_boxes, 4)
+        self.classes = self._view(sections["classes"], np.int32, num_boxes)
+        self.image_sizes = self._view(sections["image_sizes"], np.int32, num_images * 2).reshape(num_images, 2)
+        self._path_offsets = self._view(sections["path_offsets"], np.int64, num_images + 1)
+        self._path_blob = sections["path_blob"]
+        category_offsets = self._view(sections["category_offsets"], np.int64, num_categories + 1)
+        category_blob = sections["category_blob"]
+        self.categories = [
+            self._map[category_blob + start:category_blob + end].tobytes().decode('utf8')
+            for start, end in zip(category_offsets[:-1].tolist(), category_offsets[1:].tolist())
+        ]
+
+    def _view(self, position, dtype, count):
+        return self._map[position:position + count * np.dtype(dtype).itemsize].view(dtype)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return self.boxes[start:end], self.classes[start:end]
+
+    def image_path(self, index):
+        if index < 0:
+            index += len(self)
+        start, end = self._path_offsets[index], self._path_offsets[index + 1]
+        return self._map[self._path_blob + start:self._path_blob + end].tobytes().decode('utf8')
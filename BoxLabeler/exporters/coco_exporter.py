@@ -1,8 +1,8 @@
-import os
 import json
-from PIL import Image
 from BoxLabeler.annotations.image_annotation import ImageAnnotation
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.image_size import get_image_size
 
 class COCOExporter(Exporter):
     def export(self, annotations, output_path):
@@ -16,13 +16,12 @@ class COCOExporter(Exporter):
         annotation_id = 0
 
         for image_path, annotation in annotations.items():
-            if not os.path.isfile(image_path):
+            if not sources.exists(image_path):
                 print(f"Warning: Image file not found: {image_path}")
                 continue
 
             try:
-                with Image.open(image_path) as img:
-                    width, height = img.size
+                width, height = get_image_size(image_path)
             except Exception as e:
                 print(f"Error opening image file: {image_path}\n{e}")
                 continue
@@ -32,28 +31,34 @@ class COCOExporter(Exporter):
                 "id": image_id,
                 "width": width,
                 "height": height,
-                "file_name": os.path.basename(image_path)
+                "file_name": sources.basename(image_path)
             })
             
-            for bbox in annotation.bboxes:
-                if bbox.category_id not in category_dict:
-                    category_dict[bbox.category_id] = len(category_dict) + 1
+            boxes, labels = annotation.to_arrays()
+            areas = (boxes[:, 2] * boxes[:, 3]).tolist()
+            for label, box, area, bbox in zip(labels, boxes.tolist(), areas, annotation.bboxes):
+                if label not in category_dict:
+                    category_dict[label] = len(category_dict) + 1
                     coco_format["categories"].append({
-                        "id": category_dict[bbox.category_id],
-                        "name": bbox.category_id,
+                        "id": category_dict[label],
+                        "name": label,
                         "supercategory": "none"
                     })
 
-                area = bbox.w * bbox.h
-                coco_format["annotations"].append({
+                coco_annotation = {
                     "id": annotation_id,
                     "image_id": image_id,
-                    "category_id": category_dict[bbox.category_id],
+                    "category_id": category_dict[label],
                     "segmentation": [],
                     "area": area,
-                    "bbox": [bbox.x, bbox.y, bbox.w, bbox.h],
+                    "bbox": box,
                     "iscrowd": 0
-                })
+                }
+                if bbox.confidence is not None:
+                    coco_annotation["score"] = bbox.confidence  # Unreviewed prediction
+                if bbox.track_id is not None:
+                    coco_annotation["track_id"] = bbox.track_id
+                coco_format["annotations"].append(coco_annotation)
                 annotation_id += 1
         
         with open(output_path, 'w') as f:
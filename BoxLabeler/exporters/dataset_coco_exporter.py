@@ -1,8 +1,8 @@
 import os
 import json
-import shutil
-from PIL import Image
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.image_size import get_image_size
 
 class DatasetCocoExporter(Exporter):
     def export(self, annotations, output_dir):
@@ -31,13 +31,12 @@ class DatasetCocoExporter(Exporter):
         image_id = 0
 
         for image_path, annotation in annotations.items():
-            if not os.path.isfile(image_path):
+            if not sources.exists(image_path):
                 print(f"Warning: Image file not found: {image_path}")
                 continue
 
             try:
-                with Image.open(image_path) as img:
-                    width, height = img.size
+                width, height = get_image_size(image_path)
             except Exception as e:
                 print(f"Error opening image file: {image_path}\n{e}")
                 continue
@@ -51,35 +50,36 @@ class DatasetCocoExporter(Exporter):
                 coco_format = coco_format_train
 
             # Copy image to the appropriate directory
-            shutil.copy(image_path, images_dir)
+            sources.copy_to(image_path, images_dir)
 
             image_info = {
                 "id": image_id,
                 "width": width,
                 "height": height,
-                "file_name": os.path.basename(image_path)
+                "file_name": sources.basename(image_path)
             }
             coco_format["images"].append(image_info)
 
-            for bbox in annotation.bboxes:
-                if bbox.category_id not in category_dict:
-                    category_dict[bbox.category_id] = len(category_dict) + 1
+            boxes, labels = annotation.to_arrays()
+            areas = (boxes[:, 2] * boxes[:, 3]).tolist()
+            for label, box, area in zip(labels, boxes.tolist(), areas):
+                if label not in category_dict:
+                    category_dict[label] = len(category_dict) + 1
                     category_info = {
-                        "id": category_dict[bbox.category_id],
-                        "name": bbox.category_id,
+                        "id": category_dict[label],
+                        "name": label,
                         "supercategory": "none"
                     }
                     coco_format_train["categories"].append(category_info)
                     coco_format_val["categories"].append(category_info)
 
-                area = bbox.w * bbox.h
                 annotation_info = {
                     "id": annotation_id,
                     "image_id": image_id,
-                    "category_id": category_dict[bbox.category_id],
+                    "category_id": category_dict[label],
                     "segmentation": [],
                     "area": area,
-                    "bbox": [bbox.x, bbox.y, bbox.w, bbox.h],
+                    "bbox": box,
                     "iscrowd": 0
                 }
                 coco_format["annotations"].append(annotation_info)
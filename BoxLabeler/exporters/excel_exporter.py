@@ -1,20 +1,21 @@
-import os
+import numpy as np
 import pandas as pd
-from PIL import Image
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.box_ops import xywh_to_xyxy
+from BoxLabeler.utils.image_size import get_image_size
 
 class ExcelExporter(Exporter):
     def __init__(self):
         self.column_names = ['filename', 'width', 'height', 'class', 'xmin', 'ymin', 'xmax', 'ymax']
 
     def export(self, annotations, output_path):
-        data = []
+        filenames, sizes, classes, boxes = [], [], [], []
         for image_path, annotation in annotations.items():
-            filename = os.path.basename(image_path)
+            filename = sources.basename(image_path)
             
             try:
-                with Image.open(image_path) as img:
-                    img_width, img_height = img.size
+                img_width, img_height = get_image_size(image_path)
             except FileNotFoundError:
                 print(f"Warning: Image file not found: {image_path}")
                 continue
@@ -22,12 +23,20 @@ class ExcelExporter(Exporter):
                 print(f"Warning: Unable to open image file: {image_path}")
                 continue
             
-            for bbox in annotation.bboxes:
-                xmin, ymin = bbox.x, bbox.y
-                xmax, ymax = bbox.x + bbox.w, bbox.y + bbox.h
-                class_name = bbox.category_id
-                
-                data.append([filename, img_width, img_height, class_name, xmin, ymin, xmax, ymax])
+            image_boxes, labels = annotation.to_arrays()
+            filenames.extend([filename] * len(labels))
+            sizes.append(np.tile([img_width, img_height], (len(labels), 1)))
+            classes.extend(labels)
+            boxes.append(image_boxes)
         
-        df = pd.DataFrame(data, columns=self.column_names)
+        # Build the table column by column from whole-dataset arrays
+        sizes = np.concatenate(sizes) if sizes else np.empty((0, 2), dtype=np.int64)
+        corners = xywh_to_xyxy(np.concatenate(boxes)) if boxes else np.empty((0, 4))
+        df = pd.DataFrame({
+            'filename': filenames,
+            'width': sizes[:, 0],
+            'height': sizes[:, 1],
+            'class': classes,
+            **{name: corners[:, i] for i, name in enumerate(self.column_names[4:])},
+        }, columns=self.column_names)
         df.to_excel(output_path, index=False, engine='openpyxl')
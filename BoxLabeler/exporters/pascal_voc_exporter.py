@@ -1,7 +1,9 @@
 import os
-from PIL import Image
 import xml.etree.ElementTree as ET
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.box_ops import clip_xyxy, round_pixels, xywh_to_xyxy
+from BoxLabeler.utils.image_size import get_image_size
 
 class PascalVOCExporter(Exporter):
     def export(self, annotations, output_dir):
@@ -9,33 +11,34 @@ class PascalVOCExporter(Exporter):
         
         for image_path, annotation in annotations.items():
             try:
-                img = Image.open(image_path)
-                img_width, img_height = img.size
+                img_width, img_height = get_image_size(image_path)
             except Exception as e:
                 print(f"Error opening image file: {image_path}\n{e}")
                 continue
             
             root = ET.Element("annotation")
-            ET.SubElement(root, "filename").text = os.path.basename(image_path)
+            ET.SubElement(root, "filename").text = sources.basename(image_path)
             
             size = ET.SubElement(root, "size")
             ET.SubElement(size, "width").text = str(img_width)
             ET.SubElement(size, "height").text = str(img_height)
             ET.SubElement(size, "depth").text = str(3)  # Assuming RGB images
             
-            for bbox in annotation.bboxes:
+            boxes, labels = annotation.to_arrays()
+            corners = round_pixels(clip_xyxy(xywh_to_xyxy(boxes), img_width, img_height)).tolist()
+            for label, (xmin, ymin, xmax, ymax) in zip(labels, corners):
                 obj = ET.SubElement(root, "object")
-                ET.SubElement(obj, "name").text = bbox.category_id
+                ET.SubElement(obj, "name").text = label
                 ET.SubElement(obj, "pose").text = "Unspecified"
                 ET.SubElement(obj, "truncated").text = "0"
                 ET.SubElement(obj, "difficult").text = "0"
                 
                 bndbox = ET.SubElement(obj, "bndbox")
-                ET.SubElement(bndbox, "xmin").text = str(int(bbox.x))
-                ET.SubElement(bndbox, "ymin").text = str(int(bbox.y))
-                ET.SubElement(bndbox, "xmax").text = str(int(bbox.x + bbox.w))
-                ET.SubElement(bndbox, "ymax").text = str(int(bbox.y + bbox.h))
+                ET.SubElement(bndbox, "xmin").text = str(xmin)
+                ET.SubElement(bndbox, "ymin").text = str(ymin)
+                ET.SubElement(bndbox, "xmax").text = str(xmax)
+                ET.SubElement(bndbox, "ymax").text = str(ymax)
             
             tree = ET.ElementTree(root)
-            xml_path = os.path.join(output_dir, os.path.splitext(os.path.basename(image_path))[0] + ".xml")
+            xml_path = os.path.join(output_dir, os.path.splitext(sources.basename(image_path))[0] + ".xml")
             tree.write(xml_path, encoding="utf-8", xml_declaration=True)
@@ -2,7 +2,9 @@ import os
 import tensorflow as tf
 import io
 from PIL import Image
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.box_ops import clip_xyxy, normalize, xywh_to_xyxy
 
 class TFRecordExporter(Exporter):
     def export(self, annotations, output_path, pbtxt_path):
@@ -20,26 +22,19 @@ class TFRecordExporter(Exporter):
                     print(f"Error creating TFExample for {image_path}: {e}")
 
     def create_tf_example(self, image_path, annotation, category_to_id):
-        with tf.io.gfile.GFile(image_path, 'rb') as fid:
-            encoded_jpg = fid.read()
+        encoded_jpg = bytes(sources.read_bytes(image_path))
         encoded_jpg_io = io.BytesIO(encoded_jpg)
         image = Image.open(encoded_jpg_io)
         width, height = image.size
 
-        filename = os.path.basename(image_path).encode('utf8')
-        image_format = os.path.splitext(image_path)[1][1:].encode('utf8')  # e.g., 'jpg'
+        filename = sources.basename(image_path).encode('utf8')
+        image_format = os.path.splitext(sources.basename(image_path))[1][1:].encode('utf8')  # e.g., 'jpg'
 
-        xmins, xmaxs, ymins, ymaxs = [], [], [], []
-        classes_text, classes = [], []
-
-        for bbox in annotation.bboxes:
-            xmins.append(bbox.x / width)
-            xmaxs.append((bbox.x + bbox.w) / width)
-            ymins.append(bbox.y / height)
-            ymaxs.append((bbox.y + bbox.h) / height)
-            class_name = str(bbox.category_id)
-            classes_text.append(class_name.encode('utf8'))
-            classes.append(category_to_id[bbox.category_id])
+        boxes, labels = annotation.to_arrays()
+        corners = normalize(clip_xyxy(xywh_to_xyxy(boxes), width, height), width, height)
+        xmins, ymins, xmaxs, ymaxs = (corners[:, i].tolist() for i in range(4))
+        classes_text = [str(label).encode('utf8') for label in labels]
+        classes = [category_to_id[label] for label in labels]
 
         tf_example = tf.train.Example(features=tf.train.Features(feature={
             'image/height': self.int64_feature(height),
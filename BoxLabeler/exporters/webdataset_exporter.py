@@ -0,0 +1,144 @@
+import io
+import json
+import os
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from BoxLabeler import sources
+from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.box_ops import to_yolo
+from BoxLabeler.utils.image_size import get_image_size
+
+DEFAULT_SHARD_BYTES = 256 * 1024 * 1024
+TAR_BLOCK = 512
+
+
+def _tar_member_bytes(size):
+    """Bytes a member occupies in a tar: one header block plus the data padded to whole blocks."""
+    return TAR_BLOCK + -(-size // TAR_BLOCK) * TAR_BLOCK
+
+
+class WebDatasetExporter(Exporter):
+    """
+    Write the dataset as WebDataset-style tar shards for sequential streaming.
+
+    Each sample is stored as consecutive members sharing a key: the raw image
+    bytes (`<key>.jpg` / `<key>.png`), a JSON record (`<key>.json`) and YOLO
+    label lines (`<key>.txt`). Shards are filled up to `max_shard_bytes` and
+    written in parallel; `index.json` lists every shard with its sample count
+    and size, and `classes.txt` maps YOLO class ids to labels.
+    """
+
+    def __init__(self, max_shard_bytes=DEFAULT_SHARD_BYTES, max_workers=None):
+        self.max_shard_bytes = max_shard_bytes
+        self.max_workers = max_workers or min(8, os.cpu_count() or 1)
+
+    def export(self, annotations, output_dir):
+        os.makedirs(output_dir, exist_ok=True)
+
+        categories = sorted({bbox.category_id for ann in annotations.values() for bbox in ann.bboxes})
+        category_to_id = {cat: i for i, cat in enumerate(categories)}
+        with open(os.path.join(output_dir, 'classes.txt'), 'w') as f:
+            f.writelines(f"{cat}\n" for cat in categories)
+
+        shards = self.plan_shards(annotations)
+        mtime = int(time.time())
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="webdataset") as executor:
+            futures = [
+                executor.submit(
+                    self.write_shard, os.path.join(output_dir, f"shard-{number:06d}.tar"),
+                    samples, annotations, category_to_id, mtime,
+                )
+                for number, samples in enumerate(shards)
+            ]
+            entries = [future.result() for future in futures]
+
+        index = {
+            "classes": categories,
+            "num_samples": sum(entry["num_samples"] for entry in entries),
+            "shards": entries,
+        }
+        if entries:
+            index["url"] = f"shard-{{000000..{len(entries) - 1:06d}}}.tar"  # Brace pattern for WebDataset
+        with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+            json.dump(index, f, indent=4)
+
+    def plan_shards(self, annotations):
+        """
+        Split the samples into consecutive shards of at most `max_shard_bytes` (estimated from image sizes).
+
+        Returns:
+            List[List[Tuple[int, str]]]: (sample number, image path) pairs of each shard.
+        """
+        label_bytes = 2 * _tar_member_bytes(TAR_BLOCK)  # JSON and YOLO records are usually under one block
+        shards, current, current_bytes = [], [], 0
+        for number, image_path in enumerate(annotations):
+            try:
+                size, _ = sources.stat_key(image_path)
+            except (OSError, KeyError) as e:
+                print(f"Error opening image file: {image_path}\n{e}")
+                continue
+            sample_bytes = _tar_member_bytes(size) + label_bytes
+            if current and current_bytes + sample_bytes > self.max_shard_bytes:
+                shards.append(current)
+                current, current_bytes = [], 0
+            current.append((number, image_path))
+            current_bytes += sample_bytes
+        if current:
+            shards.append(current)
+        return shards
+
+    def write_shard(self, shard_path, samples, annotations, category_to_id, mtime):
+        """Write one shard atomically. Returns its index entry."""
+        tmp_path = shard_path + '.tmp'
+        written = 0
+        try:
+            with tarfile.open(tmp_path, 'w') as tar:
+                for number, image_path in samples:
+                    try:
+                        data = sources.read_bytes(image_path)
+                        img_width, img_height = get_image_size(image_path)
+                    except Exception as e:
+                        print(f"Error opening image file: {image_path}\n{e}")
+                        continue
+
+                    key = f"{number:09d}"  # WebDataset splits member names at the first dot
+                    extension = os.path.splitext(sources.basename(image_path))[1].lower()
+                    boxes, labels = annotations[image_path].to_arrays()
+                    record = {
+                        "file_name": sources.basename(image_path),
+                        "width": img_width,
+                        "height": img_height,
+                        "boxes": boxes.tolist(),
+                        "labels": labels,
+                        "category_ids": [category_to_id[label] for label in labels],
+                    }
+                    yolo_lines = "".join(
+                        f"{category_to_id[label]} {x_center} {y_center} {width} {height}\n"
+                        for label, (x_center, y_center, width, height)
+                        in zip(labels, to_yolo(boxes, img_width, img_height).tolist())
+                    )
+
+                    self.add_member(tar, key + ('.jpg' if extension == '.jpeg' else extension), data, mtime)
+                    self.add_member(tar, key + '.json', json.dumps(record).encode('utf8'), mtime)
+                    self.add_member(tar, key + '.txt', yolo_lines.encode('utf8'), mtime)
+                    written += 1
+            os.replace(tmp_path, shard_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        return {
+            "url": os.path.basename(shard_path),
+            "num_samples": written,
+            "bytes": os.path.getsize(shard_path),
+        }
+
+    @staticmethod
+    def add_member(tar, name, data, mtime):
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = mtime
+        tar.addfile(info, io.BytesIO(data))
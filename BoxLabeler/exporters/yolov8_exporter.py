@@ -1,6 +1,8 @@
 import os
-from PIL import Image
+from BoxLabeler import sources
 from BoxLabeler.exporters.base import Exporter
+from BoxLabeler.utils.box_ops import to_yolo
+from BoxLabeler.utils.image_size import get_image_size
 
 class YOLOv8Exporter(Exporter):
     def export(self, annotations, output_dir):
@@ -15,21 +17,18 @@ class YOLOv8Exporter(Exporter):
         
         for image_path, annotation in annotations.items():
             try:
-                img = Image.open(image_path)
-                img_width, img_height = img.size
+                img_width, img_height = get_image_size(image_path)
             except Exception as e:
                 print(f"Error opening image file: {image_path}\n{e}")
                 continue
             
-            base_name = os.path.splitext(os.path.basename(image_path))[0]
+            base_name = os.path.splitext(sources.basename(image_path))[0]
             txt_path = os.path.join(output_dir, f"{base_name}.txt")
             
+            boxes, labels = annotation.to_arrays()
+            rows = to_yolo(boxes, img_width, img_height).tolist()
             with open(txt_path, 'w') as f:
-                for bbox in annotation.bboxes:
-                    x_center = (bbox.x + bbox.w / 2) / img_width
-                    y_center = (bbox.y + bbox.h / 2) / img_height
-                    width = bbox.w / img_width
-                    height = bbox.h / img_height
-                    class_id = category_to_id[bbox.category_id]
-                    
-                    f.write(f"{class_id} {x_center} {y_center} {width} {height}\n")
+                f.writelines(
+                    f"{category_to_id[label]} {x_center} {y_center} {width} {height}\n"
+                    for label, (x_center, y_center, width, height) in zip(labels, rows)
+                )
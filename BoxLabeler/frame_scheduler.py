@@ -0,0 +1,50 @@
+import time
+
+from BoxLabeler.instrumentation import instrumentation, timer
+
+
+class FrameScheduler:
+    """
+    Coalesce high-rate Tk events so their handlers run at most once per display frame.
+
+    Events are scheduled under a key (e.g. "crosshair" or "drag"); a newer event
+    replaces the pending one of the same key, which is counted as dropped. All
+    pending handlers run together from a single `after` callback, at the earliest
+    one frame interval after the previous run.
+    """
+
+    def __init__(self, widget, frame_ms=16):
+        self.widget = widget
+        self.frame_ms = frame_ms
+        self.pending = {}  # Key -> (handler, latest event)
+        self.job = None
+        self.last_run = 0.0
+        self.received = 0
+        self.dropped = 0
+
+    def schedule(self, key, handler, event):
+        self.received += 1
+        if key in self.pending:
+            self.dropped += 1
+            instrumentation.count("ui.events_dropped")
+        self.pending[key] = (handler, event)
+        if self.job is None:
+            wait = self.last_run + self.frame_ms / 1000 - time.monotonic()
+            self.job = self.widget.after(max(0, int(wait * 1000)), self.run)
+
+    def run(self):
+        self.job = None
+        self.last_run = time.monotonic()
+        pending, self.pending = self.pending, {}
+        with timer("ui.frame"):
+            for handler, event in pending.values():
+                handler(event)
+
+    def flush(self):
+        """Run pending handlers now, e.g. before a button release uses the final pointer position."""
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.run()
+
+    def stats(self):
+        return f"events {self.received}, coalesced {self.dropped}"
@@ -0,0 +1,238 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+
+from PIL import ImageTk
+
+from BoxLabeler import sources
+from BoxLabeler.thumbnails import ThumbnailCache
+
+CELL_PADDING = 8
+CAPTION_HEIGHT = 32
+CAPTION_CHARS = 24
+
+
+class ThumbnailGrid(tk.Toplevel):
+    """
+    Scrollable grid of thumbnails of the labeler's filtered image list.
+
+    The grid is virtualized: only the rows intersecting the viewport (plus one
+    row of margin) have canvas items, and thumbnails are requested in the
+    background only for those cells. Requests for cells scrolled out of view
+    before they start are cancelled. Clicking a cell opens that image.
+    """
+
+    def __init__(self, labeler, cache=None, memory_items=512):
+        super().__init__(labeler.master)
+        self.title("Grid Browser")
+        self.geometry("900x650")
+        self.labeler = labeler
+        self.cache = cache or ThumbnailCache()
+        self.memory_items = memory_items
+
+        self.image_paths = []
+        self.columns = 1
+        self.layout_count = 0
+        self.rendered = {}  # Cell index -> image path
+        self.photos = {}  # Image path -> PhotoImage of a rendered cell
+        self.thumbnails = OrderedDict()  # Image path -> (thumbnail, original size), LRU
+        self.pending = {}  # Image path -> Future
+        self.render_job = None
+        self.shown_index = None
+
+        self.canvas = tk.Canvas(self, bg="#2b2b2b", highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.config(yscrollcommand=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self.relayout())
+        self.canvas.bind("<Button-1>", self.on_click)
+        self.canvas.bind("<MouseWheel>", lambda event: self.canvas.yview_scroll(-event.delta // 120, "units"))
+        self.canvas.bind("<Button-4>", lambda event: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda event: self.canvas.yview_scroll(1, "units"))
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.sync()
+
+    # ==================== Layout ==================== #
+    def cell_size(self):
+        return self.cache.size + CELL_PADDING, self.cache.size + CELL_PADDING + CAPTION_HEIGHT
+
+    def cell_origin(self, index):
+        cell_w, cell_h = self.cell_size()
+        row, col = divmod(index, self.columns)
+        return CELL_PADDING + col * cell_w, CELL_PADDING + row * cell_h
+
+    def sync(self):
+        """Follow the labeler: re-layout when its image list changed, otherwise refresh the visible cells."""
+        if self.labeler.filtered_image_list is not self.image_paths or len(self.image_paths) != self.layout_count:
+            self.image_paths = self.labeler.filtered_image_list
+            self.relayout()
+        else:
+            self.redraw_visible()
+        if self.image_paths and self.labeler.current_image_index != self.shown_index:
+            self.shown_index = self.labeler.current_image_index
+            self.ensure_visible(self.shown_index)
+
+    def relayout(self):
+        cell_w, cell_h = self.cell_size()
+        width = max(self.canvas.winfo_width(), cell_w + CELL_PADDING)
+        self.columns = max(1, (width - CELL_PADDING) // cell_w)
+        self.layout_count = len(self.image_paths)
+        rows = -(-self.layout_count // self.columns)
+        self.canvas.config(scrollregion=(0, 0, width, CELL_PADDING + rows * cell_h))
+        for index in list(self.rendered):
+            self.remove_cell(index)
+        self.render_visible()
+
+    def ensure_visible(self, index):
+        _, cell_h = self.cell_size()
+        _, y = self.cell_origin(index)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        if y < top or y + cell_h > bottom:
+            total = CELL_PADDING + -(-len(self.image_paths) // self.columns) * cell_h
+            self.canvas.yview_moveto(max(0.0, y - CELL_PADDING) / max(total, 1))
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.render_job is None:
+            self.render_job = self.after_idle(self.render_visible)
+
+    def visible_range(self):
+        _, cell_h = self.cell_size()
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first_row = max(0, int((top - CELL_PADDING) // cell_h) - 1)
+        last_row = int((bottom - CELL_PADDING) // cell_h) + 1
+        return range(first_row * self.columns, min(len(self.image_paths), (last_row + 1) * self.columns))
+
+    # ==================== Rendering ==================== #
+    def render_visible(self):
+        self.render_job = None
+        visible = self.visible_range()
+        for index in list(self.rendered):
+            if index not in visible:
+                self.remove_cell(index)
+        for index in visible:
+            if index not in self.rendered:
+                self.draw_cell(index)
+
+        # Drop requests for cells that scrolled away before their thumbnail was started
+        wanted = set(self.rendered.values())
+        for path, future in list(self.pending.items()):
+            if path not in wanted and future.cancel():
+                del self.pending[path]
+        for path in list(self.photos):
+            if path not in wanted:
+                del self.photos[path]
+
+    def redraw_visible(self):
+        for index in list(self.rendered):
+            self.remove_cell(index, keep_photo=True)
+        self.render_visible()
+
+    def remove_cell(self, index, keep_photo=False):
+        self.canvas.delete(f"cell{index}")
+        path = self.rendered.pop(index)
+        if not keep_photo:
+            self.photos.pop(path, None)
+
+    def draw_cell(self, index):
+        path = self.image_paths[index]
+        self.rendered[index] = path
+        tags = ("cell", f"cell{index}")
+        size = self.cache.size
+        x0, y0 = self.cell_origin(index)
+
+        current = self.labeler.current_image_index == index
+        self.canvas.create_rectangle(
+            x0 - 2, y0 - 2, x0 + size + 2, y0 + size + CAPTION_HEIGHT,
+            outline="#4a90d9" if current else "#3c3c3c", width=3 if current else 1,
+            fill="#333333", tags=tags
+        )
+
+        annotation = self.labeler.annotations.get(path)
+        bboxes = annotation.bboxes if annotation else []
+        label_counts = {}
+        for bbox in bboxes:
+            label_counts[bbox.category_id] = label_counts.get(bbox.category_id, 0) + 1
+        counts = ", ".join(f"{label}: {n}" for label, n in label_counts.items()) or "unlabeled"
+        self.canvas.create_text(
+            x0 + 2, y0 + size + 2, anchor=tk.NW, fill="#dddddd", font=("Arial", 8), tags=tags,
+            text=f"{sources.basename(path)[:CAPTION_CHARS]}\n{counts[:CAPTION_CHARS]}"
+        )
+
+        thumbnail = self.thumbnails.get(path)
+        if thumbnail is None:
+            self.request(path)
+            return
+        self.thumbnails.move_to_end(path)
+
+        image, (orig_w, orig_h) = thumbnail
+        photo = self.photos.get(path)
+        if photo is None:
+            photo = self.photos[path] = ImageTk.PhotoImage(image)
+        left = x0 + (size - image.width) // 2
+        top = y0 + (size - image.height) // 2
+        self.canvas.create_image(left, top, anchor=tk.NW, image=photo, tags=tags)
+
+        scale_x = image.width / orig_w if orig_w else 1.0
+        scale_y = image.height / orig_h if orig_h else 1.0
+        for bbox in bboxes:
+            self.canvas.create_rectangle(
+                left + bbox.x * scale_x, top + bbox.y * scale_y,
+                left + (bbox.x + bbox.w) * scale_x, top + (bbox.y + bbox.h) * scale_y,
+                outline=self.labeler.get_color_for_label(bbox.category_id), tags=tags
+            )
+
+    # ==================== Thumbnails ==================== #
+    def request(self, path):
+        if path in self.pending:
+            return
+        future = self.cache.request(path)
+        self.pending[path] = future
+        future.add_done_callback(lambda f, p=path: self.deliver(p, f))
+
+    def deliver(self, path, future):
+        """Called on a worker thread: hand the result over to the Tk thread."""
+        try:
+            self.after(0, self.on_thumbnail_ready, path, future)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed
+
+    def on_thumbnail_ready(self, path, future):
+        if self.pending.get(path) is future:
+            del self.pending[path]
+        if future.cancelled():
+            return
+        try:
+            self.thumbnails[path] = future.result()
+        except Exception as e:
+            print(f"Error creating thumbnail: {path}\n{e}")
+            return
+        while len(self.thumbnails) > self.memory_items:
+            self.thumbnails.popitem(last=False)
+
+        for index, rendered_path in list(self.rendered.items()):
+            if rendered_path == path:
+                self.remove_cell(index)
+                self.draw_cell(index)
+
+    # ==================== Events ==================== #
+    def on_click(self, event):
+        cell_w, cell_h = self.cell_size()
+        col = int((self.canvas.canvasx(event.x) - CELL_PADDING) // cell_w)
+        row = int((self.canvas.canvasy(event.y) - CELL_PADDING) // cell_h)
+        index = row * self.columns + col
+        if 0 <= col < self.columns and 0 <= index < len(self.image_paths):
+            self.shown_index = index  # Already on screen, no need to scroll
+            self.labeler.go_to_image(index)
+
+    def close(self):
+        for future in self.pending.values():
+            future.cancel()
+        self.cache.shutdown()
+        self.labeler.thumbnail_grid = None
+        self.destroy()
@@ -0,0 +1,30 @@
+import importlib
+
+from .base import Importer
+
+_IMPORTERS = {
+    "yolov8": ("yolov8_importer", "YOLOv8Importer"),
+    "pascal_voc": ("pascal_voc_importer", "PascalVOCImporter"),
+}
+
+__all__ = [
+    'Importer',
+    'YOLOv8Importer',
+    'PascalVOCImporter',
+    'get_importer'
+]
+
+def _load_importer_class(module_name, class_name):
+    module = importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, class_name)
+
+def __getattr__(name):
+    for module_name, class_name in _IMPORTERS.values():
+        if class_name == name:
+            return _load_importer_class(module_name, class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def get_importer(format_):
+    if format_ not in _IMPORTERS:
+        raise ValueError(f"Unknown format: {format_}")
+    return _load_importer_class(*_IMPORTERS[format_])()
@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+
+from BoxLabeler import sources
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+
+# Below this many label files a process pool costs more than it saves
+MIN_FILES_FOR_POOL = 256
+
+# Default number of worker processes; each spawned worker re-imports the package
+MAX_POOL_WORKERS = 4
+
+
+class Importer(ABC):
+    label_extension = None
+
+    @abstractmethod
+    def parse_chunk(self, pairs, label_dir):
+        """
+        Parse a chunk of (image_path, label_path) pairs.
+
+        Runs in a worker process, so it must only return picklable data.
+
+        :return: List of (image_path, labels, boxes) with `boxes` an (N, 4) array of [x, y, w, h] pixels.
+        """
+        pass
+
+    def import_annotations(self, label_dir, image_paths, max_workers=None, chunk_size=512):
+        """
+        Nhập annotations từ thư mục chứa một file nhãn cho mỗi ảnh.
+
+        Large imports are parsed by a pool of spawned processes: spawn (rather than
+        fork) is safe to start from a thread of a running Tk application and behaves
+        the same on every platform.
+
+        :param label_dir: Thư mục chứa các file nhãn.
+        :param image_paths: Danh sách đường dẫn ảnh; file nhãn được ghép với ảnh theo tên (không đuôi).
+        :return: Dictionary mapping image paths to ImageAnnotation objects.
+        """
+        pairs = self.match_label_files(label_dir, image_paths)
+        chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+
+        if len(pairs) < MIN_FILES_FOR_POOL or max_workers == 1:
+            results = [self.parse_chunk(chunk, label_dir) for chunk in chunks]
+        else:
+            max_workers = max_workers or min(MAX_POOL_WORKERS, os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks)),
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                results = list(pool.map(self.parse_chunk, chunks, [label_dir] * len(chunks)))
+
+        annotations = {}
+        for chunk_result in results:
+            for image_path, labels, boxes in chunk_result:
+                annotation = ImageAnnotation(image_path)
+                annotation.add_bboxes([
+                    BoundingBox(x, y, w, h, label) for (x, y, w, h), label in zip(boxes.tolist(), labels)
+                ])
+                annotations[image_path] = annotation
+        return annotations
+
+    def match_label_files(self, label_dir, image_paths):
+        """Pair every image with the label file sharing its base name."""
+        images_by_stem = {os.path.splitext(sources.basename(p))[0]: p for p in image_paths}
+        pairs = []
+        with os.scandir(label_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() == self.label_extension and stem in images_by_stem:
+                    pairs.append((images_by_stem[stem], entry.path))
+        pairs.sort()
+        return pairs
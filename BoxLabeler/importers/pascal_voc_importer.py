@@ -0,0 +1,30 @@
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from BoxLabeler.importers.base import Importer
+from BoxLabeler.utils.box_ops import xyxy_to_xywh
+
+
+class PascalVOCImporter(Importer):
+    label_extension = '.xml'
+
+    def parse_chunk(self, pairs, label_dir):
+        results = []
+        for image_path, xml_path in pairs:
+            try:
+                root = ET.parse(xml_path).getroot()
+                labels, coords = [], []
+                for obj in root.iter('object'):
+                    bndbox = obj.find('bndbox')
+                    if bndbox is None:
+                        continue
+                    labels.append(obj.findtext('name', default='unknown'))
+                    coords.append([bndbox.findtext(tag) for tag in ('xmin', 'ymin', 'xmax', 'ymax')])
+                boxes = np.array(coords, dtype=np.float64).reshape(-1, 4)
+            except (OSError, ET.ParseError, TypeError, ValueError) as e:
+                print(f"Error reading labels for {image_path}\n{e}")
+                continue
+
+            results.append((image_path, labels, xyxy_to_xywh(boxes)))
+        return results
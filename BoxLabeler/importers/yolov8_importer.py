@@ -0,0 +1,52 @@
+import os
+
+import numpy as np
+
+from BoxLabeler.importers.base import Importer
+from BoxLabeler.utils.box_ops import from_yolo
+from BoxLabeler.utils.image_size import get_image_size
+
+
+def read_yolo_rows(label_path):
+    """Read a YOLO label file as an (N, 5) array of class, x_center, y_center, width, height."""
+    with open(label_path, 'r') as f:
+        rows = [line.split() for line in f if line.strip()]
+    if not rows:
+        return np.empty((0, 5))
+    if any(len(row) != 5 for row in rows):
+        # Segment or confidence columns: keep the box part only
+        rows = [row[:5] for row in rows if len(row) >= 5]
+    return np.array(rows, dtype=np.float64).reshape(-1, 5)
+
+
+class YOLOv8Importer(Importer):
+    label_extension = '.txt'
+
+    def parse_chunk(self, pairs, label_dir):
+        names = self.read_classes(label_dir)
+        results = []
+        for image_path, label_path in pairs:
+            try:
+                rows = read_yolo_rows(label_path)
+                img_width, img_height = get_image_size(image_path)
+            except (OSError, ValueError) as e:
+                print(f"Error reading labels for {image_path}\n{e}")
+                continue
+
+            class_ids = rows[:, 0].astype(np.int64)
+            boxes = from_yolo(rows[:, 1:5], img_width, img_height)
+            labels = [names[i] if 0 <= i < len(names) else str(i) for i in class_ids.tolist()]
+            results.append((image_path, labels, boxes))
+        return results
+
+    def read_classes(self, label_dir):
+        """Class names from the classes.txt written by YOLOv8Exporter, if present."""
+        classes_path = os.path.join(label_dir, 'classes.txt')
+        if not os.path.isfile(classes_path):
+            return []
+        with open(classes_path, 'r') as f:
+            return [line.strip() for line in f if line.strip()]
+
+    def match_label_files(self, label_dir, image_paths):
+        pairs = super().match_label_files(label_dir, image_paths)
+        return [(img, label) for img, label in pairs if os.path.basename(label) != 'classes.txt']
@@ -0,0 +1,183 @@
+"""
+Opt-in timers and counters for the labeler's hot paths.
+
+Instrumentation is disabled by default and then costs a single attribute check
+per instrumented call. Enable it with the BOXLABELER_PROFILE=1 environment
+variable or from the View menu. Timings are aggregated into log-scale
+histograms that can be dumped to JSON for offline analysis.
+"""
+
+import functools
+import json
+import math
+import os
+import threading
+import time
+
+# Histogram buckets grow by sqrt(2), starting at 1 microsecond (bucket 0) up to ~70 minutes
+_BUCKETS_PER_OCTAVE = 2
+_NUM_BUCKETS = 64
+
+
+def _bucket_index(seconds):
+    micros = seconds * 1e6
+    if micros <= 1:
+        return 0
+    return min(int(math.log2(micros) * _BUCKETS_PER_OCTAVE), _NUM_BUCKETS - 1)
+
+
+def _bucket_upper_bound(index):
+    return 2 ** ((index + 1) / _BUCKETS_PER_OCTAVE) / 1e6
+
+
+class Histogram:
+    __slots__ = ('count', 'total', 'min', 'max', 'last', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.last = 0.0
+        self.buckets = [0] * _NUM_BUCKETS
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.buckets[_bucket_index(seconds)] += 1
+
+    def percentile(self, q):
+        """Approximate percentile (upper bound of the bucket holding it), in seconds."""
+        if not self.count:
+            return 0.0
+        target = q / 100 * self.count
+        seen = 0
+        for index, n in enumerate(self.buckets):
+            seen += n
+            if n and seen >= target:
+                return min(_bucket_upper_bound(index), self.max)
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total_s': self.total,
+            'mean_s': self.total / self.count if self.count else 0.0,
+            'min_s': self.min if self.count else 0.0,
+            'max_s': self.max,
+            'last_s': self.last,
+            'p50_s': self.percentile(50),
+            'p95_s': self.percentile(95),
+            'p99_s': self.percentile(99),
+            'buckets': {
+                f"{_bucket_upper_bound(i):.7f}": n for i, n in enumerate(self.buckets) if n
+            },
+        }
+
+
+class _Timer:
+    __slots__ = ('instrumentation', 'name', 'start')
+
+    def __init__(self, instrumentation, name):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.instrumentation.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Instrumentation:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.histograms = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    def timer(self, name):
+        """Context manager timing its block under `name` (a no-op when disabled)."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call of the wrapped function under `name`."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def record(self, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(seconds)
+
+    def count(self, name, n=1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'timers': {name: h.to_dict() for name, h in sorted(self.histograms.items())},
+                'counters': dict(sorted(self.counters.items())),
+            }
+
+    def dump(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=4)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    def summary(self, names):
+        """One-line "name last/mean" readout of the given timers, e.g. for a status bar."""
+        parts = []
+        with self._lock:
+            for name in names:
+                histogram = self.histograms.get(name)
+                if histogram and histogram.count:
+                    mean = histogram.total / histogram.count
+                    parts.append(f"{name.split('.')[-1]} {histogram.last * 1000:.1f}/{mean * 1000:.1f}ms")
+        return " | ".join(parts)
+
+
+instrumentation = Instrumentation(enabled=os.environ.get("BOXLABELER_PROFILE") == "1")
+timer = instrumentation.timer
+timed = instrumentation.timed
@@ -0,0 +1,120 @@
+import ast
+
+import cv2
+import numpy as np
+import onnxruntime as ort
+
+from BoxLabeler.models.postprocess import batched_nms
+
+DEFAULT_INPUT_SIZE = 640
+
+
+def letterbox(image, new_shape, color=114):
+    """
+    Resize `image` to fit `new_shape` (height, width) keeping its aspect ratio and pad the rest.
+
+    Returns:
+        Tuple[numpy.ndarray, float, Tuple[int, int]]: The padded image, the resize ratio
+        and the (left, top) padding.
+    """
+    height, width = image.shape[:2]
+    new_h, new_w = new_shape
+    ratio = min(new_h / height, new_w / width)
+    resized_h, resized_w = int(round(height * ratio)), int(round(width * ratio))
+
+    if (resized_h, resized_w) != (height, width):
+        image = cv2.resize(image, (resized_w, resized_h), interpolation=cv2.INTER_LINEAR)
+
+    top = (new_h - resized_h) // 2
+    left = (new_w - resized_w) // 2
+    padded = np.full((new_h, new_w, 3), color, dtype=np.uint8)
+    padded[top:top + resized_h, left:left + resized_w] = image
+    return padded, ratio, (left, top)
+
+
+class OnnxBackend:
+    """
+    CPU inference backend for YOLOv8 models exported to ONNX.
+
+    Letterboxing, decoding of the raw (1, 4 + num_classes, N) output and NMS are
+    all done in NumPy, so neither torch nor ultralytics is imported.
+    """
+
+    def __init__(self, model_path, num_threads=None, max_det=300):
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(
+            model_path, sess_options=options, providers=['CPUExecutionProvider']
+        )
+        self.max_det = max_det
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        batch, _, height, width = model_input.shape
+        metadata = self.session.get_modelmeta().custom_metadata_map
+
+        if isinstance(height, int) and isinstance(width, int):
+            self.input_size = (height, width)
+        elif 'imgsz' in metadata:
+            self.input_size = tuple(ast.literal_eval(metadata['imgsz']))
+        else:
+            self.input_size = (DEFAULT_INPUT_SIZE, DEFAULT_INPUT_SIZE)
+        # Models exported without dynamic axes only accept one image per run
+        self.max_batch = batch if isinstance(batch, int) else None
+
+        if 'names' in metadata:
+            self.names = ast.literal_eval(metadata['names'])
+        else:
+            num_classes = self.session.get_outputs()[0].shape[1] - 4
+            self.names = {i: str(i) for i in range(num_classes)}
+
+    def preprocess(self, images):
+        blobs, transforms = [], []
+        for image in images:
+            padded, ratio, pad = letterbox(image, self.input_size)
+            blobs.append(padded)
+            transforms.append((ratio, pad, image.shape[:2]))
+        blob = np.stack(blobs).transpose(0, 3, 1, 2).astype(np.float32) / 255.0
+        return np.ascontiguousarray(blob), transforms
+
+    def decode(self, output, transform, conf_threshold, iou_threshold, agnostic=False):
+        """Turn one (4 + num_classes, N) output into boxes in original image pixels."""
+        pred = output.T
+        class_scores = pred[:, 4:]
+        class_ids = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(len(class_ids)), class_ids]
+
+        mask = scores >= conf_threshold
+        pred, scores, class_ids = pred[mask], scores[mask], class_ids[mask]
+
+        cxcy, wh = pred[:, :2], pred[:, 2:4]
+        boxes = np.concatenate((cxcy - wh / 2, cxcy + wh / 2), axis=1)
+
+        keep = batched_nms(boxes, scores, class_ids, iou_threshold, agnostic=agnostic)[:self.max_det]
+        boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+
+        ratio, (left, top), (height, width) = transform
+        boxes -= np.array([left, top, left, top], dtype=boxes.dtype)
+        boxes /= ratio
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, width)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, height)
+        return boxes, scores, class_ids
+
+    def infer(self, images, conf_threshold, iou_threshold, agnostic=False):
+        """
+        Run the model on a batch of RGB images.
+
+        Returns:
+            List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]: Per image, the
+            [x1, y1, x2, y2] boxes, scores and class IDs after NMS.
+        """
+        step = self.max_batch or len(images)
+        results = []
+        for start in range(0, len(images), step):
+            blob, transforms = self.preprocess(images[start:start + step])
+            outputs = self.session.run(None, {self.input_name: blob})[0]
+            for output, transform in zip(outputs, transforms):
+                results.append(self.decode(output, transform, conf_threshold, iou_threshold, agnostic))
+        return results
@@ -0,0 +1,212 @@
+import numpy as np
+
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.utils.box_ops import xyxy_to_xywh
+
+# Candidate box pairs scored at once in NMS, which bounds its memory use
+NMS_MAX_PAIRS = 1 << 20
+
+
+class Detections:
+    """
+    Array-backed detections for a single image.
+
+    Attributes:
+        boxes (numpy.ndarray): (N, 4) float32 boxes as [x, y, width, height] in original image pixels.
+        scores (numpy.ndarray): (N,) float32 confidence scores.
+        class_ids (numpy.ndarray): (N,) int64 class indices into `names`.
+        names (Dict[int, str]): Class names of the model, keyed by class index.
+    """
+
+    __slots__ = ('boxes', 'scores', 'class_ids', 'names')
+
+    def __init__(self, boxes, scores, class_ids, names):
+        self.boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+        self.scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+        self.class_ids = np.asarray(class_ids, dtype=np.int64).reshape(-1)
+        self.names = names
+
+    @classmethod
+    def empty(cls, names):
+        return cls(np.empty((0, 4)), np.empty(0), np.empty(0), names)
+
+    def __len__(self):
+        return len(self.scores)
+
+    def labels(self):
+        """Return the class name of every detection, looked up in one vectorized pass."""
+        if not len(self):
+            return []
+        return name_table(self.names)[self.class_ids].tolist()
+
+    def to_bboxes(self):
+        """Build BoundingBox objects ready to be bulk-inserted into an ImageAnnotation."""
+        return [
+            BoundingBox(x, y, w, h, label, score)
+            for (x, y, w, h), label, score in zip(self.boxes.tolist(), self.labels(), self.scores.tolist())
+        ]
+
+    def to_dicts(self):
+        """Return the list-of-dicts structure historically returned by `predict`."""
+        return [
+            {'bbox': box, 'class': label, 'confidence': score}
+            for box, label, score in zip(self.boxes.tolist(), self.labels(), self.scores.tolist())
+        ]
+
+
+def name_table(names):
+    """Turn a {class_id: name} mapping (or a sequence) into an object array indexable by class id."""
+    if isinstance(names, dict):
+        table = np.empty(max(names) + 1 if names else 0, dtype=object)
+        for class_id, name in names.items():
+            table[class_id] = name
+        return table
+    return np.asarray(list(names), dtype=object)
+
+
+def box_iou(boxes1, boxes2):
+    """
+    Pairwise IoU between two sets of [x1, y1, x2, y2] boxes.
+
+    Returns:
+        numpy.ndarray: (len(boxes1), len(boxes2)) IoU matrix.
+    """
+    boxes1 = np.asarray(boxes1, dtype=np.float32).reshape(-1, 4)
+    boxes2 = np.asarray(boxes2, dtype=np.float32).reshape(-1, 4)
+    area1 = (boxes1[:, 2] - boxes1[:, 0]).clip(0) * (boxes1[:, 3] - boxes1[:, 1]).clip(0)
+    area2 = (boxes2[:, 2] - boxes2[:, 0]).clip(0) * (boxes2[:, 3] - boxes2[:, 1]).clip(0)
+
+    top_left = np.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    bottom_right = np.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    wh = (bottom_right - top_left).clip(0)
+    inter = wh[..., 0] * wh[..., 1]
+    union = area1[:, None] + area2[None, :] - inter
+    return inter / np.maximum(union, np.finfo(np.float32).eps)
+
+
+def _overlapping_pairs(boxes, iou_threshold, class_ids=None, max_pairs=NMS_MAX_PAIRS):
+    """
+    Pairs (i, j), i < j, of [x1, y1, x2, y2] boxes overlapping above `iou_threshold`.
+
+    Only pairs that overlap horizontally are considered: with the boxes sorted
+    by x1 these are, for each box, the following boxes starting before its x2.
+    With `class_ids`, each class is shifted to its own x range so only boxes of
+    the same class pair up. Pairs are scored in chunks of at most `max_pairs`,
+    so memory does not grow with N^2.
+    """
+    x1 = boxes[:, 0].astype(np.float64) - boxes[:, 0].min()
+    x2 = boxes[:, 2].astype(np.float64) - boxes[:, 0].min()
+    if class_ids is not None:
+        offsets = class_ids.astype(np.float64) * (x2.max() + 1)
+        x1, x2 = x1 + offsets, x2 + offsets
+    by_x1 = np.argsort(x1, kind='stable')
+    positions = np.arange(len(boxes))
+    counts = np.searchsorted(x1[by_x1], x2[by_x1], side='left') - positions - 1
+    counts = counts.clip(0)
+    areas = (boxes[:, 2] - boxes[:, 0]).clip(0) * (boxes[:, 3] - boxes[:, 1]).clip(0)
+
+    rows, cols = [], []
+    ends = np.cumsum(counts)
+    start = 0
+    while start < len(boxes):
+        # Largest run of boxes whose candidate pairs fit the budget (at least one box)
+        stop = max(int(np.searchsorted(ends, ends[start] - counts[start] + max_pairs, side='right')), start + 1)
+        run = counts[start:stop]
+        first = np.repeat(positions[start:stop], run)
+        second = first + 1 + np.arange(len(first)) - np.repeat(np.cumsum(run) - run, run)
+        i, j = by_x1[first], by_x1[second]
+
+        wh = (np.minimum(boxes[i, 2:], boxes[j, 2:]) - np.maximum(boxes[i, :2], boxes[j, :2])).clip(0)
+        inter = wh[:, 0] * wh[:, 1]
+        iou = inter / np.maximum(areas[i] + areas[j] - inter, np.finfo(np.float32).eps)
+        mask = iou > iou_threshold
+        rows.append(np.minimum(i[mask], j[mask]))
+        cols.append(np.maximum(i[mask], j[mask]))
+        start = stop
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _greedy_nms(boxes, scores, iou_threshold, class_ids=None):
+    """
+    Greedy NMS over the sparse set of overlapping pairs.
+
+    Boxes are put in decreasing score order, so each pair (i, j) means box i
+    suppresses box j if i is kept. Only boxes with overlaps are walked in Python.
+    """
+    order = np.argsort(-scores, kind='stable')
+    boxes = boxes[order]
+    if class_ids is not None:
+        class_ids = np.asarray(class_ids).reshape(-1)[order]
+
+    rows, cols = _overlapping_pairs(boxes, iou_threshold, class_ids)
+    by_row = np.argsort(rows, kind='stable')
+    rows, cols = rows[by_row], cols[by_row]
+    suppressors, first = np.unique(rows, return_index=True)
+    bounds = np.append(first, len(rows))
+
+    keep = np.ones(len(boxes), dtype=bool)
+    for k, i in enumerate(suppressors.tolist()):
+        if keep[i]:
+            keep[cols[bounds[k]:bounds[k + 1]]] = False
+    return order[keep].astype(np.intp)
+
+
+def nms(boxes, scores, iou_threshold):
+    """
+    Greedy Non-Maximum Suppression in NumPy.
+
+    Args:
+        boxes (numpy.ndarray): (N, 4) boxes as [x1, y1, x2, y2].
+        scores (numpy.ndarray): (N,) confidence scores.
+        iou_threshold (float): Boxes overlapping a kept box above this IoU are dropped.
+
+    Returns:
+        numpy.ndarray: Indices of the kept boxes, sorted by decreasing score.
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.intp)
+    return _greedy_nms(boxes, scores, iou_threshold)
+
+
+def batched_nms(boxes, scores, class_ids, iou_threshold, agnostic=False):
+    """NMS that only suppresses boxes of the same class unless `agnostic` is set."""
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+    if agnostic or len(boxes) == 0:
+        return nms(boxes, scores, iou_threshold)
+    return _greedy_nms(boxes, scores, iou_threshold, class_ids=class_ids)
+
+
+def postprocess(boxes, scores, class_ids, names, conf_threshold=0.5, iou_threshold=0.5,
+                apply_nms=False, agnostic=False):
+    """
+    Threshold (and optionally re-run NMS on) raw detections with NumPy masks.
+
+    Args:
+        boxes (numpy.ndarray): (N, 4) boxes as [x1, y1, x2, y2].
+        scores (numpy.ndarray): (N,) confidence scores.
+        class_ids (numpy.ndarray): (N,) class indices.
+        names (Dict[int, str]): Class names of the model.
+        conf_threshold (float): Detections scoring below this are dropped.
+        iou_threshold (float): IoU threshold used when `apply_nms` is set.
+        apply_nms (bool): Run an extra NMS pass. Ultralytics already applies NMS,
+            so this is only useful for backends that do not.
+        agnostic (bool): Suppress overlapping boxes across classes.
+
+    Returns:
+        Detections: The kept detections with boxes converted to [x, y, width, height].
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+    class_ids = np.asarray(class_ids).reshape(-1).astype(np.int64)
+
+    mask = scores >= conf_threshold
+    boxes, scores, class_ids = boxes[mask], scores[mask], class_ids[mask]
+
+    if apply_nms and len(boxes):
+        keep = batched_nms(boxes, scores, class_ids, iou_threshold, agnostic=agnostic)
+        boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+
+    return Detections(xyxy_to_xywh(boxes), scores, class_ids, names)
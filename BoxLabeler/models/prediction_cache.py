@@ -0,0 +1,209 @@
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+
+import numpy as np
+
+from BoxLabeler.sources import stat_key
+
+# Entry layout (little endian):
+#   header: magic, version, flags, iou used for NMS, number of boxes
+#   float32[n, 4] boxes (x1, y1, x2, y2), float32[n] scores, uint16[n] class ids
+#   uint16[n] tile indices, for the unmerged detections of sliced inference only
+_MAGIC = b'BLPC'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBBfI')
+_FLAG_AGNOSTIC = 0x1
+_FLAG_TILES = 0x2
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "boxlabeler", "predictions")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def file_sha1(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PredictionCache:
+    """
+    On-disk cache of raw (pre-threshold) model outputs.
+
+    Entries are keyed by a hash of the model weights and a key derived from the
+    image path, size and mtime, so re-running prediction with different
+    thresholds or on an already processed folder only costs post-processing.
+    When the cache grows past `max_bytes` the least recently used entries are
+    evicted.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes = None
+        self.hits = 0
+        self.misses = 0
+
+    # ==================== Keys ==================== #
+    @staticmethod
+    def model_key(model_path):
+        return file_sha1(model_path)[:20]
+
+    @staticmethod
+    def image_key(image_path):
+        size, mtime_ns = stat_key(image_path)
+        raw = f"{os.path.abspath(image_path)}|{size}|{mtime_ns}"
+        return hashlib.sha1(raw.encode('utf8')).hexdigest()
+
+    @staticmethod
+    def array_key(image):
+        """Key an in-memory image by its content when no file is available."""
+        digest = hashlib.sha1(np.ascontiguousarray(image).data)
+        digest.update(str(image.shape).encode('utf8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, model_key, image_key):
+        return os.path.join(self.cache_dir, model_key, image_key[:2], image_key + '.bin')
+
+    # ==================== Read / Write ==================== #
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, model_key, image_key, iou_threshold=None, agnostic=False):
+        """
+        Return the cached (boxes, scores, class_ids, iou, tile_ids) or None.
+
+        An entry is only usable if it was produced with NMS at least as permissive
+        as `iou_threshold` and with the same agnostic mode; the caller re-applies
+        NMS at the stricter threshold. `tile_ids` is None unless the entry holds
+        unmerged tile detections.
+        """
+        path = self._entry_path(model_key, image_key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            self._count(hit=False)
+            return None
+
+        try:
+            magic, version, flags, cached_iou, n = _HEADER.unpack_from(data)
+        except struct.error:
+            magic = None
+        if magic != _MAGIC or version != _VERSION:
+            self._count(hit=False)
+            return None
+        if bool(flags & _FLAG_AGNOSTIC) != bool(agnostic) or (
+                iou_threshold is not None and iou_threshold > cached_iou + 1e-6):
+            self._count(hit=False)
+            return None
+
+        offset = _HEADER.size
+        boxes = np.frombuffer(data, dtype='<f4', count=n * 4, offset=offset).reshape(n, 4)
+        offset += boxes.nbytes
+        scores = np.frombuffer(data, dtype='<f4', count=n, offset=offset)
+        offset += scores.nbytes
+        class_ids = np.frombuffer(data, dtype='<u2', count=n, offset=offset)
+        tile_ids = None
+        if flags & _FLAG_TILES:
+            offset += class_ids.nbytes
+            tile_ids = np.frombuffer(data, dtype='<u2', count=n, offset=offset).astype(np.int64)
+
+        try:
+            os.utime(path)  # Mark as recently used for eviction
+        except OSError:
+            pass
+        self._count(hit=True)
+        return boxes, scores, class_ids.astype(np.int64), cached_iou, tile_ids
+
+    def put(self, model_key, image_key, boxes, scores, class_ids, iou_threshold, agnostic=False, tile_ids=None):
+        boxes = np.asarray(boxes, dtype='<f4').reshape(-1, 4)
+        scores = np.asarray(scores, dtype='<f4').reshape(-1)
+        class_ids = np.asarray(class_ids).reshape(-1)
+        if len(class_ids) and class_ids.max() > np.iinfo(np.uint16).max:
+            return
+        if tile_ids is not None:
+            tile_ids = np.asarray(tile_ids).reshape(-1)
+            if len(tile_ids) and tile_ids.max() > np.iinfo(np.uint16).max:
+                return
+
+        flags = (_FLAG_AGNOSTIC if agnostic else 0) | (_FLAG_TILES if tile_ids is not None else 0)
+        payload = b''.join((
+            _HEADER.pack(_MAGIC, _VERSION, flags, float(iou_threshold), len(scores)),
+            boxes.tobytes(),
+            scores.tobytes(),
+            class_ids.astype('<u2').tobytes(),
+            tile_ids.astype('<u2').tobytes() if tile_ids is not None else b'',
+        ))
+
+        path = self._entry_path(model_key, image_key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            try:
+                previous_size = os.path.getsize(path)
+            except OSError:
+                previous_size = 0
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(payload) - previous_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    # ==================== Eviction ==================== #
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.bin'):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is below 90% of its budget."""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total_bytes = total
+
+    def clear(self):
+        with self._lock:
+            for path, _, _ in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
@@ -0,0 +1,201 @@
+import numpy as np
+
+from BoxLabeler.instrumentation import timer
+from BoxLabeler.models.postprocess import batched_nms, box_iou
+
+DEFAULT_SLICE_OPTIONS = {
+    'tile_size': 640,
+    'overlap': 0.2,
+    'batch_size': 8,
+    'merge': 'nms',
+    'include_full_image': True,
+}
+
+
+def tile_windows(width, height, tile_size, overlap):
+    """
+    Cover a width x height image with square tiles overlapping by `overlap` (a fraction of the tile).
+
+    The last row and column are shifted back so every tile keeps the full tile size.
+
+    Returns:
+        numpy.ndarray: (T, 4) int array of [x1, y1, x2, y2] tile windows.
+    """
+    stride = max(1, int(tile_size * (1 - overlap)))
+
+    def starts(length):
+        if length <= tile_size:
+            return np.zeros(1, dtype=np.int64)
+        return np.append(np.arange(0, length - tile_size, stride), length - tile_size)
+
+    x0, y0 = np.meshgrid(starts(width), starts(height))
+    x0, y0 = x0.ravel(), y0.ravel()
+    return np.stack((x0, y0, np.minimum(x0 + tile_size, width), np.minimum(y0 + tile_size, height)), axis=1)
+
+
+def _fusion_clusters(boxes, iou_threshold):
+    """
+    Greedy clusters of score-sorted [x1, y1, x2, y2] boxes (cluster index per box).
+
+    Each leader is only compared with the boxes it can overlap: sorted by x1,
+    those start within [x1 - widest box, x2) of the leader. Memory stays linear
+    and time follows the number of horizontally overlapping boxes, not N^2.
+    """
+    by_x1 = np.argsort(boxes[:, 0], kind='stable')
+    sorted_x1 = boxes[by_x1, 0]
+    max_width = float((boxes[:, 2] - boxes[:, 0]).max())
+
+    cluster = np.full(len(boxes), -1, dtype=np.int64)
+    num_clusters = 0
+    for i in range(len(boxes)):
+        if cluster[i] >= 0:
+            continue
+        lo, hi = np.searchsorted(sorted_x1, (boxes[i, 0] - max_width, boxes[i, 2]), side='left')
+        candidates = by_x1[lo:hi]
+        candidates = candidates[cluster[candidates] < 0]
+        cluster[candidates[box_iou(boxes[i:i + 1], boxes[candidates])[0] > iou_threshold]] = num_clusters
+        cluster[i] = num_clusters
+        num_clusters += 1
+    return cluster
+
+
+def weighted_box_fusion(boxes, scores, class_ids, iou_threshold, agnostic=False):
+    """
+    Fuse overlapping [x1, y1, x2, y2] boxes into score-weighted averages.
+
+    Boxes are clustered greedily in decreasing score order: each unassigned box
+    starts a cluster and absorbs every unassigned box (of the same class unless
+    `agnostic`) overlapping it above `iou_threshold`. Cluster coordinates are the
+    score-weighted mean of their members and the cluster keeps its best score.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Fused boxes, scores and class IDs.
+    """
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 4)
+    scores = np.asarray(scores, dtype=np.float32).reshape(-1)
+    class_ids = np.asarray(class_ids).reshape(-1)
+    if len(boxes) == 0:
+        return boxes, scores, class_ids
+
+    order = np.argsort(-scores, kind='stable')
+    boxes, scores, class_ids = boxes[order], scores[order], class_ids[order]
+
+    if agnostic:
+        cluster = _fusion_clusters(boxes, iou_threshold)
+    else:
+        cluster = np.empty(len(boxes), dtype=np.int64)
+        num_clusters = 0
+        for class_id in np.unique(class_ids):
+            members = np.flatnonzero(class_ids == class_id)  # Still in score order
+            class_cluster = _fusion_clusters(boxes[members], iou_threshold)
+            cluster[members] = class_cluster + num_clusters
+            num_clusters += int(class_cluster.max()) + 1
+
+    # Number clusters by their best box, so they come out in decreasing score order;
+    # scores are sorted, so the first member of each cluster is its best box
+    _, leaders, cluster = np.unique(cluster, return_index=True, return_inverse=True)
+    rank = np.empty(len(leaders), dtype=np.int64)
+    rank[np.argsort(leaders, kind='stable')] = np.arange(len(leaders))
+    cluster = rank[cluster.reshape(-1)]
+    leaders = np.sort(leaders)
+    num_clusters = len(leaders)
+
+    weight_sum = np.bincount(cluster, weights=scores, minlength=num_clusters)
+    fused = np.stack([
+        np.bincount(cluster, weights=boxes[:, k] * scores, minlength=num_clusters) for k in range(4)
+    ], axis=1) / np.maximum(weight_sum, np.finfo(np.float32).eps)[:, None]
+
+    return fused.astype(np.float32), scores[leaders], class_ids[leaders]
+
+
+def merge_detections(boxes, scores, class_ids, iou_threshold, method='nms', agnostic=False):
+    """Merge detections coming from overlapping tiles with NMS or weighted box fusion."""
+    if method == 'wbf':
+        return weighted_box_fusion(boxes, scores, class_ids, iou_threshold, agnostic=agnostic)
+    if method != 'nms':
+        raise ValueError(f"Unknown merge method: {method}")
+    keep = batched_nms(boxes, scores, class_ids, iou_threshold, agnostic=agnostic)
+    return boxes[keep], scores[keep], class_ids[keep]
+
+
+def infer_tiles(backend, image, conf_threshold, iou_threshold, agnostic=False, tile_size=640,
+                overlap=0.2, batch_size=8, include_full_image=True):
+    """
+    Run `backend` over overlapping tiles of `image`, without merging the tiles.
+
+    Tiles are sent to the backend `batch_size` at a time. With `include_full_image`
+    the downscaled full image is added as one more tile so objects larger than a
+    tile are still found.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: [x1, y1, x2, y2]
+        boxes in full-image coordinates, scores, class IDs and the index of the tile of each box.
+    """
+    height, width = image.shape[:2]
+    windows = tile_windows(width, height, tile_size, overlap)
+    tiles = [np.ascontiguousarray(image[y1:y2, x1:x2]) for x1, y1, x2, y2 in windows]
+    if include_full_image and len(windows) > 1:
+        windows = np.vstack((windows, [[0, 0, width, height]]))
+        tiles.append(image)
+
+    outputs = []
+    with timer("predict.tiles"):
+        for start in range(0, len(tiles), batch_size):
+            outputs.extend(
+                backend.infer(tiles[start:start + batch_size], conf_threshold, iou_threshold, agnostic=agnostic)
+            )
+
+    counts = [len(scores) for _, scores, _ in outputs]
+    if not sum(counts):
+        return (np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32),
+                np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    boxes = np.concatenate([b for b, _, _ in outputs]).astype(np.float32)
+    scores = np.concatenate([s for _, s, _ in outputs]).astype(np.float32)
+    class_ids = np.concatenate([c for _, _, c in outputs]).astype(np.int64)
+    boxes += np.repeat(windows[:, [0, 1, 0, 1]], counts, axis=0).astype(np.float32)
+    return boxes, scores, class_ids, np.repeat(np.arange(len(outputs)), counts)
+
+
+def merge_tiles(boxes, scores, class_ids, tile_ids, conf_threshold, iou_threshold, tile_iou=None,
+                merge='nms', agnostic=False):
+    """
+    Merge raw tile detections as `sliced_infer` would have at `conf_threshold` and `iou_threshold`.
+
+    Detections below `conf_threshold` are dropped first. If the tiles were
+    suppressed at a more permissive `tile_iou`, NMS is run again within each
+    tile at `iou_threshold` before the tiles are merged.
+    """
+    mask = scores >= conf_threshold
+    boxes, scores, class_ids, tile_ids = boxes[mask], scores[mask], class_ids[mask], tile_ids[mask]
+    if not len(boxes):
+        return boxes, scores, class_ids
+
+    if tile_iou is not None and tile_iou > iou_threshold:
+        groups = tile_ids if agnostic else tile_ids * (int(class_ids.max()) + 1) + class_ids
+        keep = batched_nms(boxes, scores, groups, iou_threshold)
+        boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+
+    with timer("predict.merge"):
+        return merge_detections(boxes, scores, class_ids, iou_threshold, method=merge, agnostic=agnostic)
+
+
+def sliced_infer(backend, image, conf_threshold, iou_threshold, agnostic=False, tile_size=640,
+                 overlap=0.2, batch_size=8, merge='nms', include_full_image=True):
+    """
+    Run `backend` over overlapping tiles of `image` and merge the results in full-image coordinates.
+
+    See `infer_tiles` for how the tiles are run.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: [x1, y1, x2, y2] boxes, scores and class IDs.
+    """
+    boxes, scores, class_ids, _ = infer_tiles(
+        backend, image, conf_threshold, iou_threshold, agnostic=agnostic, tile_size=tile_size,
+        overlap=overlap, batch_size=batch_size, include_full_image=include_full_image,
+    )
+    if not len(boxes):
+        return boxes, scores, class_ids
+
+    with timer("predict.merge"):
+        return merge_detections(boxes, scores, class_ids, iou_threshold, method=merge, agnostic=agnostic)
@@ -0,0 +1,32 @@
+import torch
+from ultralytics import YOLO
+
+
+class UltralyticsBackend:
+    """Inference backend running `.pt` weights through the ultralytics PyTorch model."""
+
+    def __init__(self, model_path, device=None):
+        if device is None:
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        self.device = device
+        self.model = YOLO(model_path).to(device)
+
+    @property
+    def names(self):
+        return self.model.names
+
+    def infer(self, images, conf_threshold, iou_threshold, agnostic=False):
+        """
+        Run the model on a batch of RGB images.
+
+        Returns:
+            List[Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]]: Per image, the
+            [x1, y1, x2, y2] boxes, scores and class IDs after ultralytics' NMS.
+        """
+        results = self.model(
+            images, conf=conf_threshold, iou=iou_threshold, agnostic_nms=agnostic, verbose=False
+        )
+        return [
+            (r.boxes.xyxy.cpu().numpy(), r.boxes.conf.cpu().numpy(), r.boxes.cls.cpu().numpy())
+            for r in results
+        ]
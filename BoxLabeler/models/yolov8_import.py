@@ -1,50 +1,283 @@
-from tkinter import filedialog, messagebox
-from ultralytics import YOLO
-import numpy as np
-import torch
-import torchvision.ops
+import os
+
+from BoxLabeler.instrumentation import timer
+from BoxLabeler.models.postprocess import batched_nms, nms, postprocess
+from BoxLabeler.models.prediction_cache import PredictionCache
+from BoxLabeler.models.slicing import DEFAULT_SLICE_OPTIONS, infer_tiles, merge_tiles, sliced_infer
+from BoxLabeler.sources import is_archive_key, is_video_key, read_bytes, read_frame
+
+# When caching, the model is run with permissive thresholds so the stored raw
+# output can serve any later conf threshold above RAW_CONF_THRESHOLD and any IoU
+# threshold below CACHE_IOU_THRESHOLD without re-running inference.
+RAW_CONF_THRESHOLD = 0.01
+CACHE_IOU_THRESHOLD = 0.7
+
+
+def is_onnx_model(model_path):
+    return os.path.splitext(model_path)[1].lower() == '.onnx'
+
+
+def load_backend(model_path, device=None, num_threads=None):
+    """
+    Pick the inference backend for `model_path` from its extension.
+
+    `.onnx` models run on ONNX Runtime (CPU) with `num_threads` intra-op threads
+    (all cores by default), everything else through ultralytics. Backends are
+    imported here so only the selected runtime gets loaded.
+    """
+    if is_onnx_model(model_path):
+        from BoxLabeler.models.onnx_backend import OnnxBackend
+        return OnnxBackend(model_path, num_threads=num_threads)
+
+    from BoxLabeler.models.ultralytics_backend import UltralyticsBackend
+    return UltralyticsBackend(model_path, device=device)
+
 
 class YoloV8ImportModel:
-    def __init__(self):
+    def __init__(self, use_cache=True):
         self.model = None
         self.model_path = None
+        self.model_key = None
+        self.cache = PredictionCache() if use_cache else None
+        self.slice_options = None  # Sliced (tiled) inference is off by default
+
+    def set_slicing(self, enabled=True, **options):
+        """
+        Enable or disable sliced inference for high-resolution images.
+
+        Args:
+            enabled (bool): Whether to run the model on overlapping tiles.
+            **options: Overrides for DEFAULT_SLICE_OPTIONS: `tile_size`, `overlap`,
+                `batch_size`, `merge` ('nms' or 'wbf') and `include_full_image`.
+        """
+        if not enabled:
+            self.slice_options = None
+            return
+        unknown = set(options) - set(DEFAULT_SLICE_OPTIONS)
+        if unknown:
+            raise ValueError(f"Unknown slicing options: {', '.join(sorted(unknown))}")
+        self.slice_options = {**DEFAULT_SLICE_OPTIONS, **options}
+
+    def cache_key(self, image_path):
+        """
+        Prediction cache key of an image file; sliced and full-image outputs are cached separately.
+
+        Sliced entries hold the unmerged tile detections, so the merge method is not part of the key.
+        """
+        key = PredictionCache.image_key(image_path)
+        if self.slice_options:
+            options = self.slice_options
+            key += "-t{tile_size}-{overlap}-{include_full_image:d}".format(**options)
+        return key
 
     def import_model(self):
-        self.model_path = filedialog.askopenfilename(filetypes=[("YOLO model", "*.pt")])
-        if self.model_path:
+        # Tk is only needed for the interactive dialog; headless callers use load_model
+        from tkinter import filedialog, messagebox
+
+        model_path = filedialog.askopenfilename(filetypes=[("YOLO model", "*.pt"), ("ONNX model", "*.onnx")])
+        if model_path:
             try:
-                device = 'cuda' if torch.cuda.is_available() else 'cpu'
-                self.model = YOLO(self.model_path).to(device)
+                self.load_model(model_path)
                 return True
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load YOLO model:\n{e}")
         return False
 
-    def non_max_suppression(self, boxes, scores, iou_threshold):
+    def load_model(self, model_path, device=None, num_threads=None):
+        """
+        Load a YOLO model from `model_path` without any UI interaction.
+
+        Args:
+            model_path (str): Path to the `.pt` weights or an exported `.onnx` model.
+            device (str, optional): Torch device, defaults to CUDA when available.
+                Ignored by the ONNX backend, which always runs on CPU.
+            num_threads (int, optional): ONNX Runtime intra-op threads. Torch threads
+                are set process-wide with `torch.set_num_threads` instead.
+        """
+        self.model = load_backend(model_path, device=device, num_threads=num_threads)
+        self.model_path = model_path
+        self.model_key = PredictionCache.model_key(model_path) if self.cache else None
+
+    def warmup(self, image_size=None, runs=1):
+        """
+        Run the model on a blank image so lazy initialization is not paid by the first prediction.
+
+        Args:
+            image_size (Tuple[int, int], optional): (width, height) of the dummy input.
+                Defaults to the tile size when slicing is enabled, else the model input size.
+            runs (int): Number of warm-up passes.
+        """
+        if self.model is None:
+            raise ValueError("Model not imported. Please import a model first.")
+        if image_size is None:
+            if self.slice_options:
+                image_size = (self.slice_options['tile_size'],) * 2
+            else:
+                height, width = getattr(self.model, 'input_size', (640, 640))
+                image_size = (width, height)
+
+        import numpy as np
+
+        width, height = image_size
+        dummy = np.zeros((height, width, 3), dtype=np.uint8)
+        with timer("predict.warmup"):
+            for _ in range(runs):
+                self.model.infer([dummy], RAW_CONF_THRESHOLD, CACHE_IOU_THRESHOLD)
+
+    def non_max_suppression(self, boxes, scores, iou_threshold, class_ids=None, agnostic=True):
         """
         Perform Non-Maximum Suppression (NMS) on the bounding boxes.
 
         Args:
-            boxes (List[List[float]]): List of bounding boxes [x1, y1, x2, y2].
-            scores (List[float]): List of confidence scores for each bounding box.
+            boxes (numpy.ndarray): Bounding boxes [x1, y1, x2, y2].
+            scores (numpy.ndarray): Confidence scores for each bounding box.
             iou_threshold (float): IoU threshold for NMS.
+            class_ids (numpy.ndarray, optional): Class IDs, required for class-aware NMS.
+            agnostic (bool): Suppress overlapping boxes regardless of their class.
 
         Returns:
-            List[int]: Indices of bounding boxes to keep.
+            numpy.ndarray: Indices of bounding boxes to keep.
         """
-        if len(boxes) == 0:
-            return []
+        if class_ids is None:
+            return nms(boxes, scores, iou_threshold)
+        return batched_nms(boxes, scores, class_ids, iou_threshold, agnostic=agnostic)
 
-        # Convert to torch tensors for faster computation
-        boxes = torch.tensor(boxes)
-        scores = torch.tensor(scores)
+    def predict_arrays(self, image, iou_threshold=0.5, conf_threshold=0.5, apply_nms=False, agnostic=False,
+                       image_key=None):
+        """
+        Perform prediction on the given image and return the detections as arrays.
 
-        # Use torchvision's built-in NMS function
-        keep = torchvision.ops.nms(boxes, scores, iou_threshold)
+        `conf_threshold` and `iou_threshold` are passed to the backend, which
+        filters and suppresses candidates in its own NMS. The extra NumPy NMS pass is
+        only run when `apply_nms` is set. When slicing is enabled (see `set_slicing`)
+        the image is processed as batched overlapping tiles.
 
-        return keep.tolist()
+        Args:
+            image (numpy.ndarray): The input image in RGB format.
+            iou_threshold (float): IoU threshold for NMS.
+            conf_threshold (float): Confidence threshold for filtering predictions.
+            apply_nms (bool): Run an additional NMS pass over the model output.
+            agnostic (bool): Use class-agnostic instead of class-aware NMS.
+            image_key (str, optional): Prediction cache key of the image. Raw outputs
+                are only cached when a key is given.
+
+        Returns:
+            Detections: Boxes as [x, y, width, height], scores and class IDs.
+        """
+        if self.model is None:
+            raise ValueError("Model not imported. Please import a model first.")
+
+        caching = self.cache is not None and self.model_key is not None and image_key is not None
+        if caching:
+            conf, iou = RAW_CONF_THRESHOLD, max(iou_threshold, CACHE_IOU_THRESHOLD)
+        else:
+            conf, iou = conf_threshold, iou_threshold
+
+        tile_ids = None
+        with timer("predict.infer"):
+            if self.slice_options and caching:
+                # Cache the tile detections unmerged: every request merges them at its own thresholds
+                options = {k: v for k, v in self.slice_options.items() if k != 'merge'}
+                boxes, scores, classes, tile_ids = infer_tiles(
+                    self.model, image, conf, iou, agnostic=agnostic, **options
+                )
+            elif self.slice_options:
+                boxes, scores, classes = sliced_infer(
+                    self.model, image, conf, iou, agnostic=agnostic, **self.slice_options
+                )
+            else:
+                (boxes, scores, classes), = self.model.infer([image], conf, iou, agnostic=agnostic)
+
+        if caching:
+            with timer("predict.cache_store"):
+                self.cache.put(
+                    self.model_key, image_key, boxes, scores, classes, iou, agnostic=agnostic, tile_ids=tile_ids
+                )
+
+        with timer("predict.postprocess"):
+            return self.postprocess_raw(
+                boxes, scores, classes, tile_ids, iou, iou_threshold, conf_threshold, apply_nms, agnostic
+            )
+
+    def postprocess_raw(self, boxes, scores, classes, tile_ids, raw_iou, iou_threshold, conf_threshold,
+                        apply_nms, agnostic):
+        """
+        Turn raw model output, suppressed at `raw_iou`, into the detections for the requested thresholds.
+
+        Unmerged tile detections (`tile_ids` given) are filtered, suppressed again
+        within each tile and merged with the slicing merge method, as an uncached
+        sliced prediction at these thresholds would have been. Suppressing at
+        `raw_iou` then at `iou_threshold` may keep slightly different boxes than
+        suppressing at `iou_threshold` once.
+        """
+        if tile_ids is not None:
+            boxes, scores, classes = merge_tiles(
+                boxes, scores, classes, tile_ids, conf_threshold, iou_threshold, tile_iou=raw_iou,
+                merge=self.slice_options['merge'], agnostic=agnostic,
+            )
+            raw_iou = iou_threshold
+        return postprocess(
+            boxes, scores, classes, self.model.names,
+            conf_threshold=conf_threshold,
+            iou_threshold=iou_threshold,
+            apply_nms=apply_nms or raw_iou > iou_threshold,
+            agnostic=agnostic,
+        )
 
-    def predict(self, image, iou_threshold=0.5, conf_threshold=0.5):
+    def predict_file(self, image_path, iou_threshold=0.5, conf_threshold=0.5, apply_nms=False, agnostic=False):
+        """
+        Predict on an image file, serving raw outputs from the prediction cache when possible.
+
+        The image is only decoded on a cache miss.
+
+        Returns:
+            Detections: Boxes as [x, y, width, height], scores and class IDs.
+        """
+        if self.model is None:
+            raise ValueError("Model not imported. Please import a model first.")
+
+        image_key = None
+        if self.cache is not None and self.model_key is not None:
+            try:
+                image_key = self.cache_key(image_path)
+            except OSError:
+                image_key = None
+            with timer("predict.cache_lookup"):
+                cached = image_key and self.cache.get(
+                    self.model_key, image_key, iou_threshold=iou_threshold, agnostic=agnostic
+                )
+            if cached and (cached[4] is not None) == bool(self.slice_options):
+                boxes, scores, classes, cached_iou, tile_ids = cached
+                with timer("predict.postprocess"):
+                    return self.postprocess_raw(
+                        boxes, scores, classes, tile_ids, cached_iou, iou_threshold, conf_threshold,
+                        apply_nms, agnostic
+                    )
+
+        import cv2
+        import numpy as np
+
+        with timer("predict.decode"):
+            if is_video_key(image_path):
+                try:
+                    image_rgb = read_frame(image_path)  # Already RGB
+                except OSError as e:
+                    raise ValueError(str(e))
+            else:
+                if is_archive_key(image_path):
+                    image = cv2.imdecode(np.frombuffer(read_bytes(image_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+                else:
+                    image = cv2.imread(image_path)
+                if image is None:
+                    raise ValueError(f"Cannot read image: {image_path}")
+                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        return self.predict_arrays(
+            image_rgb, iou_threshold=iou_threshold, conf_threshold=conf_threshold,
+            apply_nms=apply_nms, agnostic=agnostic, image_key=image_key,
+        )
+
+    def predict(self, image, iou_threshold=0.5, conf_threshold=0.5, apply_nms=False, agnostic=False):
         """
         Perform prediction on the given image and return all detected bboxes.
 
@@ -52,46 +285,13 @@ class YoloV8ImportModel:
             image (numpy.ndarray): The input image in RGB format.
             iou_threshold (float): IoU threshold for NMS.
             conf_threshold (float): Confidence threshold for filtering predictions.
+            apply_nms (bool): Run an additional NMS pass over the model output.
+            agnostic (bool): Use class-agnostic instead of class-aware NMS.
 
         Returns:
             List[Dict]: A list of annotations with 'bbox', 'class', and 'confidence' keys.
         """
-        if self.model is None:
-            raise ValueError("Model not imported. Please import a model first.")
-
-        # Perform prediction using YOLO model
-        results = self.model(image, verbose=False)
-
-        # Storage for all detected bboxes
-        annotations = []
-
-        # Iterate through each result
-        for r in results:
-            boxes = r.boxes.xyxy.cpu().numpy()  # Bounding boxes
-            scores = r.boxes.conf.cpu().numpy()  # Confidence scores
-            classes = r.boxes.cls.cpu().numpy()  # Class IDs
-
-            # Filter out low-confidence predictions
-            filtered_indices = [i for i, score in enumerate(scores) if score >= conf_threshold]
-            boxes = boxes[filtered_indices]
-            scores = scores[filtered_indices]
-            classes = classes[filtered_indices]
-
-            # Apply NMS
-            keep = self.non_max_suppression(boxes, scores, iou_threshold)
-
-            for idx in keep:
-                x1, y1, x2, y2 = boxes[idx]
-                x1, y1, x2, y2 = float(x1), float(y1), float(x2), float(y2)
-                cls = int(classes[idx])
-                class_name = self.model.names[cls]
-                confidence = float(scores[idx])
-
-                # Append bbox with confidence
-                annotations.append({
-                    'bbox': [x1, y1, x2 - x1, y2 - y1],  # [x, y, width, height]
-                    'class': class_name,
-                    'confidence': confidence
-                })
-
-        return annotations
\ No newline at end of file
+        return self.predict_arrays(
+            image, iou_threshold=iou_threshold, conf_threshold=conf_threshold,
+            apply_nms=apply_nms, agnostic=agnostic,
+        ).to_dicts()
@@ -0,0 +1,171 @@
+"""
+Image sources: directories, archives and videos read in place.
+
+Images are addressed by keys, which is what annotations are stored under:
+a plain file path, "<archive path>::<member path>" for an image inside a
+zip or tar archive, or "<video path>::<video name>_<frame index>.jpg" for a
+video frame. The helpers below accept any kind of key, so loaders,
+exporters and models do not need to know where an image lives.
+"""
+
+import os
+import posixpath
+import shutil
+import threading
+
+from .base import ARCHIVE_SEPARATOR, IMAGE_EXTENSIONS, ImageSource, is_image_name
+from .directory_source import DirectorySource
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.m4v', '.webm', '.mpg', '.mpeg', '.ts')
+
+__all__ = [
+    'ARCHIVE_EXTENSIONS',
+    'ARCHIVE_SEPARATOR',
+    'IMAGE_EXTENSIONS',
+    'VIDEO_EXTENSIONS',
+    'ImageSource',
+    'DirectorySource',
+    'basename',
+    'copy_to',
+    'frame_size',
+    'exists',
+    'is_archive',
+    'is_archive_key',
+    'is_image_name',
+    'is_video',
+    'is_video_key',
+    'open_file',
+    'open_source',
+    'read_bytes',
+    'read_frame',
+    'split_key',
+    'stat_key',
+    'storage_dir',
+]
+
+# Archives and videos are indexed once per process and reused while the file is unchanged
+_containers = {}  # Archive or video path -> (mtime_ns, ImageSource)
+_containers_lock = threading.Lock()
+_files = DirectorySource(os.curdir)
+
+
+def is_archive(path):
+    return path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def is_video(path):
+    return path.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def _container_source(container_path):
+    mtime_ns = os.stat(container_path).st_mtime_ns
+    with _containers_lock:
+        cached = _containers.get(container_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        if container_path.lower().endswith('.zip'):
+            from .zip_source import ZipSource
+            source = ZipSource(container_path)
+        elif is_archive(container_path):
+            from .tar_source import TarSource
+            source = TarSource(container_path)
+        elif is_video(container_path):
+            from .video_source import VideoSource  # Needs OpenCV
+            source = VideoSource(container_path)
+        else:
+            raise ValueError(f"Unsupported archive or video: {container_path}")
+        # A stale source is not closed here: other threads may still be reading from it.
+        # Dropping the reference lets its map or capture be released once the last reader is done.
+        _containers[container_path] = (mtime_ns, source)
+        return source
+
+
+def open_source(path, video_stride=1):
+    """
+    Return the ImageSource for a directory, an archive or a video file.
+
+    `video_stride` keeps every n-th frame of videos, including the videos found in a directory.
+    """
+    if os.path.isdir(path):
+        return DirectorySource(path, video_stride=video_stride)
+    source = _container_source(os.path.abspath(path))
+    if is_video(path):
+        source.stride = video_stride
+    return source
+
+
+def split_key(key):
+    """Return (archive path, member) for archive keys and (None, key) for plain paths."""
+    archive, separator, member = key.partition(ARCHIVE_SEPARATOR)
+    return (archive, member) if separator else (None, key)
+
+
+def is_archive_key(key):
+    return ARCHIVE_SEPARATOR in key
+
+
+def is_video_key(key):
+    return is_video(split_key(key)[0] or '')
+
+
+def _source_for(key):
+    archive, _ = split_key(key)
+    return _container_source(archive) if archive else _files
+
+
+def read_bytes(key):
+    """Encoded image bytes (a read-only memoryview for memory-mapped archive members)."""
+    return _source_for(key).read_bytes(key)
+
+
+def read_frame(key):
+    """Decoded RGB array of a video frame key (shared with the frame cache, do not modify)."""
+    return _source_for(key).read_frame(key)
+
+
+def frame_size(key):
+    """(width, height) of the frames of a video frame key, known without decoding."""
+    return _source_for(key).frame_size
+
+
+def open_file(key):
+    return _source_for(key).open_file(key)
+
+
+def exists(key):
+    archive, _ = split_key(key)
+    if archive and not os.path.isfile(archive):
+        return False
+    return _source_for(key).exists(key)
+
+
+def basename(key):
+    archive, member = split_key(key)
+    return posixpath.basename(member) if archive else os.path.basename(key)
+
+
+def storage_dir(key):
+    """Directory next to the image (or its archive) where sidecar files such as annotations go."""
+    archive, _ = split_key(key)
+    return os.path.dirname(archive or key)
+
+
+def stat_key(key):
+    """(size, mtime_ns) identifying the current version of an image; archive members use the archive's mtime."""
+    archive, _ = split_key(key)
+    if archive:
+        return _container_source(archive).member_size(key), os.stat(archive).st_mtime_ns
+    st = os.stat(key)
+    return st.st_size, st.st_mtime_ns
+
+
+def copy_to(key, directory):
+    """Copy an image into `directory` under its base name. Returns the new path."""
+    destination = os.path.join(directory, basename(key))
+    if is_archive_key(key):
+        with open(destination, 'wb') as f:
+            f.write(read_bytes(key))
+    else:
+        shutil.copy(key, destination)
+    return destination
@@ -0,0 +1,67 @@
+import mmap
+import os
+import threading
+from abc import abstractmethod
+
+from BoxLabeler.sources.base import ARCHIVE_SEPARATOR, ImageSource
+
+
+class ArchiveSource(ImageSource):
+    """
+    Images inside an archive file, indexed once when the source is opened.
+
+    The archive is memory-mapped: members stored without compression are
+    returned as zero-copy memoryview slices of the map. Compressed members are
+    decompressed on demand, one at a time.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.members = {}  # Member path -> (data offset if stored uncompressed else None, size)
+        self._lock = threading.Lock()
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(self.path) else None
+        self._build_index()
+
+    @abstractmethod
+    def _build_index(self):
+        """Fill `self.members` from the archive's directory."""
+        pass
+
+    @abstractmethod
+    def _read_compressed(self, member):
+        """Decompressed bytes of a member that cannot be sliced out of the map."""
+        pass
+
+    def key(self, member):
+        return f"{self.path}{ARCHIVE_SEPARATOR}{member}"
+
+    def member(self, key):
+        return key.partition(ARCHIVE_SEPARATOR)[2]
+
+    def list_images(self):
+        return sorted(self.key(member) for member in self.members)
+
+    def exists(self, key):
+        return self.member(key) in self.members
+
+    def member_size(self, key):
+        return self.members[self.member(key)][1]
+
+    def read_bytes(self, key):
+        member = self.member(key)
+        if member not in self.members:
+            raise FileNotFoundError(f"{member} not found in {self.path}")
+        offset, size = self.members[member]
+        if offset is not None:
+            return memoryview(self._mmap)[offset:offset + size]
+        with self._lock:
+            return self._read_compressed(member)
+
+    def close(self):
+        try:
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass  # Slices still in use: the map is released with them
+        self._file.close()
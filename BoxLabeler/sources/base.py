@@ -0,0 +1,52 @@
+import io
+from abc import ABC, abstractmethod
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Separates an archive path from the member path in image keys: "/data/set.zip::train/0001.jpg"
+ARCHIVE_SEPARATOR = "::"
+
+
+def is_image_name(name):
+    return name.lower().endswith(IMAGE_EXTENSIONS)
+
+
+class ImageSource(ABC):
+    """
+    A collection of images addressed by string keys.
+
+    Keys are what annotations are stored under: absolute file paths for a
+    directory, "<archive path>::<member path>" for archive members.
+    """
+
+    @abstractmethod
+    def list_images(self):
+        """
+        Liệt kê các ảnh của nguồn.
+
+        :return: Sorted list of image keys.
+        """
+        pass
+
+    @abstractmethod
+    def read_bytes(self, key):
+        """
+        Đọc nội dung (đã mã hóa) của một ảnh.
+
+        :return: bytes, or a read-only memoryview for memory-mapped members.
+        """
+        pass
+
+    @abstractmethod
+    def exists(self, key):
+        pass
+
+    def open_file(self, key):
+        """Binary file object over the encoded image."""
+        return io.BytesIO(self.read_bytes(key))
+
+    def member_size(self, key):
+        return len(self.read_bytes(key))
+
+    def close(self):
+        pass
@@ -0,0 +1,43 @@
+import os
+
+from BoxLabeler.sources.base import ImageSource, is_image_name
+
+
+class DirectorySource(ImageSource):
+    """
+    Images of one directory (not recursive), keyed by absolute path.
+
+    Frames of the videos in the directory are listed as well, every `video_stride`-th one.
+    """
+
+    def __init__(self, directory, video_stride=1):
+        self.directory = os.path.abspath(directory)
+        self.video_stride = video_stride
+
+    def list_images(self):
+        from BoxLabeler import sources
+
+        images = []
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if is_image_name(name):
+                images.append(path)
+            elif sources.is_video(name) and os.path.isfile(path):
+                try:
+                    images.extend(sources.open_source(path, video_stride=self.video_stride).list_images())
+                except (OSError, ImportError) as e:
+                    print(f"Warning: skipping video {path}\n{e}")
+        return images
+
+    def read_bytes(self, key):
+        with open(key, 'rb') as f:
+            return f.read()
+
+    def open_file(self, key):
+        return open(key, 'rb')
+
+    def exists(self, key):
+        return os.path.exists(key)
+
+    def member_size(self, key):
+        return os.path.getsize(key)
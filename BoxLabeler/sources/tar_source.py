@@ -0,0 +1,35 @@
+import tarfile
+
+from BoxLabeler.sources.archive_source import ArchiveSource
+from BoxLabeler.sources.base import is_image_name
+
+
+class TarSource(ArchiveSource):
+    """
+    Images inside a tar archive.
+
+    Members of an uncompressed tar are always memory-mapped. Compressed tars
+    (.tar.gz, .tar.bz2, .tar.xz) have no random access, so reading a member
+    may decompress the archive up to it; extract those for interactive use.
+    """
+
+    def _build_index(self):
+        try:
+            self._tar = tarfile.open(fileobj=self._file, mode='r:')
+            compressed = False
+        except tarfile.ReadError:
+            self._file.seek(0)
+            self._tar = tarfile.open(fileobj=self._file, mode='r:*')
+            compressed = True
+
+        self._infos = {}
+        for info in self._tar.getmembers():
+            if not info.isfile() or not is_image_name(info.name):
+                continue
+            self.members[info.name] = (None if compressed else info.offset_data, info.size)
+            if compressed:
+                self._infos[info.name] = info
+
+    def _read_compressed(self, member):
+        with self._tar.extractfile(self._infos[member]) as f:
+            return f.read()
@@ -0,0 +1,108 @@
+import os
+import threading
+from collections import OrderedDict
+
+import cv2
+
+from BoxLabeler.sources.base import ARCHIVE_SEPARATOR, ImageSource
+
+# Typical size of a frame as encoded by `read_bytes` (JPEG, quality 95), per pixel
+JPEG_BYTES_PER_PIXEL = 0.4
+
+
+class VideoSource(ImageSource):
+    """
+    Frames of a video file, decoded on demand.
+
+    Frames are keyed "<video path>::<video name>_<frame index>.jpg", so they
+    export under unique file names. Reading a frame follows the decoder
+    position: short forward jumps are served by grabbing (decoding without
+    converting) the frames in between, which is cheaper than a seek, since
+    seeking restarts decoding at the previous keyframe. Longer or backward
+    jumps seek. The last `cache_frames` decoded frames are kept in an LRU
+    cache so that stepping back and forth does not decode again.
+
+    OpenCV does not expose keyframe positions, so `max_forward_grabs` stands in
+    for the typical keyframe interval (about 1-2 s of video).
+    """
+
+    def __init__(self, path, stride=1, cache_frames=32, max_forward_grabs=48):
+        self.path = os.path.abspath(path)
+        self.stride = stride
+        self.cache_frames = cache_frames
+        self.max_forward_grabs = max_forward_grabs
+        self.name = os.path.splitext(os.path.basename(self.path))[0]
+        self._cache = OrderedDict()  # Frame index -> RGB array
+        self._lock = threading.Lock()
+        self._capture = cv2.VideoCapture(self.path)
+        if not self._capture.isOpened():
+            raise OSError(f"Cannot open video: {self.path}")
+        self.frame_count = int(self._capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        self.fps = self._capture.get(cv2.CAP_PROP_FPS)
+        self.frame_size = (
+            int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
+        self._position = 0  # Index of the frame the next read returns
+
+    def key(self, frame_index):
+        return f"{self.path}{ARCHIVE_SEPARATOR}{self.name}_{frame_index:06d}.jpg"
+
+    def frame_index(self, key):
+        member = key.partition(ARCHIVE_SEPARATOR)[2]
+        return int(os.path.splitext(member)[0].rpartition('_')[2])
+
+    def list_images(self):
+        return [self.key(i) for i in range(0, self.frame_count, max(1, self.stride))]
+
+    def exists(self, key):
+        try:
+            return 0 <= self.frame_index(key) < self.frame_count
+        except ValueError:
+            return False
+
+    def member_size(self, key):
+        # Frames have no stored size: estimate the JPEG `read_bytes` returns, so that
+        # exporters sizing samples by it (e.g. WebDataset shards) plan per frame
+        width, height = self.frame_size
+        return max(int(width * height * JPEG_BYTES_PER_PIXEL), 1)
+
+    def read_frame(self, key):
+        """Decoded frame as an RGB array (shared with the cache, do not modify)."""
+        index = self.frame_index(key)
+        with self._lock:
+            frame = self._cache.get(index)
+            if frame is not None:
+                self._cache.move_to_end(index)
+                return frame
+
+            skip = index - self._position if self._position is not None else -1
+            if not 0 <= skip <= self.max_forward_grabs:
+                self._capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+                skip = 0
+            for _ in range(skip):
+                self._capture.grab()
+            ok, bgr = self._capture.read()
+            if not ok:
+                self._position = None  # Unknown: seek on the next read
+                raise OSError(f"Cannot read frame {index} of {self.path}")
+            self._position = index + 1
+
+            frame = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            self._cache[index] = frame
+            if len(self._cache) > self.cache_frames:
+                self._cache.popitem(last=False)
+            return frame
+
+    def read_bytes(self, key):
+        """The frame encoded as JPEG, for exporters that copy image files."""
+        ok, encoded = cv2.imencode('.jpg', cv2.cvtColor(self.read_frame(key), cv2.COLOR_RGB2BGR),
+                                   [cv2.IMWRITE_JPEG_QUALITY, 95])
+        if not ok:
+            raise OSError(f"Cannot encode frame of {self.path}")
+        return encoded.tobytes()
+
+    def close(self):
+        with self._lock:
+            self._capture.release()
+            self._cache.clear()
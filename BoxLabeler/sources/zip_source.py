@@ -0,0 +1,28 @@
+import struct
+import zipfile
+
+from BoxLabeler.sources.archive_source import ArchiveSource
+from BoxLabeler.sources.base import is_image_name
+
+_LOCAL_HEADER_SIZE = 30
+
+
+class ZipSource(ArchiveSource):
+    def _build_index(self):
+        self._zip = zipfile.ZipFile(self._file)
+        for info in self._zip.infolist():
+            if info.is_dir() or not is_image_name(info.filename):
+                continue
+            offset = None
+            if info.compress_type == zipfile.ZIP_STORED and not info.flag_bits & 0x1:  # Stored, not encrypted
+                offset = self._data_offset(info)
+            self.members[info.filename] = (offset, info.file_size)
+
+    def _data_offset(self, info):
+        # The local header repeats the name and may carry a different extra field than the central directory
+        header = self._mmap[info.header_offset:info.header_offset + _LOCAL_HEADER_SIZE]
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        return info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length
+
+    def _read_compressed(self, member):
+        return self._zip.read(member)
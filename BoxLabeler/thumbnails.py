@@ -0,0 +1,134 @@
+import hashlib
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from BoxLabeler.sources import is_video_key, open_file, read_frame, stat_key
+from BoxLabeler.utils.image_size import get_image_size
+
+DEFAULT_THUMBNAIL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "boxlabeler", "thumbnails")
+DEFAULT_THUMBNAIL_SIZE = 160
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ThumbnailCache:
+    """
+    Persistent on-disk thumbnail cache keyed by image path and modification time.
+
+    Thumbnails are generated by a small thread pool. JPEGs are decoded in draft
+    mode, which lets libjpeg downscale by up to 8x while decoding instead of
+    decoding the full image first. A cache hit only reads the image header (or
+    nothing, for video frames) to report the original size. When the cache
+    grows past `max_bytes` the least recently used thumbnails are evicted.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_THUMBNAIL_DIR, size=DEFAULT_THUMBNAIL_SIZE, max_workers=4,
+                 max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.max_bytes = max_bytes
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail")
+        self._lock = threading.Lock()
+        self._total_bytes = None
+
+    def _cache_path(self, image_path):
+        _, mtime_ns = stat_key(image_path)
+        raw = f"{os.path.abspath(image_path)}|{mtime_ns}|{self.size}"
+        key = hashlib.sha1(raw.encode('utf8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + '.jpg')
+
+    def load(self, image_path):
+        """
+        Return the thumbnail of `image_path` and the original image size, generating it on a miss.
+
+        Returns:
+            Tuple[PIL.Image.Image, Tuple[int, int]]: RGB thumbnail and original (width, height).
+        """
+        cache_path = self._cache_path(image_path)
+        if os.path.isfile(cache_path):
+            try:
+                with Image.open(cache_path) as cached:
+                    thumbnail = cached.convert("RGB")
+            except OSError:
+                pass  # Corrupt cache entry: regenerate it
+            else:
+                try:
+                    os.utime(cache_path)  # Mark as recently used for eviction
+                except OSError:
+                    pass
+                return thumbnail, get_image_size(image_path)
+
+        if is_video_key(image_path):
+            thumbnail = Image.fromarray(read_frame(image_path))
+            original_size = thumbnail.size
+            thumbnail.thumbnail((self.size, self.size), Image.BILINEAR)
+        else:
+            with open_file(image_path) as f, Image.open(f) as img:
+                original_size = img.size  # Header only
+                img.draft("RGB", (self.size, self.size))
+                thumbnail = img.convert("RGB")
+                thumbnail.thumbnail((self.size, self.size), Image.BILINEAR)
+
+        self._store(cache_path, thumbnail)
+        return thumbnail, original_size
+
+    def _store(self, cache_path, thumbnail):
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                thumbnail.save(f, format="JPEG", quality=85)
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    # ==================== Eviction ==================== #
+    def _entries(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.jpg'):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, st.st_size, st.st_mtime
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least recently used thumbnails until the cache is below 90% of its budget."""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._total_bytes = total
+
+    def request(self, image_path):
+        """Load the thumbnail in the background. Returns a concurrent.futures.Future."""
+        return self.executor.submit(self.load, image_path)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
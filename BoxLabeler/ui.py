@@ -26,16 +26,66 @@ import json
 import random
 import tkinter as tk
 from tkinter import filedialog, messagebox, font, ttk
-from PIL import Image, ImageTk
-import cv2
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 import threading
 
 import datetime
 
 from BoxLabeler.annotations.image_annotation import ImageAnnotation
+from BoxLabeler.annotations.annotation_store import AnnotationStore
 from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.checkpoint import PredictionCheckpoint
+from BoxLabeler.annotations.merge import merge_predictions
+from BoxLabeler.annotations.propagation import next_track_id, propagate_forward
+from BoxLabeler.annotations.uncertainty import UNCERTAINTY_METHODS, rank_by_uncertainty
+from BoxLabeler.annotations.validation import fix_annotations, validate_annotations
 from BoxLabeler.exporters import get_exporter
+from BoxLabeler.frame_scheduler import FrameScheduler
+from BoxLabeler.grid_browser import ThumbnailGrid
+from BoxLabeler.importers import get_importer
+from BoxLabeler.instrumentation import instrumentation, timed
+from BoxLabeler import sources
 from BoxLabeler.models.yolov8_import import YoloV8ImportModel
+from BoxLabeler.utils.box_ops import xywh_to_xyxy
+from BoxLabeler.utils.image_decode import decode_image
+from BoxLabeler.utils.image_size import get_image_size
+
+AUTO_PREDICT_SCOPES = [
+    ("All images", "all"),
+    ("Unlabeled images only", "unlabeled"),
+    ("Images in current filter", "filter"),
+    ("Selected images", "selection"),
+]
+
+# Interval (ms) at which the UI thread applies auto-predict results
+AUTO_PREDICT_DRAIN_MS = 100
+
+# Detections down to this confidence continue tracks during label propagation; below
+# the propagation's acceptance threshold they are left for review
+PROPAGATION_CONF_THRESHOLD = 0.25
+
+# Interval (ms) at which the UI thread checks whether label propagation or a label import has finished
+BACKGROUND_POLL_MS = 100
+
+# In merge mode, a prediction overlapping an existing box at least this much is dropped
+MERGE_IOU_THRESHOLD = 0.5
+
+# Level of detail: smallest on-screen box size (px) that gets a label, and handle half-size
+LABEL_MIN_BOX_SIZE = 30
+HANDLE_SIZE = 6
+
+# Timers shown in the live performance readout
+PERF_READOUT_TIMERS = [
+    "ui.load_image",
+    "ui.display_image",
+    "ui.draw_existing_bboxes",
+    "ui.apply_filter",
+    "ui.frame",
+    "predict.decode",
+    "predict.infer",
+    "predict.postprocess",
+]
 
 class ObjectDetectionLabeler:
     def __init__(self, master):
@@ -46,15 +96,28 @@ class ObjectDetectionLabeler:
         self.label_colors = {}
         self.filter_mode = "All"
         self.current_image = None
-        self.original_image = None  # Original image storage
+        self.original_image = None  # Decoded image, possibly at a reduced JPEG scale
+        self.image_size = None  # (width, height) of the image file; boxes use these pixels
+        self.decoded_scale = 1.0  # original_image width / image_size width
+        self.decoded_path = None
         self.scaled_image = None
+        self.scaled_source = None  # Decoded image scaled_image was resampled from
         self.photo = None
         self.image_list = []
         self.filtered_image_list = []
+        self.source_generation = 0  # Bumped whenever another directory, archive or video is opened
         self.current_image_index = 0
-        self.annotations = {}
+        self.annotations = AnnotationStore()  # Written only on the UI thread
         self.current_bbox = None
         self.bbox_items = []
+        self.screen_boxes = None  # (N, 4) canvas [x1, y1, x2, y2] of the current image's boxes
+        self.hover_bbox_index = None  # Box under the pointer in edit mode
+        self.culled = False  # Some boxes were outside the viewport at the last draw
+        self.drawn_viewport = None
+        self.overlay_layer = None  # Transparent viewport-sized image the rasterized outlines are drawn on
+        self.overlay_photo = None
+        self.label_font = None
+        self.raster_label_font = None
         self.history = []
         self.edit_mode = False  # Control Edit mode
         self.zoom_level = 1.0    # Current zoom level (used for display)
@@ -71,6 +134,8 @@ class ObjectDetectionLabeler:
         
         self.yolov8_model = YoloV8ImportModel()
         self.current_model = None  # Initialize current_model
+        self.model_load_token = 0  # Identifies the latest background model load
+        self.thumbnail_grid = None  # Grid browser window, when open
         
         # Position of the image on the canvas
         self.image_x = 0
@@ -79,10 +144,36 @@ class ObjectDetectionLabeler:
         # Control Variables
         self.auto_resize = tk.BooleanVar(value=True)  # Default to checked
         self.auto_next = tk.BooleanVar()
+        self.sliced_inference = tk.BooleanVar()  # Tile high-resolution images for prediction
+        self.merge_predictions = tk.BooleanVar()  # Predictions add to existing boxes instead of replacing them
+        self.show_perf_readout = tk.BooleanVar(value=instrumentation.enabled)
+        self.warmup_runs = tk.IntVar(value=1)  # Warm-up passes after loading a model
+        self.validate_before_export = tk.BooleanVar(value=True)
+        self.raster_threshold = tk.IntVar(value=1000)  # Visible boxes above which outlines are rasterized
+        self.uncertainty_method = tk.StringVar(value="entropy")  # Ranking of the Uncertain filter
+        self.video_stride = tk.IntVar(value=1)  # Label every n-th frame of opened videos
+        self.propagation_window = tk.IntVar(value=10)  # Images Propagate Labels Forward fills in
 
         # Variables for Auto Predict
         self.auto_predict_thread = None
         self.auto_predict_cancel_flag = False
+        self.auto_predict_images = None  # image_list the running auto predict started from
+        self.auto_predict_generation = None  # source_generation the running auto predict belongs to
+        self.auto_predict_edited = set()  # Images the operator changed during the run
+        self.auto_predict_merge = False  # Merge results into existing boxes instead of replacing them
+        self.auto_predict_done = 0
+        self.auto_predict_skipped = 0
+        self.auto_predict_error = None
+        self.auto_predict_checkpoint = None
+
+        # Variables for label propagation
+        self.propagation_thread = None
+        self.propagation_result = None  # (propagated annotations, report), or the error raised
+        self.propagation_edited = set()  # Images the operator changed during the run
+
+        # Label import running in the background
+        self.label_import_thread = None
+        self.label_import_result = None  # Imported annotations, or the error raised
 
         # Dictionary to store color images for Treeview
         self.color_images = {}
@@ -109,28 +200,73 @@ class ObjectDetectionLabeler:
         file_menu = tk.Menu(parent_menu, tearoff=0)
         parent_menu.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Open Directory", command=self.open_directory)
+        file_menu.add_command(label="Open Archive", command=self.open_archive)
+        file_menu.add_command(label="Open Video", command=self.open_video)
+        stride_menu = tk.Menu(file_menu, tearoff=0)
+        file_menu.add_cascade(label="Video Frame Stride", menu=stride_menu)
+        for stride in (1, 2, 5, 10, 30):
+            stride_menu.add_radiobutton(
+                label="Every frame" if stride == 1 else f"Every {stride} frames",
+                variable=self.video_stride, value=stride
+            )
         file_menu.add_command(label="Load Annotations", command=self.load_annotations)
+        import_labels_menu = tk.Menu(file_menu, tearoff=0)
+        file_menu.add_cascade(label="Import Labels", menu=import_labels_menu)
+        import_labels_menu.add_command(label="YOLO txt Directory", command=lambda: self.import_labels("yolov8"))
+        import_labels_menu.add_command(label="Pascal VOC Directory", command=lambda: self.import_labels("pascal_voc"))
         file_menu.add_command(label="Save Annotations", command=self.save_annotations_auto)
         export_menu = tk.Menu(file_menu, tearoff=0)
         file_menu.add_cascade(label="Export", menu=export_menu)
-        export_options = ["COCO", "Dataset_COCO", "TFRecord", "YOLO v8", "Pascal VOC", "Excel"]
-        export_formats = ["coco", "dataset_coco", "tfrecord", "yolov8", "pascal_voc", "excel"]
+        export_options = ["COCO", "Dataset_COCO", "TFRecord", "YOLO v8", "Pascal VOC", "Excel", "WebDataset Shards", "Binary (memmap)"]
+        export_formats = ["coco", "dataset_coco", "tfrecord", "yolov8", "pascal_voc", "excel", "webdataset", "binary"]
         for fmt, label in zip(export_formats, export_options):
             export_menu.add_command(label=f"Export to {label}", command=lambda f=fmt: self.export(f))
+        export_menu.add_separator()
+        export_menu.add_checkbutton(label="Validate Before Export", variable=self.validate_before_export)
+        file_menu.add_command(label="Validate Annotations", command=self.validate_dataset)
       
     def create_view_menu(self, parent_menu):
         view_menu = tk.Menu(parent_menu, tearoff=0)
         parent_menu.add_cascade(label="View", menu=view_menu)
-        view_modes = ["All Images", "Unlabeled Images", "Labeled Images"]
-        modes = ["All", "Unlabeled", "Labeled"]
+        view_modes = ["All Images", "Unlabeled Images", "Labeled Images", "Uncertain Images (Review Queue)"]
+        modes = ["All", "Unlabeled", "Labeled", "Uncertain"]
         for mode_label, mode in zip(view_modes, modes):
             view_menu.add_command(label=mode_label, command=lambda m=mode: self.set_filter_mode(m))
+        uncertainty_menu = tk.Menu(view_menu, tearoff=0)
+        view_menu.add_cascade(label="Uncertainty Measure", menu=uncertainty_menu)
+        for method in UNCERTAINTY_METHODS:
+            uncertainty_menu.add_radiobutton(
+                label=method.replace("_", " ").capitalize(), variable=self.uncertainty_method, value=method,
+                command=self.on_uncertainty_method_change
+            )
+        view_menu.add_separator()
+        view_menu.add_command(label="Grid Browser", command=self.open_thumbnail_grid)
+        raster_menu = tk.Menu(view_menu, tearoff=0)
+        view_menu.add_cascade(label="Rasterize Boxes Above", menu=raster_menu)
+        for count in (250, 1000, 5000):
+            raster_menu.add_radiobutton(
+                label=f"{count} boxes", variable=self.raster_threshold, value=count,
+                command=self.display_image
+            )
+        view_menu.add_separator()
+        view_menu.add_checkbutton(
+            label="Performance Readout",
+            variable=self.show_perf_readout,
+            command=self.on_perf_readout_toggle
+        )
+        view_menu.add_command(label="Dump Timings...", command=self.dump_timings)
 
     def create_edit_menu(self, parent_menu):
         edit_menu = tk.Menu(parent_menu, tearoff=0)
         parent_menu.add_cascade(label="Edit", menu=edit_menu)
         edit_menu.add_command(label="Toggle Edit Mode", command=self.toggle_edit_mode)
         edit_menu.add_separator()
+        edit_menu.add_command(label="Propagate Labels Forward", command=self.propagate_labels)
+        window_menu = tk.Menu(edit_menu, tearoff=0)
+        edit_menu.add_cascade(label="Propagation Window", menu=window_menu)
+        for window in (5, 10, 25, 50):
+            window_menu.add_radiobutton(label=f"{window} images", variable=self.propagation_window, value=window)
+        edit_menu.add_separator()
         edit_menu.add_command(label="++Zoom In++", command=lambda: self.zoom(1.2))
         edit_menu.add_command(label="--Zoom Out--", command=lambda: self.zoom(0.8))
         edit_menu.add_command(label="Reset Zoom", command=self.reset_zoom)
@@ -138,6 +274,24 @@ class ObjectDetectionLabeler:
     def create_import_menu(self, parent_menu):
         import_menu = tk.Menu(parent_menu, tearoff=0)
         import_menu.add_command(label="YOLO_v8", command=self.import_yolov8_model)
+        warmup_menu = tk.Menu(import_menu, tearoff=0)
+        import_menu.add_cascade(label="Model Warm-up", menu=warmup_menu)
+        for runs in (0, 1, 3):
+            warmup_menu.add_radiobutton(
+                label="Disabled" if runs == 0 else f"{runs} pass{'es' if runs > 1 else ''}",
+                variable=self.warmup_runs,
+                value=runs
+            )
+        import_menu.add_separator()
+        import_menu.add_checkbutton(
+            label="Sliced Inference (High-Res)",
+            variable=self.sliced_inference,
+            command=self.on_sliced_inference_toggle
+        )
+        import_menu.add_checkbutton(
+            label="Merge Predictions with Existing Boxes",
+            variable=self.merge_predictions
+        )
         parent_menu.add_cascade(label="Import", menu=import_menu)
 
     def create_info_menu(self, parent_menu):
@@ -180,12 +334,17 @@ class ObjectDetectionLabeler:
         self.h_scroll.pack(side=tk.BOTTOM, fill=tk.X)
         self.v_scroll = tk.Scrollbar(canvas_area, orient=tk.VERTICAL, command=self.canvas.yview)
         self.v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
-        self.canvas.configure(xscrollcommand=self.h_scroll.set, yscrollcommand=self.v_scroll.set)
+        self.canvas.configure(
+            xscrollcommand=lambda *args: (self.h_scroll.set(*args), self.on_canvas_scrolled()),
+            yscrollcommand=lambda *args: (self.v_scroll.set(*args), self.on_canvas_scrolled())
+        )
 
         # Bind canvas events
-        self.canvas.bind('<Motion>', self.show_crosshair)
+        # Motion handlers run at most once per frame with the latest pointer position
+        self.frame_scheduler = FrameScheduler(self.canvas)
+        self.canvas.bind('<Motion>', self.on_pointer_motion)
         self.canvas.bind("<ButtonPress-1>", self.on_mouse_down)
-        self.canvas.bind("<B1-Motion>", self.on_mouse_move)
+        self.canvas.bind("<B1-Motion>", lambda e: self.frame_scheduler.schedule("drag", self.on_mouse_move, e))
         self.canvas.bind("<ButtonRelease-1>", self.on_mouse_up)
         self.canvas.bind("<Button-3>", self.on_right_click)  # Right-click to edit label
 
@@ -285,6 +444,10 @@ class ObjectDetectionLabeler:
         for i, (text, cmd) in enumerate(buttons):
             button = tk.Button(button_frame, text=text, command=cmd)
             button.grid(row=0, column=i, padx=5)
+            if cmd == self.predict:
+                # Enabled once a model is loaded
+                self.predict_button = button
+                button.config(state='disabled')
         
         # Center the buttons by configuring grid weights
         total_buttons = len(buttons)
@@ -302,6 +465,11 @@ class ObjectDetectionLabeler:
         self.image_counter = tk.Label(parent, text="Image: 0 / 0")
         self.image_counter.pack(anchor='center', pady=2)
 
+        self.perf_label = tk.Label(parent, text="", fg='gray25', font=('Courier', 9))
+        if self.show_perf_readout.get():
+            self.perf_label.pack(anchor='center', pady=2)
+            self.master.after(500, self.update_perf_readout)
+
     def setup_extra_controls(self, parent):
         # Auto-next Checkbox
         self.auto_next_checkbox = tk.Checkbutton(parent, text="Auto-next after bbox", variable=self.auto_next)
@@ -324,10 +492,18 @@ class ObjectDetectionLabeler:
         self.auto_predict_button = tk.Button(
             auto_predict_frame, 
             text="Auto Predict", 
-            command=self.auto_predict
+            command=self.auto_predict,
+            state='disabled'  # Enabled once a model is loaded
         )
         self.auto_predict_button.pack()
 
+        # Model loading indicator, only shown while a model loads in the background
+        self.model_status_frame = tk.Frame(auto_predict_frame)
+        self.model_status_label = tk.Label(self.model_status_frame, text="")
+        self.model_status_label.pack(side=tk.LEFT, padx=5)
+        self.model_progress = ttk.Progressbar(self.model_status_frame, mode="indeterminate", length=120)
+        self.model_progress.pack(side=tk.LEFT)
+
     def bind_shortcuts(self):
         # Keyboard shortcuts
         self.master.bind_all("<Control-z>", lambda event: self.undo())
@@ -397,6 +573,11 @@ class ObjectDetectionLabeler:
                 if hasattr(self, 'crosshair_v'):
                     self.canvas.coords(self.crosshair_v, 0, 0, 0, 0)
 
+    def on_pointer_motion(self, event):
+        self.frame_scheduler.schedule("crosshair", self.show_crosshair, event)
+        if self.edit_mode:
+            self.frame_scheduler.schedule("hover", self.update_hover, event)
+
     def on_mouse_down(self, event):
         image_rel_x, image_rel_y = self.get_image_relative_coords(event.x, event.y)
         
@@ -433,7 +614,7 @@ class ObjectDetectionLabeler:
                 self.resizing = True
                 self.resize_start_x, self.resize_start_y = self.get_image_relative_coords(event.x, event.y)
                 orig_bbox = self.annotations[self.current_image_path()].bboxes[bbox_index]
-                self.original_bbox = BoundingBox(orig_bbox.x, orig_bbox.y, orig_bbox.w, orig_bbox.h, orig_bbox.category_id)
+                self.original_bbox = orig_bbox.copy()
                 break
 
     def initiate_move(self, event, tags):
@@ -455,7 +636,7 @@ class ObjectDetectionLabeler:
                     self.moving = True
                     self.move_start_x, self.move_start_y = self.get_image_relative_coords(event.x, event.y)
                     orig_bbox = self.annotations[self.current_image_path()].bboxes[bbox_index]
-                    self.original_bbox = BoundingBox(orig_bbox.x, orig_bbox.y, orig_bbox.w, orig_bbox.h, orig_bbox.category_id)
+                    self.original_bbox = orig_bbox.copy()
                     self.move_bbox_index = bbox_index
                     break
                 except (IndexError, ValueError):
@@ -489,24 +670,19 @@ class ObjectDetectionLabeler:
         dx = (img_x - self.resize_start_x) / self.zoom_level
         dy = (img_y - self.resize_start_y) / self.zoom_level
         bbox = self.annotations[self.current_image_path()].bboxes[self.selected_bbox_index]
+        orig = self.original_bbox
+        x1, y1, x2, y2 = orig.x, orig.y, orig.x + orig.w, orig.y + orig.h
         
-        # Adjust based on which corner is being resized
-        if self.resize_corner == 'tl':
-            bbox.x = max(0, self.original_bbox.x + dx)
-            bbox.y = max(0, self.original_bbox.y + dy)
-            bbox.w = max(1, self.original_bbox.w - dx)
-            bbox.h = max(1, self.original_bbox.h - dy)
-        elif self.resize_corner == 'tr':
-            bbox.y = max(0, self.original_bbox.y + dy)
-            bbox.w = max(1, self.original_bbox.w + dx)
-            bbox.h = max(1, self.original_bbox.h - dy)
-        elif self.resize_corner == 'bl':
-            bbox.x = max(0, self.original_bbox.x + dx)
-            bbox.w = max(1, self.original_bbox.w - dx)
-            bbox.h = max(1, self.original_bbox.h + dy)
-        elif self.resize_corner == 'br':
-            bbox.w = max(1, self.original_bbox.w + dx)
-            bbox.h = max(1, self.original_bbox.h + dy)
+        # Move the dragged corner's edges, keeping them inside the image and at least 1 px apart
+        if self.resize_corner in ('tl', 'bl'):
+            x1 = min(max(0, x1 + dx), x2 - 1)
+        else:
+            x2 = max(min(self.image_size[0], x2 + dx), x1 + 1)
+        if self.resize_corner in ('tl', 'tr'):
+            y1 = min(max(0, y1 + dy), y2 - 1)
+        else:
+            y2 = max(min(self.image_size[1], y2 + dy), y1 + 1)
+        bbox.x, bbox.y, bbox.w, bbox.h = x1, y1, x2 - x1, y2 - y1
         
         self.display_image()
 
@@ -514,8 +690,8 @@ class ObjectDetectionLabeler:
         dx = (img_x - self.move_start_x) / self.zoom_level
         dy = (img_y - self.move_start_y) / self.zoom_level
         bbox = self.annotations[self.current_image_path()].bboxes[self.selected_bbox_index]
-        bbox.x = max(0, min(self.original_bbox.x + dx, self.original_image.width - bbox.w))
-        bbox.y = max(0, min(self.original_bbox.y + dy, self.original_image.height - bbox.h))
+        bbox.x = max(0, min(self.original_bbox.x + dx, self.image_size[0] - bbox.w))
+        bbox.y = max(0, min(self.original_bbox.y + dy, self.image_size[1] - bbox.h))
         self.display_image()
 
     def update_annotation_bbox(self, event, img_x, img_y):
@@ -529,6 +705,7 @@ class ObjectDetectionLabeler:
         # Do not call self.display_image() here
 
     def on_mouse_up(self, event):
+        self.frame_scheduler.flush()  # Apply the last drag position before finishing
         image_rel_x, image_rel_y = self.get_image_relative_coords(event.x, event.y)
         
         if self.edit_mode:
@@ -538,7 +715,7 @@ class ObjectDetectionLabeler:
 
     def handle_edit_mode_mouse_up(self):
         if self.resizing:
-            self.history.append((
+            self.push_history((
                 'resize_bbox', 
                 self.current_image_path(), 
                 self.selected_bbox_index, 
@@ -548,7 +725,7 @@ class ObjectDetectionLabeler:
             self.selected_bbox_index = None
             self.resize_corner = None
         elif self.moving:
-            self.history.append((
+            self.push_history((
                 'move_bbox', 
                 self.current_image_path(), 
                 self.selected_bbox_index, 
@@ -574,7 +751,7 @@ class ObjectDetectionLabeler:
             color = self.get_color_for_label(label)
             self.canvas.itemconfig(self.current_bbox, outline=color)
             
-            self.history.append(('add', image_path, new_bbox))
+            self.push_history(('add', image_path, new_bbox))
             self.update_label_counts()
             self.apply_filter()
             
@@ -596,6 +773,11 @@ class ObjectDetectionLabeler:
                         bbox = self.annotations[self.current_image_path()].bboxes[bbox_index]
                         self.show_label_edit_menu(event, bbox_index, bbox)
                         return
+            # Rasterized boxes have no canvas items: hit-test the box arrays instead
+            bbox_index = self.bbox_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y))
+            if bbox_index is not None:
+                bbox = self.annotations[self.current_image_path()].bboxes[bbox_index]
+                self.show_label_edit_menu(event, bbox_index, bbox)
 
     def extract_bbox_index(self, tags):
         for tag in tags:
@@ -635,7 +817,7 @@ class ObjectDetectionLabeler:
     def open_directory(self):
         directory = filedialog.askdirectory()
         if directory:
-            self.load_images_from_directory(directory)
+            self.load_images_from_source(directory)
             if self.image_list:
                 self.current_image_index = 0
                 self.set_filter_mode("All")
@@ -644,29 +826,67 @@ class ObjectDetectionLabeler:
             else:
                 messagebox.showinfo("Info", "No images found in the selected directory.")
 
-    def load_images_from_directory(self, directory):
-        self.image_list = sorted([
-            os.path.abspath(os.path.join(directory, f)) 
-            for f in os.listdir(directory) 
-            if f.lower().endswith(('.png', '.jpg', '.jpeg'))
-        ])
+    def open_archive(self):
+        archive_path = filedialog.askopenfilename(
+            filetypes=[("Image archives", " ".join(f"*{ext}" for ext in sources.ARCHIVE_EXTENSIONS))]
+        )
+        if archive_path:
+            self.open_container(archive_path, "archive")
+
+    def open_video(self):
+        video_path = filedialog.askopenfilename(
+            filetypes=[("Videos", " ".join(f"*{ext}" for ext in sources.VIDEO_EXTENSIONS))]
+        )
+        if video_path:
+            self.open_container(video_path, "video")
+
+    def open_container(self, path, kind):
+        try:
+            self.load_images_from_source(path)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to open {kind}: {e}")
+            return
+        if self.image_list:
+            self.current_image_index = 0
+            self.set_filter_mode("All")
+            self.load_image()
+            self.update_ui()
+        else:
+            messagebox.showinfo("Info", f"No images found in the selected {kind}.")
+
+    def load_images_from_source(self, path):
+        # Archive members and video frames are read on demand, never extracted
+        self.image_list = sources.open_source(path, video_stride=self.video_stride.get()).list_images()
+        self.source_generation += 1
         self.filtered_image_list = self.image_list.copy()
 
+    @timed("ui.load_image")
     def load_image(self):
         if 0 <= self.current_image_index < len(self.filtered_image_list):
             image_path = self.current_image_path()
+            self.user_zoom_level = 1.0  # Reset user zoom level when loading a new image
             try:
-                self.original_image = Image.open(image_path).convert("RGB")  # Original image storage
+                # Decode only the resolution the canvas will show at the initial zoom
+                self.canvas.update_idletasks()
+                width, height = get_image_size(image_path)
+                scale = self.calculate_scale_factor(
+                    width, height, self.canvas.winfo_width(), self.canvas.winfo_height()
+                )
+                self.decode_image(image_path, scale)
             except Exception as e:
                 messagebox.showerror("Error", f"Cannot load image:\n{e}")
                 return
 
-            self.user_zoom_level = 1.0  # Reset user zoom level when loading a new image
             self.display_image()  # Use the stored image for display
             self.update_ui()  # Update UI after displaying the image
         else:
             self.clear_canvas()
 
+    def decode_image(self, image_path, scale):
+        self.original_image, self.image_size = decode_image(image_path, scale)
+        self.decoded_scale = self.original_image.width / self.image_size[0]
+        self.decoded_path = image_path
+
     def clear_canvas(self):
         self.canvas.delete("all")
         self.canvas.create_text(
@@ -687,8 +907,13 @@ class ObjectDetectionLabeler:
         self.filter_indicator.config(text=f"Filter: {mode} Images")
         self.apply_filter()
 
+    def on_uncertainty_method_change(self):
+        if self.filter_mode == "Uncertain":
+            self.apply_filter()
+
+    @timed("ui.apply_filter")
     def apply_filter(self):
-        self.image_list = [img for img in self.image_list if os.path.exists(img)]
+        self.image_list = [img for img in self.image_list if sources.exists(img)]
         
         if self.filter_mode == "All":
             self.filtered_image_list = self.image_list.copy()
@@ -702,6 +927,11 @@ class ObjectDetectionLabeler:
                 img for img in self.image_list 
                 if img in self.annotations and self.annotations[img].bboxes
             ]
+        elif self.filter_mode == "Uncertain":
+            # Review queue: images with unreviewed predictions, the ones the model is least sure of first
+            self.filtered_image_list = rank_by_uncertainty(
+                self.annotations, self.image_list, method=self.uncertainty_method.get()
+            )
         
         self.current_image_index = min(max(self.current_image_index, 0), len(self.filtered_image_list) - 1) if self.filtered_image_list else 0
         self.load_image()
@@ -712,9 +942,12 @@ class ObjectDetectionLabeler:
         self.update_image_counter()
         self.update_label_counts()
         self.filter_indicator.config(text=f"Filter: {self.filter_mode} Images")
+        if self.thumbnail_grid:
+            self.thumbnail_grid.sync()
 
     def current_image_path(self):
         return self.filtered_image_list[self.current_image_index]
+    @timed("ui.display_image")
     def display_image(self):
         if not self.original_image:
             return
@@ -723,14 +956,24 @@ class ObjectDetectionLabeler:
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        width, height = self.original_image.size
+        width, height = self.image_size
 
         scale_factor = self.calculate_scale_factor(width, height, canvas_width, canvas_height)
         self.zoom_level = scale_factor
 
+        if self.decoded_scale < 1.0 and self.zoom_level > self.decoded_scale:
+            # Zoomed in past the reduced decode: decode again with enough resolution
+            try:
+                self.decode_image(self.decoded_path, self.zoom_level)
+            except OSError:
+                pass  # Keep upscaling the image already decoded
+
         new_size = (max(int(width * self.zoom_level), 1), max(int(height * self.zoom_level), 1))  # Ensure size >= 1
-        self.scaled_image = self.original_image.resize(new_size, Image.LANCZOS)
-        self.photo = ImageTk.PhotoImage(self.scaled_image)
+        # Drags redraw at an unchanged size: only resample when the image or size changed
+        if self.scaled_source is not self.original_image or self.scaled_image.size != new_size:
+            self.scaled_image = self.original_image.resize(new_size, Image.LANCZOS)
+            self.photo = ImageTk.PhotoImage(self.scaled_image)
+            self.scaled_source = self.original_image
 
         self.canvas.delete("all")
 
@@ -757,45 +1000,151 @@ class ObjectDetectionLabeler:
         else:
             return self.user_zoom_level
 
+    @timed("ui.draw_existing_bboxes")
     def draw_existing_bboxes(self):
-        self.canvas.delete("bbox")
-        self.canvas.delete("bbox_label_bg")
-        self.canvas.delete("bbox_label")
-        self.canvas.delete("resize_handle")
-        self.canvas.delete("internal_lines")
-        self.canvas.delete("move_handle")
-        self.canvas.delete("bbox_interior")
+        """
+        Draw the current image's boxes with level of detail.
+
+        Boxes outside the viewport are culled and labels are drawn only on boxes
+        large enough to read them. Above `raster_threshold` visible boxes, outlines
+        are rendered into one image instead of one canvas item per box. Edit
+        widgets (handles, guides) are drawn only for the hovered or dragged box.
+        """
+        self.canvas.delete("bbox", "bbox_label_bg", "bbox_label", "bbox_raster", "edit_widget")
         self.bbox_items = []
-        image_path = self.current_image_path()
-        if image_path in self.annotations:
-            for i, bbox in enumerate(self.annotations[image_path].bboxes):
-                self.draw_bbox(bbox, i)
-
-    def draw_bbox(self, bbox, index):
-        x = bbox.x * self.zoom_level + self.image_x
-        y = bbox.y * self.zoom_level + self.image_y
-        w = bbox.w * self.zoom_level
-        h = bbox.h * self.zoom_level
-        color = self.get_color_for_label(bbox.category_id)
-        
+        self.screen_boxes = None
+        self.culled = False
+        annotation = self.annotations.get(self.current_image_path())
+        if not annotation or not annotation.bboxes:
+            return
+
+        boxes, labels = annotation.to_arrays()
+        offset = np.array([self.image_x, self.image_y, self.image_x, self.image_y])
+        screen = xywh_to_xyxy(boxes) * self.zoom_level + offset
+        self.screen_boxes = screen
+
+        left, top, right, bottom = self.drawn_viewport = self.viewport()
+        visible = np.flatnonzero(
+            (screen[:, 2] >= left) & (screen[:, 0] <= right) & (screen[:, 3] >= top) & (screen[:, 1] <= bottom)
+        )
+        self.culled = len(visible) < len(labels)
+        colors = {i: self.get_color_for_label(labels[i]) for i in visible.tolist()}
+
+        sizes = screen[visible, 2:] - screen[visible, :2]
+        labeled = visible[(sizes >= LABEL_MIN_BOX_SIZE).all(axis=1)].tolist()
+        if len(visible) > self.raster_threshold.get():
+            # Labels go on the raster layer too, so the canvas item count stays bounded
+            self.draw_bbox_raster(
+                screen[visible], [colors[i] for i in visible.tolist()],
+                [(screen[i, 0], screen[i, 1], labels[i], colors[i]) for i in labeled]
+            )
+        else:
+            for i in visible.tolist():
+                self.draw_bbox(*screen[i].tolist(), colors[i], i)
+            for i in labeled:
+                self.draw_bbox_label(screen[i, 0], screen[i, 1], labels[i], colors[i], i)
+
+        self.draw_edit_widgets()
+
+    def viewport(self):
+        """Visible canvas region as (left, top, right, bottom) in canvas coordinates."""
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        return left, top, left + self.canvas.winfo_width(), top + self.canvas.winfo_height()
+
+    def on_canvas_scrolled(self):
+        if self.culled and self.viewport() != self.drawn_viewport:
+            self.frame_scheduler.schedule("viewport", lambda e: self.draw_existing_bboxes(), None)
+
+    def draw_bbox(self, x1, y1, x2, y2, color, index):
         # Determine outline width based on mode
         outline_width = 4 if self.edit_mode else 2
         
         # Draw bounding box
         bbox_item = self.canvas.create_rectangle(
-            x, y, x + w, y + h, 
+            x1, y1, x2, y2, 
             outline=color, width=outline_width, tags=("bbox", f"bbox_{index}")
         )
-        
         self.bbox_items.append(bbox_item)
-        self.draw_bbox_label(x, y, bbox.category_id, color, index)
-        # Draw other elements
-        if self.edit_mode:
-            self.draw_internal_lines(x, y, w, h, index)  # You may remove this if not needed
-            self.draw_bbox_label(x, y, bbox.category_id, color, index)
-            self.draw_resize_handles(x, y, w, h, index)
-            self.draw_interior_overlay(x, y, w, h, index)
-            self.bind_edge_cursors(x, y, w, h, index)
+
+    def draw_bbox_raster(self, screen_boxes, colors, box_labels=()):
+        """
+        Render many box outlines and their labels into a transparent layer laid over the displayed image.
+
+        `box_labels` holds the (x, y, label, color) of the labels to draw, as for `draw_bbox_label`.
+
+        The layer covers only the viewport and is redrawn on its own: the image
+        photo is left alone, and the layer and its PhotoImage are reused as long
+        as the viewport keeps its size.
+        """
+        left, top, right, bottom = self.drawn_viewport
+        size = (max(int(right - left), 1), max(int(bottom - top), 1))
+        if self.overlay_layer is None or self.overlay_layer.size != size:
+            self.overlay_layer = Image.new("RGBA", size, (0, 0, 0, 0))
+            self.overlay_photo = ImageTk.PhotoImage(self.overlay_layer)
+        else:
+            self.overlay_layer.paste((0, 0, 0, 0), (0, 0) + size)
+
+        draw = ImageDraw.Draw(self.overlay_layer)
+        outline_width = 4 if self.edit_mode else 2
+        corners = (screen_boxes - [left, top, left, top]).tolist()
+        for (x1, y1, x2, y2), color in zip(corners, colors):
+            draw.rectangle((x1, y1, max(x1, x2), max(y1, y2)), outline=color, width=outline_width)
+
+        if box_labels and self.raster_label_font is None:
+            try:
+                self.raster_label_font = ImageFont.truetype("arialbd.ttf", 16)
+            except OSError:
+                self.raster_label_font = ImageFont.load_default(16)
+        for x, y, label, color in box_labels:
+            # Same layout as draw_bbox_label: a 20 px tall tag above the box's top-left corner
+            x, y = x - left, y - top
+            text_left, text_top, text_right, text_bottom = draw.textbbox((0, 0), label, font=self.raster_label_font)
+            draw.rectangle((x, y - 20, x + 15 + text_right - text_left, y), fill=color)
+            draw.text((x + 5 - text_left, y - 10 - (text_top + text_bottom) / 2), label,
+                      fill='white', font=self.raster_label_font)
+        self.overlay_photo.paste(self.overlay_layer)
+        self.canvas.create_image(left, top, anchor=tk.NW, image=self.overlay_photo, tags=("bbox_raster",))
+
+    def active_bbox_index(self):
+        """Box that gets edit widgets: the one being moved or resized, else the hovered one."""
+        if self.moving and self.move_bbox_index is not None:
+            return self.move_bbox_index
+        if (self.moving or self.resizing) and self.selected_bbox_index is not None:
+            return self.selected_bbox_index
+        return self.hover_bbox_index
+
+    def bbox_at(self, x, y, margin=0):
+        """Index of the smallest box containing canvas point (x, y), or None."""
+        if self.screen_boxes is None:
+            return None
+        b = self.screen_boxes
+        inside = np.flatnonzero(
+            (b[:, 0] - margin <= x) & (x <= b[:, 2] + margin) & (b[:, 1] - margin <= y) & (y <= b[:, 3] + margin)
+        )
+        if not len(inside):
+            return None
+        areas = (b[inside, 2] - b[inside, 0]) * (b[inside, 3] - b[inside, 1])
+        return int(inside[np.argmin(areas)])
+
+    def update_hover(self, event):
+        if not self.edit_mode or self.moving or self.resizing:
+            return
+        index = self.bbox_at(self.canvas.canvasx(event.x), self.canvas.canvasy(event.y), margin=HANDLE_SIZE)
+        if index != self.hover_bbox_index:
+            self.hover_bbox_index = index
+            self.draw_edit_widgets()
+
+    def draw_edit_widgets(self):
+        self.canvas.delete("edit_widget")
+        index = self.active_bbox_index()
+        if not self.edit_mode or index is None or self.screen_boxes is None or index >= len(self.screen_boxes):
+            return
+        x1, y1, x2, y2 = self.screen_boxes[index].tolist()
+        x, y, w, h = x1, y1, x2 - x1, y2 - y1
+        self.draw_internal_lines(x, y, w, h, index)
+        self.draw_resize_handles(x, y, w, h, index)
+        self.draw_interior_overlay(x, y, w, h, index)
+        self.bind_edge_cursors(x, y, w, h, index)
 
     def draw_internal_lines(
         self, x, y, w, h, index,
@@ -816,7 +1165,7 @@ class ObjectDetectionLabeler:
                 end_y = start_y  # Đảm bảo đường kẻ nằm ngang
                 self.canvas.create_line(
                     start_x, start_y, end_x, end_y,
-                    fill='gray', dash=(2, 1), tags=("horizontal_lines", f"horizontal_lines_{index}")
+                    fill='gray', dash=(2, 1), tags=("edit_widget", "horizontal_lines", f"horizontal_lines_{index}")
                 )
         
         # Vẽ các đường dọc nội bộ
@@ -831,7 +1180,7 @@ class ObjectDetectionLabeler:
                 end_y = y + h  # Kết thúc ở dưới
                 self.canvas.create_line(
                     start_x, start_y, end_x, end_y,
-                    fill='gray', dash=(2, 1), tags=("vertical_lines", f"vertical_lines_{index}")
+                    fill='gray', dash=(2, 1), tags=("edit_widget", "vertical_lines", f"vertical_lines_{index}")
                 )
         
         # Vẽ các đường chéo
@@ -839,25 +1188,26 @@ class ObjectDetectionLabeler:
             # Đường chéo từ góc trên bên trái đến góc dưới bên phải
             self.canvas.create_line(
                 x, y, x + w, y + h,
-                fill='gray', dash=(2, 1), tags=("diagonal_lines", f"diagonal_lines_{index}")
+                fill='gray', dash=(2, 1), tags=("edit_widget", "diagonal_lines", f"diagonal_lines_{index}")
             )
             # Đường chéo từ góc trên bên phải đến góc dưới bên trái
             self.canvas.create_line(
                 x + w, y, x, y + h,
-                fill='gray', dash=(2, 1), tags=("diagonal_lines", f"diagonal_lines_{index}")
+                fill='gray', dash=(2, 1), tags=("edit_widget", "diagonal_lines", f"diagonal_lines_{index}")
             )
         
         # Vẽ oval với bounding box tương ứng
         if draw_oval:
             self.canvas.create_oval(
                 x, y, x + w, y + h,
-                outline='gray', width=2, tags=("oval", f"oval_{index}")
+                outline='gray', width=2, tags=("edit_widget", "oval", f"oval_{index}")
             )
 
 
     def draw_bbox_label(self, x, y, label, color, index):
-        fnt = font.Font(family='Arial', size=12, weight='bold')
-        text_width = fnt.measure(label)
+        if self.label_font is None:
+            self.label_font = font.Font(family='Arial', size=12, weight='bold')
+        text_width = self.label_font.measure(label)
         padding = 10  # Padding in pixels
         
         # Label background
@@ -871,13 +1221,13 @@ class ObjectDetectionLabeler:
             x + 5, y - 10,
             text=label,
             fill='white',
-            font=('Arial', 12, 'bold'),
+            font=self.label_font,
             anchor='w',
             tags=("bbox_label", f"bbox_label_{index}")
         )
 
     def draw_resize_handles(self, x, y, w, h, index):
-        handle_size = 6
+        handle_size = HANDLE_SIZE
         corners = [
             (x, y, 'tl'),  # top-left
             (x + w, y, 'tr'),  # top-right
@@ -889,7 +1239,7 @@ class ObjectDetectionLabeler:
                 cx - handle_size, cy - handle_size,
                 cx + handle_size, cy + handle_size,
                 fill='white', outline='black', 
-                tags=("resize_handle", f"resize_handle_{index}_{corner}")
+                tags=("edit_widget", "resize_handle", f"resize_handle_{index}_{corner}")
             )
             # Bind cursor changes to handles
             self.canvas.tag_bind(handle, "<Enter>", lambda e, c=corner: self.change_cursor_on_handle(c))
@@ -899,20 +1249,22 @@ class ObjectDetectionLabeler:
         """Draw an invisible rectangle over the interior for detecting hover and clicks."""
         interior = self.canvas.create_rectangle(
             x + 5, y + 5, x + w - 5, y + h - 5,
-            outline='', fill='', tags=("bbox_interior", f"bbox_interior_{index}")
+            outline='', fill='', tags=("edit_widget", "bbox_interior", f"bbox_interior_{index}")
         )
         # Bind cursor changes and movement to interior
         self.canvas.tag_bind(interior, "<Enter>", lambda e: self.canvas.config(cursor="fleur"))
         self.canvas.tag_bind(interior, "<Leave>", lambda e: self.reset_cursor())
         self.canvas.tag_bind(interior, "<ButtonPress-1>", lambda e, idx=index: self.initiate_move_bbox(idx))
-        self.canvas.tag_bind(interior, "<B1-Motion>", lambda e: self.perform_move(e))
+        self.canvas.tag_bind(
+            interior, "<B1-Motion>", lambda e: self.frame_scheduler.schedule("move", self.perform_move, e)
+        )
         self.canvas.tag_bind(interior, "<ButtonRelease-1>", lambda e: self.finish_move())
 
     def initiate_move_bbox(self, index):
         self.moving = True
         self.move_bbox_index = index
         bbox = self.annotations[self.current_image_path()].bboxes[index]
-        self.original_bbox = BoundingBox(bbox.x, bbox.y, bbox.w, bbox.h, bbox.category_id)
+        self.original_bbox = bbox.copy()
         # Record the starting position
         self.move_start_x = None
         self.move_start_y = None
@@ -927,15 +1279,16 @@ class ObjectDetectionLabeler:
         dx = current_x - self.move_start_x
         dy = current_y - self.move_start_y
         bbox = self.annotations[self.current_image_path()].bboxes[self.move_bbox_index]
-        new_x = max(0, min(self.original_bbox.x + dx / self.zoom_level, self.original_image.width - bbox.w))
-        new_y = max(0, min(self.original_bbox.y + dy / self.zoom_level, self.original_image.height - bbox.h))
+        new_x = max(0, min(self.original_bbox.x + dx / self.zoom_level, self.image_size[0] - bbox.w))
+        new_y = max(0, min(self.original_bbox.y + dy / self.zoom_level, self.image_size[1] - bbox.h))
         bbox.x = new_x
         bbox.y = new_y
         self.display_image()
 
     def finish_move(self):
+        self.frame_scheduler.flush()
         if self.moving and self.move_bbox_index is not None:
-            self.history.append((
+            self.push_history((
                 'move_bbox', 
                 self.current_image_path(), 
                 self.move_bbox_index, 
@@ -978,7 +1331,7 @@ class ObjectDetectionLabeler:
         for edge, coords in edges.items():
             edge_item = self.canvas.create_rectangle(
                 *coords,
-                outline='', fill='', tags=(f"edge_{edge}_bbox_{index}",)
+                outline='', fill='', tags=("edit_widget", f"edge_{edge}_bbox_{index}")
             )
             # Bind cursor changes
             if edge in ['left', 'right']:
@@ -989,6 +1342,34 @@ class ObjectDetectionLabeler:
                 self.canvas.tag_bind(edge_item, "<Leave>", lambda e: self.reset_cursor())
 
     # ==================== Control Callbacks ==================== #
+    def on_perf_readout_toggle(self):
+        instrumentation.enabled = self.show_perf_readout.get()
+        if instrumentation.enabled:
+            self.perf_label.pack(anchor='center', pady=2)
+            self.update_perf_readout()
+        else:
+            self.perf_label.pack_forget()
+
+    def update_perf_readout(self):
+        """Refresh the performance readout twice a second while instrumentation is enabled."""
+        if not instrumentation.enabled:
+            return
+        text = instrumentation.summary(PERF_READOUT_TIMERS) or "No timings recorded yet"
+        self.perf_label.config(text=f"last/mean: {text} | {self.frame_scheduler.stats()}")
+        self.master.after(500, self.update_perf_readout)
+
+    def dump_timings(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json")]
+        )
+        if file_path:
+            try:
+                instrumentation.dump(file_path)
+                messagebox.showinfo("Success", f"Timings saved to {file_path}.")
+            except OSError as e:
+                messagebox.showerror("Error", f"Cannot save timings:\n{e}")
+
     def on_auto_resize_toggle(self):
         self.display_image()
 
@@ -999,6 +1380,7 @@ class ObjectDetectionLabeler:
 
     def toggle_edit_mode(self):
         self.edit_mode = not self.edit_mode
+        self.hover_bbox_index = None
         self.display_image()  # Refresh to show/hide resize handles
 
     def zoom(self, factor):
@@ -1021,7 +1403,7 @@ class ObjectDetectionLabeler:
         if new_label:
             old_label = bbox.category_id
             bbox.category_id = new_label
-            self.history.append((
+            self.push_history((
                 'edit_label', 
                 self.current_image_path(), 
                 bbox_index, 
@@ -1045,7 +1427,7 @@ class ObjectDetectionLabeler:
             color = self.get_color_for_label(new_label)
             self.canvas.itemconfig(self.current_bbox, outline=color)
             
-            self.history.append(('add', image_path, new_bbox))
+            self.push_history(('add', image_path, new_bbox))
             self.update_label_counts()
             self.apply_filter()
             
@@ -1055,6 +1437,19 @@ class ObjectDetectionLabeler:
             if self.current_bbox:
                 self.canvas.delete(self.current_bbox)
         self.current_bbox = None
+
+    def push_history(self, action):
+        self.history.append(action)
+        if action[0] in ('resize_bbox', 'move_bbox', 'edit_label'):
+            # An edited prediction counts as reviewed; undo restores the original box with its confidence
+            annotation = self.annotations.get(action[1])
+            if annotation is not None and 0 <= action[2] < len(annotation.bboxes):
+                annotation.bboxes[action[2]].confidence = None
+        if self.auto_predict_thread is not None:
+            self.auto_predict_edited.add(action[1])  # Auto predict must not overwrite this image
+        if self.propagation_thread is not None:
+            self.propagation_edited.add(action[1])
+
     def undo(self):
         if not self.history:
             messagebox.showinfo("Info", "No actions to undo.")
@@ -1078,6 +1473,13 @@ class ObjectDetectionLabeler:
             elif action_type == 'delete_bbox':
                 _, image_path, bboxes_to_restore = action
                 self.annotations[image_path].bboxes.extend(bboxes_to_restore)  # Khôi phục lại bbox
+            elif action_type == 'propagate':
+                _, image_path, previous = action
+                for path, annotation in previous.items():
+                    if annotation is None:
+                        self.annotations.pop(path, None)
+                    else:
+                        self.annotations[path] = annotation
             elif action_type == 'delete_image':
                 _, image_path, index, annotation = action
                 self.image_list.insert(index, image_path)
@@ -1099,7 +1501,7 @@ class ObjectDetectionLabeler:
             self.annotations[image_path].bboxes.clear()
             
             # Ghi lại hành động vào lịch sử
-            self.history.append(('delete_bbox', image_path, bboxes_to_delete))
+            self.push_history(('delete_bbox', image_path, bboxes_to_delete))
             
             # Cập nhật hiển thị
             self.display_image()
@@ -1111,7 +1513,7 @@ class ObjectDetectionLabeler:
         image_path = self.current_image_path()
         if image_path in self.annotations and 0 <= index < len(self.annotations[image_path].bboxes):
             deleted_bbox = self.annotations[image_path].bboxes.pop(index)
-            self.history.append(('delete_bbox', image_path, index, deleted_bbox))
+            self.push_history(('delete_bbox', image_path, index, deleted_bbox))
             self.display_image()
             self.update_label_counts()
             self.apply_filter()
@@ -1119,11 +1521,14 @@ class ObjectDetectionLabeler:
             messagebox.showinfo("Info", "Bounding box not found at the specified index.")
     def delete_image(self):
         image_path = self.current_image_path()
+        if sources.is_archive_key(image_path):
+            messagebox.showinfo("Info", "Images inside an archive or a video cannot be deleted.")
+            return
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {os.path.basename(image_path)}?"):
             try:
                 os.remove(image_path)
                 annotation = self.annotations.pop(image_path, None)
-                self.history.append(('delete_image', image_path, self.current_image_index, annotation))
+                self.push_history(('delete_image', image_path, self.current_image_index, annotation))
                 self.image_list.remove(image_path)
                 self.filtered_image_list.remove(image_path)
                 self.apply_filter()
@@ -1151,6 +1556,17 @@ class ObjectDetectionLabeler:
         else:
             messagebox.showinfo("Info", "This is the first image.")
 
+    def go_to_image(self, index):
+        if 0 <= index < len(self.filtered_image_list):
+            self.current_image_index = index
+            self.load_image()
+
+    def open_thumbnail_grid(self):
+        if self.thumbnail_grid:
+            self.thumbnail_grid.lift()
+            return
+        self.thumbnail_grid = ThumbnailGrid(self)
+
     # ==================== Label Handling ==================== #
     def count_labels(self):
         label_counts = {}
@@ -1200,8 +1616,61 @@ class ObjectDetectionLabeler:
             self.apply_filter()
             messagebox.showinfo("Success", "Annotations loaded successfully.")
 
+    def import_labels(self, format_):
+        """Load one-label-file-per-image datasets (YOLO txt or Pascal VOC xml)."""
+        if not self.image_list:
+            messagebox.showinfo("Info", "Open the image directory before importing labels.")
+            return
+        if self.label_import_thread is not None:
+            messagebox.showinfo("Info", "A label import is already running.")
+            return
+
+        label_dir = filedialog.askdirectory(title=f"Select {format_.upper()} label directory")
+        if not label_dir:
+            return
+
+        # Parsed on a worker thread (large imports in worker processes) so the window stays responsive
+        self.label_import_result = None
+        self.label_import_thread = threading.Thread(
+            target=self.process_label_import,
+            args=(get_importer(format_), label_dir, list(self.image_list)),
+            daemon=True
+        )
+        self.label_import_thread.start()
+        self.master.after(BACKGROUND_POLL_MS, self.finish_label_import, self.source_generation)
+
+    def process_label_import(self, importer, label_dir, image_paths):
+        """Worker: parse the label files. Never touches UI state."""
+        try:
+            self.label_import_result = importer.import_annotations(label_dir, image_paths)
+        except Exception as e:
+            self.label_import_result = e
+
+    def finish_label_import(self, generation):
+        """Replace the annotations with the imported ones on the UI thread once the worker is done."""
+        if self.label_import_thread.is_alive():
+            self.master.after(BACKGROUND_POLL_MS, self.finish_label_import, generation)
+            return
+
+        annotations = self.label_import_result
+        self.label_import_thread = None
+        self.label_import_result = None
+        if isinstance(annotations, Exception):
+            messagebox.showerror("Error", f"Cannot import labels:\n{annotations}")
+            return
+        if self.source_generation != generation:
+            return  # Another directory, archive or video was opened meanwhile
+
+        self.annotations.replace(annotations)
+        for label in {bbox.category_id for ann in annotations.values() for bbox in ann.bboxes}:
+            self.get_color_for_label(label)
+        self.display_image()
+        self.update_label_counts()
+        self.apply_filter()
+        messagebox.showinfo("Success", f"Imported labels for {len(annotations)} images.")
+
     def parse_coco_annotations(self, data):
-        self.annotations = {}
+        annotations = {}
         image_map = {img['id']: img['file_name'] for img in data.get('images', [])}
         category_names = {cat['id']: cat['name'] for cat in data.get('categories', [])}
         
@@ -1210,16 +1679,17 @@ class ObjectDetectionLabeler:
             file_name = image_map.get(image_id)
             if not file_name:
                 continue
-            full_path = next((img for img in self.image_list if os.path.basename(img) == file_name), None)
+            full_path = next((img for img in self.image_list if sources.basename(img) == file_name), None)
             if not full_path:
                 continue
             
             x, y, w, h = ann['bbox']
             x, y, w, h = max(0, x), max(0, y), max(1, w), max(1, h)
             category_name = category_names.get(ann['category_id'], "unknown")
-            bbox = BoundingBox(x, y, w, h, category_name)
-            self.annotations.setdefault(full_path, ImageAnnotation(full_path)).add_bbox(bbox)
+            bbox = BoundingBox(x, y, w, h, category_name, ann.get('score'), ann.get('track_id'))
+            annotations.setdefault(full_path, ImageAnnotation(full_path)).add_bbox(bbox)
             self.get_color_for_label(category_name)
+        self.annotations.replace(annotations)
 
     def save_annotations_auto(self):
         """
@@ -1239,7 +1709,7 @@ class ObjectDetectionLabeler:
         filename = f"auto_save_{timestamp}.json"
 
         # Determine the save directory (same as the first image's directory)
-        save_dir = os.path.dirname(self.image_list[0])
+        save_dir = sources.storage_dir(self.image_list[0])
         file_path = os.path.join(save_dir, filename)
 
         # Get the COCO exporter
@@ -1256,22 +1726,56 @@ class ObjectDetectionLabeler:
             messagebox.showinfo("Info", "No annotations to export.")
             return
 
+        if self.validate_before_export.get() and not self.validate_dataset(before_export=True):
+            return
+
         exporter = get_exporter(format_)
         
         try:
             if format_ == "tfrecord":
                 self.export_tfrecord(exporter)
-            elif format_ in ["yolov8", "pascal_voc", "dataset_coco"]:
+            elif format_ in ["yolov8", "pascal_voc", "dataset_coco", "webdataset"]:
                 self.export_to_directory(exporter, format_)
             elif format_ == "coco":
                 self.export_to_coco(exporter)
             elif format_ == "excel":
                 self.export_to_excel(exporter)
+            elif format_ == "binary":
+                self.export_to_binary(exporter)
             else:
                 messagebox.showerror("Error", "Unsupported export format.")
         except Exception as e:
             messagebox.showerror("Error", f"Cannot export annotations:\n{e}")
 
+    def validate_dataset(self, before_export=False):
+        """Check all boxes and offer to fix them. Returns False if the user cancelled the export."""
+        try:
+            report = validate_annotations(self.annotations)
+        except Exception as e:
+            messagebox.showerror("Error", f"Cannot validate annotations:\n{e}")
+            return True
+        if report.ok:
+            if not before_export:
+                messagebox.showinfo("Validation", report.summary())
+            return True
+
+        question = "Clip out-of-bounds boxes and remove invalid and duplicate ones?"
+        if before_export:
+            answer = messagebox.askyesnocancel(
+                "Validation", f"{report.summary()}\n\n{question}\n(No exports the annotations unchanged.)"
+            )
+            if answer is None:
+                return False
+        else:
+            answer = messagebox.askyesno("Validation", f"{report.summary()}\n\n{question}")
+
+        if answer:
+            fix_annotations(self.annotations)
+            self.history.clear()  # Box indices recorded for undo are no longer valid
+            self.display_image()
+            self.update_ui()
+        return True
+
     def export_tfrecord(self, exporter):
         file_path = filedialog.asksaveasfilename(
             defaultextension=".tfrecord", 
@@ -1305,6 +1809,15 @@ class ObjectDetectionLabeler:
         if file_path:
             exporter.export(self.annotations, file_path)
             messagebox.showinfo("Success", f"Exported to Excel format at {file_path}.")
+
+    def export_to_binary(self, exporter):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".bxl",
+            filetypes=[("BoxLabeler binary annotations", "*.bxl")]
+        )
+        if file_path:
+            exporter.export(self.annotations, file_path)
+            messagebox.showinfo("Success", f"Exported to binary format at {file_path}.")
     from BoxLabeler.exporters import get_exporter
     
     def export_to_directory(self, exporter, format_):
@@ -1314,11 +1827,60 @@ class ObjectDetectionLabeler:
             messagebox.showinfo("Success", f"Exported to {format_.upper()} format at {output_dir}.")
             
     def import_yolov8_model(self):
-        if self.yolov8_model.import_model():
-            messagebox.showinfo("Success", "YOLO model imported successfully.")
-            self.current_model = self.yolov8_model
-        else:
-            messagebox.showerror("Error", "Failed to import YOLO model.")
+        """Load a model in the background; the current model stays usable until the new one is ready."""
+        model_path = filedialog.askopenfilename(filetypes=[("YOLO model", "*.pt"), ("ONNX model", "*.onnx")])
+        if not model_path:
+            return
+
+        self.model_load_token += 1
+        token = self.model_load_token
+        warmup_runs = self.warmup_runs.get()
+        warmup_size = self.image_size
+        sliced = self.sliced_inference.get()
+
+        self.model_status_label.config(text=f"Loading {os.path.basename(model_path)}...")
+        self.model_status_frame.pack(pady=5)
+        self.model_progress.start(10)
+
+        def load():
+            try:
+                model = YoloV8ImportModel()
+                model.load_model(model_path)
+                model.set_slicing(sliced)
+                if warmup_runs:
+                    self.master.after(0, lambda: self.model_status_label.config(text="Warming up model..."))
+                    model.warmup(image_size=None if sliced else warmup_size, runs=warmup_runs)
+            except Exception as e:
+                self.master.after(0, self.on_model_load_failed, token, e)
+            else:
+                self.master.after(0, self.on_model_loaded, token, model)
+
+        threading.Thread(target=load, daemon=True).start()
+
+    def on_model_loaded(self, token, model):
+        if token != self.model_load_token:
+            return  # A newer model load superseded this one
+        self.hide_model_status()
+        model.set_slicing(self.sliced_inference.get())
+        self.yolov8_model = model
+        self.current_model = model
+        self.predict_button.config(state='normal')
+        if self.auto_predict_thread is None:
+            self.auto_predict_button.config(state='normal')
+        messagebox.showinfo("Success", "YOLO model imported successfully.")
+
+    def on_model_load_failed(self, token, error):
+        if token != self.model_load_token:
+            return
+        self.hide_model_status()
+        messagebox.showerror("Error", f"Failed to import YOLO model:\n{error}")
+
+    def hide_model_status(self):
+        self.model_progress.stop()
+        self.model_status_frame.pack_forget()
+
+    def on_sliced_inference_toggle(self):
+        self.yolov8_model.set_slicing(self.sliced_inference.get())
 
     def predict(self):
         if not self.original_image:
@@ -1330,30 +1892,114 @@ class ObjectDetectionLabeler:
             return
 
         image_path = self.current_image_path()
-        image = cv2.imread(image_path)
-        if image is None:
-            messagebox.showerror("Error", f"Cannot read image: {image_path}")
-            return
-        image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
         try:
-            predictions = self.current_model.predict(image_rgb)
+            detections = self.current_model.predict_file(image_path)
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             return
 
-        # Clear existing bounding boxes
-        self.annotations[image_path] = ImageAnnotation(image_path)
+        existing = self.annotations.get(image_path)
+        if self.merge_predictions.get() and existing is not None:
+            # Keep the existing boxes and add only the predictions none of them covers
+            merge_predictions(existing, detections.to_bboxes(), MERGE_IOU_THRESHOLD)
+        else:
+            # Replace existing bounding boxes with the predicted ones
+            annotation = ImageAnnotation(image_path)
+            annotation.add_bboxes(detections.to_bboxes())
+            self.annotations[image_path] = annotation
+
+        self.display_image()
+        self.update_label_counts()
+        self.apply_filter()
+
+    def propagate_labels(self):
+        """Carry the current image's boxes forward over the next images, tracking them with the model if loaded."""
+        if not self.filtered_image_list:
+            return
+        if self.propagation_thread is not None:
+            messagebox.showinfo("Info", "Label propagation is already running.")
+            return
+        image_path = self.current_image_path()
+        annotation = self.annotations.get(image_path)
+        if annotation is None or not annotation.bboxes:
+            messagebox.showinfo("Info", "Label the current image first: its boxes are the ones propagated.")
+            return
+
+        # Frames follow each other in the full image list, whatever the filter shows
+        start = self.image_list.index(image_path)
+        window = self.propagation_window.get()
+        image_paths = self.image_list[start:start + 1 + window]
+        previous = {path: self.annotations.get(path) for path in image_paths}
+
+        predict = None
+        if self.current_model:
+            model = self.current_model
+            predict = lambda path: model.predict_file(path, conf_threshold=PROPAGATION_CONF_THRESHOLD)
+
+        # The worker propagates over copies, so labeling goes on and undo restores the untouched originals
+        self.propagation_result = None
+        self.propagation_edited = set()
+        self.propagation_thread = threading.Thread(
+            target=self.process_propagation,
+            args=(self.annotations.snapshot(image_paths), image_paths, window, predict,
+                  next_track_id(self.annotations)),
+            daemon=True
+        )
+        self.propagation_thread.start()
+        self.master.after(BACKGROUND_POLL_MS, self.finish_propagation, image_path, previous, self.source_generation)
+
+    def process_propagation(self, working, image_paths, window, predict, first_track_id):
+        """Worker: propagate over copies of the annotations. Never touches UI state."""
+        try:
+            report = propagate_forward(working, image_paths, 0, window=window, predict=predict,
+                                       first_track_id=first_track_id)
+            self.propagation_result = (working, report)
+        except Exception as e:
+            self.propagation_result = e
+
+    def finish_propagation(self, image_path, previous, generation):
+        """Apply the propagated annotations on the UI thread once the worker is done."""
+        if self.propagation_thread.is_alive():
+            self.master.after(BACKGROUND_POLL_MS, self.finish_propagation, image_path, previous, generation)
+            return
 
-        # Add predicted bounding boxes
-        for pred in predictions:
-            bbox = BoundingBox(*pred['bbox'], pred['class'])
-            self.annotations[image_path].add_bbox(bbox)
+        result = self.propagation_result
+        edited = self.propagation_edited
+        self.propagation_thread = None
+        self.propagation_result = None
+        self.propagation_edited = set()
 
+        if isinstance(result, Exception):
+            messagebox.showerror("Error", f"An error occurred during label propagation:\n{result}")
+            return
+        if self.source_generation != generation:
+            return  # Another directory, archive or video was opened meanwhile
+
+        working, report = result
+        replaced = {}
+        kept = 0
+        for path, annotation in working.items():
+            if path in edited or self.annotations.get(path) is not previous[path]:
+                # Changed by the operator (or auto predict) during the run: their boxes win
+                kept += path in report.images
+                continue
+            replaced[path] = previous[path]
+            self.annotations[path] = annotation
+
+        if replaced:
+            self.push_history(('propagate', image_path, replaced))
+            if self.auto_predict_thread is not None:
+                self.auto_predict_edited.update(replaced)
         self.display_image()
         self.update_label_counts()
         self.apply_filter()
 
+        summary = report.summary()
+        if kept:
+            summary += f" {kept} image(s) changed meanwhile were kept as they are."
+        messagebox.showinfo("Propagate Labels", summary)
+
     # ==================== Auto Predict ==================== #
     def auto_predict(self):
         if not self.image_list:
@@ -1364,13 +2010,89 @@ class ObjectDetectionLabeler:
             messagebox.showwarning("Warning", "Please import a model first.")
             return
 
-        # Create a new window for progress
+        self.show_auto_predict_scope_dialog()
+
+    def show_auto_predict_scope_dialog(self):
+        """Let the user choose which images to predict."""
+        dialog = tk.Toplevel(self.master)
+        dialog.title("Auto Predict")
+        dialog.grab_set()
+
+        scope = tk.StringVar(value="all")
+        tk.Label(dialog, text="Predict on:").pack(anchor='w', padx=10, pady=(10, 0))
+        for text, value in AUTO_PREDICT_SCOPES:
+            tk.Radiobutton(dialog, text=text, variable=scope, value=value).pack(anchor='w', padx=20)
+
+        list_frame = tk.Frame(dialog)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        listbox = tk.Listbox(list_frame, selectmode=tk.EXTENDED, height=12, width=50)
+        scrollbar = tk.Scrollbar(list_frame, orient=tk.VERTICAL, command=listbox.yview)
+        listbox.configure(yscrollcommand=scrollbar.set)
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for image_path in self.image_list:
+            listbox.insert(tk.END, sources.basename(image_path))
+        # Selecting images switches the scope to the custom selection
+        listbox.bind("<<ListboxSelect>>", lambda e: scope.set("selection"))
+
+        def start():
+            selection = [self.image_list[i] for i in listbox.curselection()]
+            targets = self.auto_predict_targets(scope.get(), selection)
+            dialog.destroy()
+            self.start_auto_predict(targets)
+
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=10)
+        tk.Button(button_frame, text="Start", command=start).pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Cancel", command=dialog.destroy).pack(side=tk.LEFT, padx=5)
+
+    def auto_predict_targets(self, scope, selection=()):
+        if scope == "unlabeled":
+            return [
+                img for img in self.image_list
+                if img not in self.annotations or not self.annotations[img].bboxes
+            ]
+        elif scope == "filter":
+            return list(self.filtered_image_list)
+        elif scope == "selection":
+            return list(selection)
+        return list(self.image_list)
+
+    def start_auto_predict(self, image_paths):
+        if not image_paths:
+            messagebox.showinfo("Info", "No images to predict in the selected scope.")
+            return
+
+        model = self.current_model
+        checkpoint = PredictionCheckpoint.for_directory(
+            sources.storage_dir(self.image_list[0]), model.model_key or model.model_path
+        )
+        done = checkpoint.load()
+        if done is None:
+            # Missing, unreadable or written by another model
+            checkpoint.remove()
+        else:
+            resumable = [img for img in image_paths if img in done]
+            if resumable:
+                if messagebox.askyesno(
+                    "Resume Auto Predict",
+                    f"A previous auto prediction already processed {len(resumable)} of "
+                    f"{len(image_paths)} images. Resume where it stopped?"
+                ):
+                    for img in resumable:
+                        self.annotations[img] = done[img]
+                    image_paths = [img for img in image_paths if img not in done]
+                else:
+                    checkpoint.remove()
+
+        # Non-modal progress window: labeling continues while the model works
         self.progress_window = tk.Toplevel(self.master)
         self.progress_window.title("Auto Predict")
-        self.progress_window.geometry("400x100")
-        self.progress_window.grab_set()  # Make the progress window modal
+        self.progress_window.geometry("400x120")
+        self.progress_window.protocol("WM_DELETE_WINDOW", self.cancel_auto_predict)
 
-        tk.Label(self.progress_window, text="Auto Predict in progress...").pack(pady=10)
+        self.progress_label = tk.Label(self.progress_window, text="Auto Predict in progress...")
+        self.progress_label.pack(pady=10)
 
         self.progress_bar = ttk.Progressbar(self.progress_window, orient="horizontal", length=300, mode="determinate")
         self.progress_bar.pack(pady=5)
@@ -1379,71 +2101,148 @@ class ObjectDetectionLabeler:
         self.cancel_button.pack(pady=5)
 
         # Initialize progress variables
-        self.progress_bar['maximum'] = len(self.image_list)
+        self.progress_bar['maximum'] = max(len(image_paths), 1)
         self.auto_predict_cancel_flag = False
+        self.auto_predict_images = self.image_list
+        self.auto_predict_generation = self.source_generation
+        self.auto_predict_edited = set()
+        self.auto_predict_merge = self.merge_predictions.get()
+        self.auto_predict_done = 0
+        self.auto_predict_skipped = 0
+        self.auto_predict_error = None
+        self.auto_predict_checkpoint = checkpoint
+        self.auto_predict_button.config(state='disabled')
 
         # Start the auto_predict in a separate thread
-        self.auto_predict_thread = threading.Thread(target=self.process_auto_predict)
+        self.auto_predict_thread = threading.Thread(
+            target=self.process_auto_predict, args=(image_paths, model), daemon=True
+        )
         self.auto_predict_thread.start()
+        self.master.after(AUTO_PREDICT_DRAIN_MS, self.drain_auto_predict)
 
-    def process_auto_predict(self):
-        """Worker function to process auto prediction."""
+    def process_auto_predict(self, image_paths, model):
+        """Worker: predict every image and post the results to the annotation store. Never touches UI state."""
         try:
-            for idx, image_path in enumerate(self.image_list):
+            for image_path in image_paths:
                 if self.auto_predict_cancel_flag:
                     break
 
-                # Read and predict
-                image = cv2.imread(image_path)
-                if image is None:
-                    continue
-                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-
+                # Predict, reusing cached raw outputs and only decoding the image on a miss
                 try:
-                    predictions = self.current_model.predict(image_rgb)
+                    detections = model.predict_file(image_path)
                 except ValueError:
-                    continue
-
-                # Clear existing bounding boxes
-                self.annotations[image_path] = ImageAnnotation(image_path)
-
-                # Add predicted bounding boxes
-                for pred in predictions:
-                    bbox = BoundingBox(*pred['bbox'], pred['class'])
-                    self.annotations[image_path].add_bbox(bbox)
-
-                # Update progress bar
-                self.master.after(0, self.update_progress, idx + 1)
-
-            # After processing, export annotations
-            if not self.auto_predict_cancel_flag:
-                timestamp = datetime.datetime.now().strftime("%H_%M_%d_%m_%Y")
-                filename = f"auto_label_{timestamp}.json"
-                exporter = get_exporter("coco")
-                file_path = os.path.join(os.path.dirname(self.image_list[0]), filename)
-                exporter.export(self.annotations, file_path)
-                self.master.after(0, lambda: messagebox.showinfo("Success", f"Auto prediction completed and saved to {file_path}"))
-            else:
-                self.master.after(0, lambda: messagebox.showinfo("Cancelled", "Auto prediction was cancelled."))
-
+                    pass
+                else:
+                    annotation = ImageAnnotation(image_path)
+                    annotation.add_bboxes(detections.to_bboxes())
+                    self.annotations.post(image_path, annotation)
+                self.auto_predict_done += 1
         except Exception as e:
-            self.master.after(0, lambda: messagebox.showerror("Error", f"An error occurred during auto prediction:\n{e}"))
-        finally:
-            self.master.after(0, self.finish_auto_predict)
+            self.auto_predict_error = e
+
+    def drain_auto_predict(self):
+        """Apply queued predictions on the UI thread, leaving the images the operator is working on alone."""
+        finished = not self.auto_predict_thread.is_alive()  # Checked first so no result posted after it is missed
+        if self.source_generation != self.auto_predict_generation:
+            # Another directory or archive was opened: the results belong to the previous one
+            self.auto_predict_cancel_flag = True
+            self.annotations.drain()
+        else:
+            self.apply_auto_predict_results(self.annotations.drain())
 
-    def update_progress(self, value):
-        self.progress_bar['value'] = value
+        self.progress_bar['value'] = self.auto_predict_done
+        text = f"Auto Predict in progress... {self.auto_predict_done} / {int(self.progress_bar['maximum'])}"
+        if self.auto_predict_skipped:
+            text += f" ({self.auto_predict_skipped} kept as edited)"
+        self.progress_label.config(text=text)
+
+        if finished:
+            self.finish_auto_predict()
+        else:
+            self.master.after(AUTO_PREDICT_DRAIN_MS, self.drain_auto_predict)
+
+    def apply_auto_predict_results(self, updates):
+        current_path = self.current_image_path() if self.filtered_image_list else None
+        checkpoint = self.auto_predict_checkpoint
+        redraw = False
+        for image_path, annotation in updates:
+            existing = self.annotations.get(image_path)
+            if self.auto_predict_merge and existing is not None:
+                # Safe even on the image being edited: existing boxes keep their place and indices
+                added = merge_predictions(existing, annotation.bboxes, MERGE_IOU_THRESHOLD)
+                checkpoint.record(image_path, existing.bboxes)
+                redraw = redraw or (added and image_path == current_path)
+                continue
+            edited = image_path in self.auto_predict_edited
+            if edited or (image_path == current_path and existing is not None and existing.bboxes):
+                # The operator's boxes win over the model's; record them so a resume does not redo the image
+                self.auto_predict_skipped += 1
+                checkpoint.record(image_path, existing.bboxes if existing is not None else [])
+                continue
+            self.annotations[image_path] = annotation
+            checkpoint.record(image_path, annotation.bboxes)
+            redraw = redraw or image_path == current_path
+        if redraw:
+            self.display_image()
 
     def cancel_auto_predict(self):
         self.auto_predict_cancel_flag = True
         self.cancel_button.config(state='disabled')
 
     def finish_auto_predict(self):
+        checkpoint = self.auto_predict_checkpoint
+        image_dir = sources.storage_dir(self.auto_predict_images[0])
+        skipped = self.auto_predict_skipped
+        error = self.auto_predict_error
+
         self.progress_window.destroy()
+        self.auto_predict_thread = None
+        self.auto_predict_images = None
+        self.auto_predict_generation = None
+        self.auto_predict_checkpoint = None
+        self.auto_predict_edited = set()
+        if self.current_model:
+            self.auto_predict_button.config(state='normal')
         self.display_image()
         self.update_label_counts()
         self.apply_filter()
 
+        if error is not None or self.auto_predict_cancel_flag:
+            try:
+                checkpoint.flush()
+            except OSError:
+                pass
+            if error is not None:
+                messagebox.showerror("Error", f"An error occurred during auto prediction:\n{error}")
+            elif checkpoint.error is not None:
+                messagebox.showinfo(
+                    "Cancelled", f"Auto prediction was cancelled. Progress could not be saved:\n{checkpoint.error}"
+                )
+            else:
+                messagebox.showinfo(
+                    "Cancelled", "Auto prediction was cancelled. Progress was saved and can be resumed."
+                )
+            return
+
+        # Export a copy in the background so editing can go on meanwhile
+        annotations = self.annotations.snapshot()
+        timestamp = datetime.datetime.now().strftime("%H_%M_%d_%m_%Y")
+        file_path = os.path.join(image_dir, f"auto_label_{timestamp}.json")
+        message = f"Auto prediction completed and saved to {file_path}"
+        if skipped:
+            message += f"\n{skipped} image(s) you edited during the run kept your boxes."
+
+        def export():
+            try:
+                get_exporter("coco").export(annotations, file_path)
+                checkpoint.remove()
+            except Exception as e:
+                self.master.after(0, lambda e=e: messagebox.showerror("Error", f"Cannot save auto prediction:\n{e}"))
+            else:
+                self.master.after(0, lambda: messagebox.showinfo("Success", message))
+
+        threading.Thread(target=export, daemon=True).start()
+
     # ==================== Annotation Handling Continued ==================== #
     # (No changes needed here since labels are now dynamically updated)
 
@@ -0,0 +1,82 @@
+"""
+Vectorized bounding-box conversions shared by the exporters, importers and models.
+
+Every function takes an (N, 4) array (or anything convertible to one) and
+returns a new array, so whole images or whole datasets are converted at once.
+Image sizes may be scalars or (N,) arrays holding the size of each box's image.
+
+Layouts:
+    xywh:   [x_min, y_min, width, height] (BoundingBox, COCO)
+    xyxy:   [x_min, y_min, x_max, y_max] (Pascal VOC, TFRecord, model outputs)
+    cxcywh: [x_center, y_center, width, height] (YOLO)
+"""
+
+import numpy as np
+
+
+def as_boxes(boxes):
+    """(N, 4) view of `boxes`; floating dtypes are kept, anything else becomes float64."""
+    boxes = np.asarray(boxes)
+    if not np.issubdtype(boxes.dtype, np.floating):
+        boxes = boxes.astype(np.float64)
+    return boxes.reshape(-1, 4)
+
+
+def _scale(width, height):
+    """[w, h, w, h] per box (or once, for scalar sizes) to scale the x and y columns."""
+    width, height = np.broadcast_arrays(np.asarray(width, dtype=np.float64), np.asarray(height, dtype=np.float64))
+    return np.stack((width, height, width, height), axis=-1)
+
+
+def xywh_to_xyxy(boxes):
+    out = as_boxes(boxes).copy()
+    out[:, 2:] += out[:, :2]
+    return out
+
+
+def xyxy_to_xywh(boxes):
+    out = as_boxes(boxes).copy()
+    out[:, 2:] -= out[:, :2]
+    return out
+
+
+def xywh_to_cxcywh(boxes):
+    out = as_boxes(boxes).copy()
+    out[:, :2] += out[:, 2:] / 2
+    return out
+
+
+def cxcywh_to_xywh(boxes):
+    out = as_boxes(boxes).copy()
+    out[:, :2] -= out[:, 2:] / 2
+    return out
+
+
+def normalize(boxes, width, height):
+    """Divide the x columns by the image width and the y columns by the image height."""
+    return as_boxes(boxes) / _scale(width, height)
+
+
+def denormalize(boxes, width, height):
+    return as_boxes(boxes) * _scale(width, height)
+
+
+def clip_xyxy(boxes, width, height):
+    """Clip [x1, y1, x2, y2] boxes to the image."""
+    return np.clip(as_boxes(boxes), 0, _scale(width, height))
+
+
+def round_pixels(boxes):
+    """Round to integer pixel coordinates, halves rounding up, as int64."""
+    return np.floor(as_boxes(boxes) + 0.5).astype(np.int64)
+
+
+def to_yolo(boxes, width, height):
+    """[x, y, w, h] pixel boxes -> YOLO normalized [x_center, y_center, w, h], clipped to the image."""
+    xyxy = clip_xyxy(xywh_to_xyxy(boxes), width, height)
+    return xywh_to_cxcywh(normalize(xyxy_to_xywh(xyxy), width, height))
+
+
+def from_yolo(rows, width, height):
+    """YOLO normalized [x_center, y_center, w, h] -> [x, y, w, h] pixel boxes."""
+    return cxcywh_to_xywh(denormalize(rows, width, height))
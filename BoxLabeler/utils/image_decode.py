@@ -0,0 +1,31 @@
+import math
+
+from PIL import Image
+
+from BoxLabeler.sources import is_video_key, open_file, read_frame
+
+
+def decode_image(image_path, scale=1.0):
+    """
+    Decode an image as RGB at no less than `scale` times its original size.
+
+    JPEGs are decoded in draft mode, where libjpeg downscales by 1/2, 1/4 or 1/8
+    during the DCT, picking the strongest reduction that still covers the
+    requested size. Video frames are decoded at full size and then reduced by
+    an integer factor. Other formats are decoded at full size.
+
+    Returns:
+        Tuple[PIL.Image.Image, Tuple[int, int]]: Decoded image and original (width, height).
+    """
+    if is_video_key(image_path):
+        img = Image.fromarray(read_frame(image_path))
+        original_size = img.size
+        factor = int(1 / scale) if scale > 0 else 1
+        return (img.reduce(factor) if factor > 1 else img), original_size
+
+    with open_file(image_path) as f, Image.open(f) as img:
+        original_size = img.size
+        if scale < 1.0:
+            width, height = original_size
+            img.draft("RGB", (max(1, math.ceil(width * scale)), max(1, math.ceil(height * scale))))
+        return img.convert("RGB"), original_size
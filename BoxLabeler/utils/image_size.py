@@ -0,0 +1,72 @@
+import functools
+import os
+import struct
+
+from PIL import Image
+
+from BoxLabeler.sources import frame_size, is_video_key, open_file, stat_key
+
+
+def _png_size(f):
+    header = f.read(24)
+    if len(header) == 24 and header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    return None
+
+
+def _jpeg_size(f):
+    if f.read(2) != b'\xff\xd8':
+        return None
+    while True:
+        byte = f.read(1)
+        while byte and byte != b'\xff':
+            byte = f.read(1)
+        while byte == b'\xff':
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            continue  # Markers without a length field
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack('>H', length_bytes)[0]
+        # SOF markers (except DHT, JPG and DAC) carry the frame size
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack('>HH', data[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_size(image_path, mtime_ns):
+    with open_file(image_path) as f:
+        size = _png_size(f)
+        if size is None:
+            f.seek(0)
+            size = _jpeg_size(f)
+        if size is None:
+            # Other formats (or unusual JPEGs): Pillow still only parses the header here
+            f.seek(0)
+            with Image.open(f) as img:
+                size = img.size
+    return tuple(size)
+
+
+def get_image_size(image_path):
+    """
+    Return (width, height) of an image by reading only its header.
+
+    Works with archive member and video frame keys as well as paths. Results
+    are cached per key and modification time.
+
+    Raises:
+        OSError: If the file cannot be read or is not a supported image.
+    """
+    if is_video_key(image_path):
+        return frame_size(image_path)
+    return _cached_size(image_path, stat_key(image_path)[1])
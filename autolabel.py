@@ -0,0 +1,189 @@
+"""
+Headless batch auto-labeling.
+
+Runs a YOLOv8 model over every image of a directory (or of a zip/tar archive
+or the frames of a video, read in place) using a pool of worker processes and
+writes the predictions with one of the BoxLabeler exporters, without importing Tk.
+
+Example:
+    python autolabel.py images/ yolov8n.pt --format yolov8 --output labels/ --workers 4
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import time
+
+EXPORT_FORMATS = ["coco", "dataset_coco", "tfrecord", "yolov8", "pascal_voc", "excel", "webdataset", "binary"]
+
+_worker_model = None
+_worker_options = None
+
+
+def init_worker(model_path, device, threads_per_worker, use_cache, options, slice_options):
+    """Load the model once per worker process with a bounded number of torch or ONNX Runtime threads."""
+    global _worker_model, _worker_options
+
+    # Must be set before torch is imported so the OpenMP pool is sized accordingly
+    os.environ["OMP_NUM_THREADS"] = str(threads_per_worker)
+    os.environ["MKL_NUM_THREADS"] = str(threads_per_worker)
+
+    from BoxLabeler.models.yolov8_import import YoloV8ImportModel, is_onnx_model
+
+    if not is_onnx_model(model_path):  # ONNX-only installs have no torch
+        import torch
+        torch.set_num_threads(threads_per_worker)
+    _worker_model = YoloV8ImportModel(use_cache=use_cache)
+    _worker_model.load_model(model_path, device=device, num_threads=threads_per_worker)
+    if slice_options:
+        _worker_model.set_slicing(**slice_options)
+    _worker_options = options
+
+
+def predict_shard(image_paths):
+    """Predict every image of a shard. Returns (image_path, detections) pairs and the busy time."""
+    start = time.perf_counter()
+    results = []
+    for image_path in image_paths:
+        try:
+            detections = _worker_model.predict_file(image_path, **_worker_options)
+        except ValueError as e:
+            print(f"Warning: {e}")
+            continue
+        results.append((image_path, detections))
+    return results, time.perf_counter() - start
+
+
+def list_images(path, video_stride=1):
+    from BoxLabeler.sources import open_source
+
+    return open_source(path, video_stride=video_stride).list_images()
+
+
+def shard(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def export_annotations(annotations, format_, output):
+    from BoxLabeler.exporters import get_exporter
+
+    exporter = get_exporter(format_)
+    if format_ == "tfrecord":
+        exporter.export(annotations, output, os.path.splitext(output)[0] + ".pbtxt")
+    else:
+        exporter.export(annotations, output)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Auto-label a directory of images with a YOLOv8 model.")
+    parser.add_argument("image_dir", help="Directory, zip/tar archive or video file containing the images to label.")
+    parser.add_argument("model", help="Path to the YOLOv8 .pt weights or an exported .onnx model.")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="coco", help="Export format.")
+    parser.add_argument("--output", help="Output file or directory (default: inside image_dir).")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) // 2),
+                        help="Number of worker processes.")
+    parser.add_argument("--threads-per-worker", type=int, default=1, help="Torch or ONNX Runtime threads per worker.")
+    parser.add_argument("--shard-size", type=int, default=16, help="Images sent to a worker at once.")
+    parser.add_argument("--device", default=None, help="Torch device, e.g. cpu or cuda:0.")
+    parser.add_argument("--conf", type=float, default=0.5, help="Confidence threshold.")
+    parser.add_argument("--iou", type=float, default=0.5, help="NMS IoU threshold.")
+    parser.add_argument("--agnostic", action="store_true", help="Class-agnostic NMS.")
+    parser.add_argument("--tile-size", type=int, default=0,
+                        help="Run sliced inference with tiles of this size (0 disables slicing).")
+    parser.add_argument("--tile-overlap", type=float, default=0.2, help="Overlap between tiles (fraction).")
+    parser.add_argument("--tile-batch", type=int, default=8, help="Tiles sent to the model at once.")
+    parser.add_argument("--merge", choices=["nms", "wbf"], default="nms", help="How tile detections are merged.")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the prediction cache.")
+    parser.add_argument("--video-stride", type=int, default=1, help="Label every n-th frame of videos.")
+    parser.add_argument("--validate", action="store_true",
+                        help="Clip out-of-bounds boxes and drop degenerate and duplicate boxes before exporting.")
+    return parser.parse_args(argv)
+
+
+def default_output(image_dir, format_):
+    if os.path.isfile(image_dir):  # Archive: write next to it
+        image_dir = os.path.dirname(os.path.abspath(image_dir))
+    if format_ == "coco":
+        return os.path.join(image_dir, "auto_label.json")
+    if format_ == "tfrecord":
+        return os.path.join(image_dir, "auto_label.tfrecord")
+    if format_ == "excel":
+        return os.path.join(image_dir, "auto_label.xlsx")
+    if format_ == "binary":
+        return os.path.join(image_dir, "auto_label.bxl")
+    return os.path.join(image_dir, f"auto_label_{format_}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    from BoxLabeler.annotations.image_annotation import ImageAnnotation
+
+    image_paths = list_images(args.image_dir, args.video_stride)
+    if not image_paths:
+        print(f"No images found in {args.image_dir}")
+        return 1
+
+    output = args.output or default_output(args.image_dir, args.format)
+    options = {"conf_threshold": args.conf, "iou_threshold": args.iou, "agnostic": args.agnostic}
+    slice_options = None
+    if args.tile_size:
+        slice_options = {
+            "tile_size": args.tile_size,
+            "overlap": args.tile_overlap,
+            "batch_size": args.tile_batch,
+            "merge": args.merge,
+        }
+    shards = shard(image_paths, args.shard_size)
+    workers = max(1, min(args.workers, len(shards)))
+
+    print(f"Labeling {len(image_paths)} images with {workers} worker(s) x {args.threads_per_worker} thread(s)")
+
+    annotations = {}
+    num_boxes = 0
+    busy_time = 0.0
+    start = time.perf_counter()
+
+    ctx = mp.get_context("spawn")  # Fork is unsafe once torch has started its thread pools
+    with ctx.Pool(
+        workers,
+        initializer=init_worker,
+        initargs=(args.model, args.device, args.threads_per_worker, not args.no_cache, options, slice_options),
+    ) as pool:
+        done = 0
+        for results, shard_time in pool.imap_unordered(predict_shard, shards):
+            busy_time += shard_time
+            for image_path, detections in results:
+                annotation = ImageAnnotation(image_path)
+                annotation.add_bboxes(detections.to_bboxes())
+                annotations[image_path] = annotation
+                num_boxes += len(detections)
+            done += len(results)
+            elapsed = time.perf_counter() - start
+            print(f"\r{done}/{len(image_paths)} images, {done / elapsed:.1f} img/s", end="", flush=True)
+    print()
+
+    inference_time = time.perf_counter() - start  # Includes model loading in the workers
+    if args.validate:
+        from BoxLabeler.annotations.validation import fix_annotations
+
+        report = fix_annotations(annotations)
+        print(report.summary())
+
+    export_start = time.perf_counter()
+    export_annotations(annotations, args.format, output)
+    export_time = time.perf_counter() - export_start
+    total_time = time.perf_counter() - start
+
+    labeled = len(annotations)
+    print(f"Images labeled : {labeled}/{len(image_paths)}")
+    print(f"Boxes          : {num_boxes} ({num_boxes / max(labeled, 1):.1f} per image)")
+    print(f"Inference      : {inference_time:.2f} s, {labeled / max(inference_time, 1e-9):.1f} img/s")
+    print(f"Worker latency : {1000 * busy_time / max(labeled, 1):.1f} ms/img")
+    print(f"Export         : {export_time:.2f} s ({args.format} -> {output})")
+    print(f"Total          : {total_time:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
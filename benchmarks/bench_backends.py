@@ -0,0 +1,91 @@
+"""
+Compare latency and throughput of the inference backends of YoloV8ImportModel.
+
+Example:
+    python benchmarks/bench_backends.py yolov8n.pt yolov8n.onnx --images samples/ --runs 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BoxLabeler.models.yolov8_import import YoloV8ImportModel  # noqa: E402
+
+
+def load_images(image_dir, count, size):
+    if image_dir:
+        import cv2
+
+        paths = sorted(
+            os.path.join(image_dir, f) for f in os.listdir(image_dir)
+            if f.lower().endswith(('.png', '.jpg', '.jpeg'))
+        )[:count]
+        return [cv2.cvtColor(cv2.imread(p), cv2.COLOR_BGR2RGB) for p in paths]
+
+    rng = np.random.default_rng(0)
+    width, height = size
+    return [rng.integers(0, 256, (height, width, 3), dtype=np.uint8) for _ in range(count)]
+
+
+def bench_model(model_path, images, runs, warmup, device=None):
+    model = YoloV8ImportModel(use_cache=False)
+    start = time.perf_counter()
+    model.load_model(model_path, device=device)
+    load_time = time.perf_counter() - start
+
+    for image in images[:warmup]:
+        model.predict_arrays(image)
+
+    latencies = []
+    num_boxes = 0
+    start = time.perf_counter()
+    for i in range(runs):
+        image = images[i % len(images)]
+        t0 = time.perf_counter()
+        detections = model.predict_arrays(image)
+        latencies.append(time.perf_counter() - t0)
+        num_boxes += len(detections)
+    total = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        "model": os.path.basename(model_path),
+        "load_s": load_time,
+        "mean_ms": float(latencies.mean()),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "throughput_img_s": runs / total,
+        "boxes_per_img": num_boxes / runs,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="+", help=".pt and/or .onnx models to compare.")
+    parser.add_argument("--images", help="Directory of sample images (default: random images).")
+    parser.add_argument("--size", type=int, nargs=2, default=(1280, 720), metavar=("W", "H"),
+                        help="Size of the random images.")
+    parser.add_argument("--count", type=int, default=16, help="Number of distinct images.")
+    parser.add_argument("--runs", type=int, default=50, help="Timed predictions per model.")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed predictions per model.")
+    parser.add_argument("--device", default="cpu", help="Torch device for .pt models.")
+    args = parser.parse_args(argv)
+
+    images = load_images(args.images, args.count, args.size)
+    rows = [bench_model(m, images, args.runs, args.warmup, device=args.device) for m in args.models]
+
+    header = f"{'model':<24}{'load s':>9}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'img/s':>9}{'boxes':>8}"
+    print(header)
+    print("-" * len(header))
+    for r in rows:
+        print(f"{r['model']:<24}{r['load_s']:>9.2f}{r['mean_ms']:>10.1f}{r['p50_ms']:>10.1f}"
+              f"{r['p95_ms']:>10.1f}{r['throughput_img_s']:>9.1f}{r['boxes_per_img']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
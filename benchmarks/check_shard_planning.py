@@ -0,0 +1,88 @@
+"""
+WebDataset shard planning check.
+
+Plans shards for a small synthetic dataset of image files and, when OpenCV is
+installed, of video frames, and fails if the shards do not fill up to the
+size budget: too many shards (e.g. one sample each) or shards over budget.
+
+Example:
+    python benchmarks/check_shard_planning.py
+"""
+
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from BoxLabeler import sources
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+from BoxLabeler.exporters.webdataset_exporter import WebDatasetExporter, _tar_member_bytes, TAR_BLOCK
+
+SHARD_BYTES = 2 * 1024 * 1024
+
+
+def make_images(directory, count=60, size=(320, 240)):
+    from PIL import Image
+
+    rng = np.random.default_rng(0)
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"image_{i:03d}.jpg")
+        Image.fromarray(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8)).save(path, quality=95)
+        paths.append(path)
+    return paths
+
+
+def make_video(directory, frames=120, size=(640, 480)):
+    try:
+        import cv2
+    except ImportError:
+        return None
+    path = os.path.join(directory, "clip.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 25, size)
+    rng = np.random.default_rng(0)
+    for _ in range(frames):
+        writer.write(rng.integers(0, 256, (size[1], size[0], 3), dtype=np.uint8))
+    writer.release()
+    return sources.open_source(path).list_images()
+
+
+def check(name, keys):
+    annotations = {}
+    for key in keys:
+        annotation = ImageAnnotation(key)
+        annotation.add_bboxes([BoundingBox(1, 1, 10, 10, "object")])
+        annotations[key] = annotation
+
+    exporter = WebDatasetExporter(max_shard_bytes=SHARD_BYTES)
+    shards = exporter.plan_shards(annotations)
+    label_bytes = 2 * _tar_member_bytes(TAR_BLOCK)
+    planned = [
+        sum(_tar_member_bytes(sources.stat_key(key)[0]) + label_bytes for _, key in shard) for shard in shards
+    ]
+    expected = -(-sum(planned) // SHARD_BYTES)
+    over = [size for shard, size in zip(shards, planned) if len(shard) > 1 and size > SHARD_BYTES]
+    failed = len(shards) > 2 * expected or bool(over)
+    print(f"[{'FAIL' if failed else 'ok'}] {name}: {len(keys)} samples in {len(shards)} shard(s), "
+          f"{expected} expected from the size budget")
+    return failed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        failed = check("images", make_images(directory))
+        frames = make_video(directory)
+        if frames is None:
+            print("[skip] video frames: OpenCV is not installed")
+        else:
+            failed = check("video frames", frames) or failed
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
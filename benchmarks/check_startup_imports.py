@@ -0,0 +1,66 @@
+"""
+Startup import regression check.
+
+Imports the UI module (and the headless CLI) in a fresh interpreter and fails
+if any heavy library got imported eagerly. Those libraries must only be loaded
+on first use (exporters through `get_exporter`, model runtimes through
+`load_backend`). Also reports how long the import took.
+
+Example:
+    python benchmarks/check_startup_imports.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = [
+    "tensorflow",
+    "pandas",
+    "torch",
+    "torchvision",
+    "ultralytics",
+    "onnxruntime",
+    "cv2",
+]
+
+ENTRY_MODULES = ["BoxLabeler.ui", "autolabel"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"modules": sorted(sys.modules), "seconds": elapsed}}))
+"""
+
+
+def probe(module):
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    failed = False
+    for module in ENTRY_MODULES:
+        report = probe(module)
+        loaded = set(report["modules"])
+        eager = [name for name in HEAVY_MODULES if name in loaded]
+        status = "FAIL" if eager else "ok"
+        print(f"[{status}] import {module}: {report['seconds'] * 1000:.0f} ms")
+        for name in eager:
+            print(f"       eagerly imported: {name}")
+        failed = failed or bool(eager)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,265 @@
+"""
+Benchmark suite for the annotation, import/export and inference hot paths.
+
+Generates a synthetic dataset (N images of W x H pixels with M boxes each over
+K classes), runs every case in a fresh process and records wall time, peak
+RSS and throughput as JSON so runs can be compared across commits.
+
+Example:
+    python benchmarks/run_benchmarks.py --images 500 --boxes 50 --output bench.json
+    python benchmarks/run_benchmarks.py --images 500 --boxes 50 --compare bench.json
+"""
+
+import argparse
+import concurrent.futures
+import datetime
+import json
+import multiprocessing as mp
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+EXPORT_FORMATS = ["coco", "dataset_coco", "yolov8", "pascal_voc", "excel", "tfrecord", "webdataset", "binary"]
+
+CASES = (
+    ["parse_coco_annotations", "count_labels", "apply_filter"]
+    + [f"export_{fmt}" for fmt in EXPORT_FORMATS]
+    + ["predict_postprocess", "predict_postprocess_nms"]
+)
+
+
+def peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:  # Windows
+        import psutil
+        return psutil.Process().memory_info().peak_wset
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+# ==================== Cases ==================== #
+# Each case returns (function to time, number of items it processes, item unit).
+
+def case_parse_coco_annotations(data, config, workdir):
+    from synthetic import HeadlessLabeler, to_coco
+
+    coco = to_coco(data["annotations"], data["paths"], config["width"], config["height"])
+    labeler = HeadlessLabeler(data["paths"], {})
+    return (lambda: labeler.parse_coco_annotations(coco)), len(coco["annotations"]), "boxes"
+
+
+def case_count_labels(data, config, workdir):
+    from synthetic import HeadlessLabeler
+
+    labeler = HeadlessLabeler(data["paths"], data["annotations"])
+    return labeler.count_labels, data["num_boxes"], "boxes"
+
+
+def case_apply_filter(data, config, workdir):
+    from synthetic import HeadlessLabeler
+
+    labeler = HeadlessLabeler(data["paths"], data["annotations"])
+
+    def run():
+        for mode in ("All", "Unlabeled", "Labeled"):
+            labeler.filter_mode = mode
+            labeler.apply_filter()
+
+    return run, 3 * len(data["paths"]), "images"
+
+
+def make_export_case(format_):
+    def case(data, config, workdir):
+        from BoxLabeler.exporters import get_exporter
+
+        exporter = get_exporter(format_)
+        out_dir = os.path.join(workdir, f"export_{format_}")
+
+        def run():
+            shutil.rmtree(out_dir, ignore_errors=True)
+            os.makedirs(out_dir)
+            if format_ == "tfrecord":
+                exporter.export(data["annotations"], os.path.join(out_dir, "out.tfrecord"),
+                                os.path.join(out_dir, "out.pbtxt"))
+            elif format_ == "coco":
+                exporter.export(data["annotations"], os.path.join(out_dir, "out.json"))
+            elif format_ == "excel":
+                exporter.export(data["annotations"], os.path.join(out_dir, "out.xlsx"))
+            elif format_ == "binary":
+                exporter.export(data["annotations"], os.path.join(out_dir, "out.bxl"))
+            else:
+                exporter.export(data["annotations"], out_dir)
+
+        return run, len(data["annotations"]), "images"
+    return case
+
+
+def make_predict_case(apply_nms):
+    def case(data, config, workdir):
+        import numpy as np
+        from synthetic import StubBackend
+        from BoxLabeler.models.yolov8_import import YoloV8ImportModel
+
+        model = YoloV8ImportModel(use_cache=False)
+        model.model = StubBackend(config["classes"], config["candidates"])
+        image = np.zeros((config["height"], config["width"], 3), dtype=np.uint8)
+        count = len(data["paths"])
+
+        def run():
+            for _ in range(count):
+                model.predict_arrays(image, conf_threshold=0.25, apply_nms=apply_nms)
+
+        return run, count, "images"
+    return case
+
+
+CASE_FUNCTIONS = {
+    "parse_coco_annotations": case_parse_coco_annotations,
+    "count_labels": case_count_labels,
+    "apply_filter": case_apply_filter,
+    "predict_postprocess": make_predict_case(apply_nms=False),
+    "predict_postprocess_nms": make_predict_case(apply_nms=True),
+    **{f"export_{fmt}": make_export_case(fmt) for fmt in EXPORT_FORMATS},
+}
+
+
+def run_case(name, config, data_dir):
+    """Run one case; executed in a fresh process so peak RSS is attributable to it."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from synthetic import make_annotations, make_images
+
+    paths = make_images(data_dir, config["images"], config["width"], config["height"], seed=config["seed"])
+    annotations = make_annotations(
+        paths, config["width"], config["height"], config["boxes"], config["classes"],
+        unlabeled_fraction=config["unlabeled_fraction"], seed=config["seed"],
+    )
+    data = {
+        "paths": paths,
+        "annotations": annotations,
+        "num_boxes": sum(len(a.bboxes) for a in annotations.values()),
+    }
+
+    workdir = tempfile.mkdtemp(prefix="boxlabeler_bench_")
+    try:
+        try:
+            func, items, unit = CASE_FUNCTIONS[name](data, config, workdir)
+        except ImportError as e:
+            return {"name": name, "skipped": f"missing dependency: {e.name}"}
+
+        rss_before = peak_rss_bytes()
+        timings = []
+        for _ in range(config["repeat"]):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        wall = min(timings)
+        return {
+            "name": name,
+            "wall_s": wall,
+            "wall_s_all": timings,
+            "items": items,
+            "unit": unit,
+            "throughput": items / wall if wall > 0 else None,
+            "peak_rss_mb": peak_rss_bytes() / 2 ** 20,
+            "rss_growth_mb": (peak_rss_bytes() - rss_before) / 2 ** 20,
+        }
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    previous = {r["name"]: r for r in (baseline or {}).get("results", []) if "wall_s" in r}
+    header = f"{'case':<28}{'wall ms':>10}{'throughput':>22}{'peak RSS MB':>13}"
+    if previous:
+        header += f"{'vs base':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        if "skipped" in r:
+            print(f"{r['name']:<28}  skipped ({r['skipped']})")
+            continue
+        line = (f"{r['name']:<28}{r['wall_s'] * 1000:>10.1f}"
+                f"{r['throughput']:>12.0f} {r['unit'] + '/s':<9}{r['peak_rss_mb']:>13.1f}")
+        if r["name"] in previous:
+            line += f"{r['wall_s'] / previous[r['name']]['wall_s']:>9.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--images", type=int, default=200, help="Number of images (N).")
+    parser.add_argument("--width", type=int, default=640, help="Image width.")
+    parser.add_argument("--height", type=int, default=480, help="Image height.")
+    parser.add_argument("--boxes", type=int, default=20, help="Boxes per image (M).")
+    parser.add_argument("--classes", type=int, default=10, help="Number of classes (K).")
+    parser.add_argument("--candidates", type=int, default=2000,
+                        help="Raw candidates per image returned by the stub model.")
+    parser.add_argument("--unlabeled-fraction", type=float, default=0.2, help="Fraction of images without boxes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case; the fastest is reported.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=CASES, help="Subset of cases to run.")
+    parser.add_argument("--data-dir", help="Where to generate the images (default: a temporary directory).")
+    parser.add_argument("--output", help="Write the results to this JSON file.")
+    parser.add_argument("--compare", help="Previous JSON results to compare against.")
+    args = parser.parse_args(argv)
+
+    config = {
+        "images": args.images, "width": args.width, "height": args.height, "boxes": args.boxes,
+        "classes": args.classes, "candidates": args.candidates,
+        "unlabeled_fraction": args.unlabeled_fraction, "repeat": args.repeat, "seed": args.seed,
+    }
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="boxlabeler_data_")
+
+    results = []
+    ctx = mp.get_context("spawn")
+    try:
+        for name in args.cases:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                results.append(pool.submit(run_case, name, config, data_dir).result())
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "results": results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=4)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Synthetic datasets and stand-ins used by the benchmark suite."""
+
+import os
+
+import numpy as np
+from PIL import Image
+
+from BoxLabeler.annotations.annotation_store import AnnotationStore
+from BoxLabeler.annotations.bounding_box import BoundingBox
+from BoxLabeler.annotations.image_annotation import ImageAnnotation
+from BoxLabeler.ui import ObjectDetectionLabeler
+
+
+def make_images(root, num_images, width, height, seed=0):
+    """Write `num_images` small-entropy JPEGs to `root`, reusing files that already exist."""
+    os.makedirs(root, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    paths = []
+    for i in range(num_images):
+        path = os.path.join(root, f"img_{i:06d}.jpg")
+        color = tuple(int(c) for c in rng.integers(0, 256, 3))
+        if not os.path.exists(path):
+            Image.new("RGB", (width, height), color).save(path, quality=90)
+        paths.append(os.path.abspath(path))
+    return paths
+
+
+def make_annotations(image_paths, width, height, boxes_per_image, num_classes, unlabeled_fraction=0.0, seed=0):
+    """Random boxes inside a width x height image for every labeled image."""
+    rng = np.random.default_rng(seed)
+    labels = np.array([f"class_{k}" for k in range(num_classes)], dtype=object)
+    annotations = {}
+    num_labeled = int(round(len(image_paths) * (1 - unlabeled_fraction)))
+    for image_path in image_paths[:num_labeled]:
+        wh = rng.uniform(4, [width / 4, height / 4], size=(boxes_per_image, 2))
+        xy = rng.uniform(0, 1, size=(boxes_per_image, 2)) * ([width, height] - wh)
+        classes = labels[rng.integers(0, num_classes, boxes_per_image)]
+        annotation = ImageAnnotation(image_path)
+        annotation.add_bboxes([
+            BoundingBox(x, y, w, h, label)
+            for (x, y), (w, h), label in zip(xy.tolist(), wh.tolist(), classes.tolist())
+        ])
+        annotations[image_path] = annotation
+    return annotations
+
+
+def to_coco(annotations, image_paths, width, height):
+    """Build the COCO dict that `parse_coco_annotations` consumes."""
+    categories = sorted({bbox.category_id for ann in annotations.values() for bbox in ann.bboxes})
+    category_ids = {name: i + 1 for i, name in enumerate(categories)}
+    images, coco_annotations = [], []
+    for image_id, image_path in enumerate(image_paths):
+        images.append({"id": image_id, "width": width, "height": height,
+                       "file_name": os.path.basename(image_path)})
+        annotation = annotations.get(image_path)
+        for bbox in annotation.bboxes if annotation else []:
+            coco_annotations.append({
+                "id": len(coco_annotations), "image_id": image_id,
+                "category_id": category_ids[bbox.category_id],
+                "bbox": [bbox.x, bbox.y, bbox.w, bbox.h], "area": bbox.w * bbox.h, "iscrowd": 0,
+            })
+    return {
+        "images": images,
+        "annotations": coco_annotations,
+        "categories": [{"id": i, "name": name} for name, i in category_ids.items()],
+    }
+
+
+class HeadlessLabeler(ObjectDetectionLabeler):
+    """ObjectDetectionLabeler state without a Tk window, for timing its data-handling methods."""
+
+    def __init__(self, image_paths, annotations):
+        self.label_colors = {}
+        self.filter_mode = "All"
+        self.image_list = list(image_paths)
+        self.filtered_image_list = list(image_paths)
+        self.current_image_index = 0
+        self.annotations = AnnotationStore(annotations)
+
+    def load_image(self):
+        pass
+
+    def update_ui(self):
+        pass
+
+    def refresh_label_list(self):
+        pass
+
+
+class StubBackend:
+    """Inference backend returning `candidates` random boxes per image at no model cost."""
+
+    def __init__(self, num_classes, candidates, seed=0):
+        self.names = {k: f"class_{k}" for k in range(num_classes)}
+        self.candidates = candidates
+        self.rng = np.random.default_rng(seed)
+
+    def infer(self, images, conf_threshold, iou_threshold, agnostic=False):
+        results = []
+        for image in images:
+            height, width = image.shape[:2]
+            xy = self.rng.uniform(0, 1, (self.candidates, 2)) * [width, height]
+            wh = self.rng.uniform(4, 64, (self.candidates, 2))
+            boxes = np.concatenate((xy, xy + wh), axis=1).astype(np.float32)
+            scores = self.rng.uniform(0, 1, self.candidates).astype(np.float32)
+            classes = self.rng.integers(0, len(self.names), self.candidates)
+            keep = scores >= conf_threshold
+            results.append((boxes[keep], scores[keep], classes[keep]))
+        return results